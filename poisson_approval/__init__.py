@@ -13,14 +13,18 @@ from poisson_approval.utils.ComputationEngineSymbolic import ComputationEngineSy
 from poisson_approval.utils.DictPrintingInOrder import DictPrintingInOrder
 from poisson_approval.utils.DictPrintingInOrderIgnoringNone import DictPrintingInOrderIgnoringNone
 from poisson_approval.utils.DictPrintingInOrderIgnoringZeros import DictPrintingInOrderIgnoringZeros
+from poisson_approval.utils.DictPrintingInOrderLazy import DictPrintingInOrderLazy
+from poisson_approval.utils.PhaseTimer import PhaseTimer
 from poisson_approval.utils.SetPrintingInOrder import SetPrintingInOrder
 from poisson_approval.utils.Util import initialize_random_seeds, rand_simplex, rand_integers_fixed_sum, \
     rand_simplex_grid, probability, image_distribution, isnan, isposinf, isneginf, give_figure, to_callable, \
     product_dict, candidates_to_d_candidate_probability, candidates_to_probabilities, array_to_d_candidate_value, \
     d_candidate_value_to_array, one_over_t, one_over_sqrt_t, one_over_log_t_plus_one, \
-    one_over_log_log_t_plus_fourteen, my_division, iterator_integers_fixed_sum, iterate_simplex_grid
+    one_over_log_log_t_plus_fourteen, my_division, iterator_integers_fixed_sum, iterate_simplex_grid, \
+    spawn_random_seeds, parallel_map, wilson_half_width
+from poisson_approval.utils.TrajectoryRecorder import TrajectoryRecorder
 from poisson_approval.utils.UtilBallots import ballot_one, ballot_two, ballot_one_two, ballot_one_three, \
-    ballot_high_u, ballot_low_u, allowed_ballots
+    ballot_high_u, ballot_low_u, allowed_ballots, matrix_ballot_low_u, matrix_ballot_high_u
 from poisson_approval.utils.UtilCache import cached_property, DeleteCacheMixin, property_deleting_cache
 from poisson_approval.utils.UtilMasks import masks_area_naive, masks_area, masks_distribution_naive, \
     masks_distribution, winners_distribution, random_mask, random_masks
@@ -39,6 +43,7 @@ from poisson_approval.containers.AnalyzedStrategies import AnalyzedStrategies
 
 # Events
 from poisson_approval.events.Asymptotic import Asymptotic
+from poisson_approval.events.AsymptoticFloat import AsymptoticFloat
 from poisson_approval.events.Event import Event
 from poisson_approval.events.EventDuo import EventDuo
 from poisson_approval.events.EventPivotStrict import EventPivotStrict
@@ -48,15 +53,19 @@ from poisson_approval.events.EventPivotWeak import EventPivotWeak
 from poisson_approval.events.EventTrio import EventTrio
 from poisson_approval.events.EventTrio1t import EventTrio1t
 from poisson_approval.events.EventTrio2t import EventTrio2t
+from poisson_approval.events.TrioWarmStart import TrioWarmStart
 
 # Best response
 from poisson_approval.best_response.BestResponse import BestResponse
 from poisson_approval.best_response.BestResponseAntiPlurality import BestResponseAntiPlurality
 from poisson_approval.best_response.BestResponseApproval import BestResponseApproval
 from poisson_approval.best_response.BestResponsePlurality import BestResponsePlurality
+from poisson_approval.best_response.best_responses_batch import JUSTIFICATIONS, best_responses_batch
 
 # Tau-vector
 from poisson_approval.tau_vector.TauVector import TauVector
+from poisson_approval.tau_vector.TauVectorBatch import TauVectorBatch
+from poisson_approval.tau_vector.TauVectorCache import TauVectorCache
 
 # Strategies
 from poisson_approval.strategies.Strategy import Strategy
@@ -106,6 +115,7 @@ from poisson_approval.random_factories.RandStrategyThresholdUniform import RandS
 from poisson_approval.random_factories.RandStrategyTwelveUniform import RandStrategyTwelveUniform
 from poisson_approval.random_factories.RandTauVectorGridUniform import RandTauVectorGridUniform
 from poisson_approval.random_factories.RandTauVectorUniform import RandTauVectorUniform
+from poisson_approval.random_factories.RandomBatch import RandomBatch
 
 # Meta-analysis
 from poisson_approval.meta_analysis.NiceStatsProfileOrdinal import NiceStatsProfileOrdinal
@@ -114,6 +124,7 @@ from poisson_approval.meta_analysis.binary_shortcuts import binary_plot_n_equili
     binary_plot_winners_at_equilibrium, binary_plot_winning_frequencies, binary_plot_convergence, \
     XyyToProfile
 from poisson_approval.meta_analysis.convergence_test import convergence_test
+from poisson_approval.meta_analysis.fictitious_play_batch import fictitious_play_batch
 from poisson_approval.meta_analysis.is_condorcet import is_condorcet
 from poisson_approval.meta_analysis.is_not_condorcet import is_not_condorcet
 from poisson_approval.meta_analysis.monte_carlo_fictitious_play import \
@@ -121,6 +132,11 @@ from poisson_approval.meta_analysis.monte_carlo_fictitious_play import \
     MCS_BALLOT_STATISTICS, MCS_CONVERGES, MCS_FOCUS, MCS_IS_ORDINAL_EQ, MCS_DECREASING_SCORES, \
     MCS_FREQUENCY_CW_WINS, MCS_PROFILE, MCS_TAU_INIT, MCS_WELFARE_LOSSES, \
     MCS_UTILITY_THRESHOLDS, MCS_CANDIDATE_WINNING_FREQUENCY, MCS_N_EPISODES
+from poisson_approval.meta_analysis.MonteCarloSink import MonteCarloSink
+from poisson_approval.meta_analysis.OnlineCounter import OnlineCounter
+from poisson_approval.meta_analysis.OnlineHistogram import OnlineHistogram
+from poisson_approval.meta_analysis.OnlineMean import OnlineMean
+from poisson_approval.meta_analysis.multi_start_fictitious_play import multi_start_fictitious_play
 from poisson_approval.meta_analysis.plot_welfare_losses import plot_welfare_losses
 from poisson_approval.meta_analysis.plot_distribution_scores import plot_distribution_scores
 from poisson_approval.meta_analysis.plot_utility_thresholds import plot_utility_thresholds
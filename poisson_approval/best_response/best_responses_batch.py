@@ -0,0 +1,494 @@
+import numpy as np
+from math import factorial, pi
+from poisson_approval.best_response.BestResponseAntiPlurality import BestResponseAntiPlurality
+from poisson_approval.best_response.BestResponseApproval import BestResponseApproval
+from poisson_approval.best_response.BestResponsePlurality import BestResponsePlurality
+from poisson_approval.constants.basic_constants import *
+from poisson_approval.tau_vector.TauVectorBatch import TauVectorBatch
+from poisson_approval.events.EventTrio import EventTrio
+
+
+#: Possible justifications of the best responses. The justification code returned by :func:`best_responses_batch`
+#: is the index in this tuple.
+JUSTIFICATIONS = (
+    BestResponseApproval.ASYMPTOTIC,
+    BestResponseApproval.ASYMPTOTIC_SIMPLIFIED,
+    BestResponseApproval.EASY_VS_DIFFICULT,
+    BestResponseApproval.DIFFICULT_VS_EASY,
+    BestResponseApproval.OFFSET_METHOD,
+    BestResponseApproval.OFFSET_METHOD_WITH_TRIO_APPROXIMATION_CORRECTION,
+    BestResponsePlurality.PLURALITY_ANALYSIS,
+    BestResponseAntiPlurality.ANTI_PLURALITY_ANALYSIS,
+)
+
+_CODE = {justification: code for code, justification in enumerate(JUSTIFICATIONS)}
+
+
+def best_responses_batch(taus, voting_rule=APPROVAL):
+    """Best responses of all the rankings, for a batch of tau-vectors.
+
+    Parameters
+    ----------
+    taus : TauVectorBatch or array_like
+        The tau-vectors. If it is not a :class:`TauVectorBatch`, it must be an array of shape ``(n, 6)``, the columns
+        being the ballots of :attr:`~poisson_approval.BALLOTS_WITHOUT_INVERSIONS`.
+    voting_rule : str
+        The voting rule (only used if `taus` is not a :class:`TauVectorBatch`).
+
+    Returns
+    -------
+    utility_thresholds : numpy.ndarray
+        Array of shape ``(n, 6)``. Row ``i``, column ``r``: the utility threshold of the best response of the
+        ranking ``RANKINGS[r]`` to the tau-vector ``i`` (cf. :attr:`BestResponse.utility_threshold`).
+    justifications : numpy.ndarray
+        Array of integers of shape ``(n, 6)``. Each value is an index in :data:`JUSTIFICATIONS`, telling how the
+        utility threshold was computed (cf. :attr:`BestResponse.justification`).
+
+    Notes
+    -----
+    The results are the same as with the attribute :attr:`TauVector.d_ranking_best_response` of each tau-vector, but
+    all the tau-vectors and all the rankings are processed at once with `numpy` operations:
+
+    * In Plurality and Anti-plurality, the best responses are given by comparisons of the shares.
+    * In Approval, if the tau-vector has two consecutive zeros in its "compass diagram", we use the asymptotic
+      method: for each kind of diagram, the asymptotic developments of the personalized pivots and trios are
+      products and sums of Poisson asymptotics, which are computed on arrays (with the same operations as in
+      :class:`Asymptotic`).
+    * Otherwise, we use the limit pivot theorem: easy and difficult pivots, simplified asymptotic method, and offset
+      method. In the offset method, the trios are computed with :meth:`EventTrio.optimize_batch`. Since this
+      optimizer is not the one used by :class:`EventTrio`, the utility thresholds of the offset method may differ
+      slightly from those of :attr:`TauVector.d_ranking_best_response` (typically by less than ``1e-4``).
+
+    Examples
+    --------
+        >>> taus = TauVectorBatch([[0.1, 0, 0.3, 0.6, 0, 0],
+        ...                        [0.1, 0.2, 0.3, 0.15, 0.1, 0.15]])
+        >>> utility_thresholds, justifications = best_responses_batch(taus)
+        >>> RANKINGS
+        ['abc', 'acb', 'bac', 'bca', 'cab', 'cba']
+        >>> print(np.round(utility_thresholds, 4))
+        [[1.     1.     0.     0.     1.     0.    ]
+         [0.     0.     0.4285 1.     0.5715 1.    ]]
+        >>> [JUSTIFICATIONS[code] for code in justifications[1]]  # doctest: +NORMALIZE_WHITESPACE
+        ['Difficult vs easy pivot', 'Difficult vs easy pivot', 'Offset method', 'Easy vs difficult pivot',
+         'Offset method', 'Easy vs difficult pivot']
+
+    This is consistent with the best responses computed by the tau-vectors:
+
+        >>> taus[0].d_ranking_best_response['bac']
+        <ballot = ab, utility_threshold = 0, justification = Asymptotic method>
+        >>> taus[1].d_ranking_best_response['bac']
+        <ballot = utility-dependent, utility_threshold = 0.428533, justification = Offset method>
+
+    In Plurality:
+
+        >>> utility_thresholds, justifications = best_responses_batch([[0.4, 0.4, 0.2, 0, 0, 0]],
+        ...                                                           voting_rule=PLURALITY)
+        >>> utility_thresholds
+        array([[1., 1., 1., 1., 0., 0.]])
+    """
+    if not isinstance(taus, TauVectorBatch):
+        taus = TauVectorBatch(taus, voting_rule=voting_rule)
+    n = len(taus)
+    utility_thresholds = np.full((n, len(RANKINGS)), np.nan)
+    justifications = np.zeros((n, len(RANKINGS)), dtype=int)
+    if taus.voting_rule == PLURALITY:
+        for r, (i, j, k) in enumerate(RANKINGS):
+            tau_i, tau_j, tau_k = getattr(taus, i), getattr(taus, j), getattr(taus, k)
+            utility_thresholds[:, r] = np.select(
+                [(tau_i < tau_j) & (tau_i < tau_k), (0 < tau_i) & (tau_i == tau_k) & (tau_k < tau_j)], [0, 0.5], 1)
+        justifications[:] = _CODE[BestResponsePlurality.PLURALITY_ANALYSIS]
+    elif taus.voting_rule == ANTI_PLURALITY:
+        for r, (i, j, k) in enumerate(RANKINGS):
+            tau_minus_i, tau_minus_j, tau_minus_k = getattr(taus, j + k), getattr(taus, i + k), getattr(taus, i + j)
+            utility_thresholds[:, r] = np.select(
+                [(tau_minus_k > tau_minus_i) & (tau_minus_k > tau_minus_j),
+                 (tau_minus_i == tau_minus_k) & (tau_minus_k > tau_minus_j)], [1, 0.5], 0)
+        justifications[:] = _CODE[BestResponseAntiPlurality.ANTI_PLURALITY_ANALYSIS]
+    elif taus.voting_rule == APPROVAL:
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            asymptotic_rows = taus.has_two_consecutive_zeros
+            if np.any(asymptotic_rows):
+                _asymptotic_method(taus.shares[asymptotic_rows], utility_thresholds, justifications, asymptotic_rows)
+            if not np.all(asymptotic_rows):
+                rows = ~ asymptotic_rows
+                _limit_pivot_theorem(TauVectorBatch(taus.shares[rows], normalization_warning=False),
+                                     utility_thresholds, justifications, rows)
+    else:
+        raise NotImplementedError
+    return utility_thresholds, justifications
+
+
+# Asymptotic developments on arrays: tuples (mu, nu, xi), with the same operations as in `Asymptotic`.
+
+
+def _isclose(x, y):
+    # Same as ``math.isclose(x, y)`` with the default tolerance.
+    return (x == y) | (np.isfinite(x) & np.isfinite(y)
+                       & (np.abs(x - y) <= 1e-9 * np.maximum(np.abs(x), np.abs(y))))
+
+
+def _my_addition(x, y):
+    return np.where(_isclose(x, -y), 0., x + y)
+
+
+def _impossible(n):
+    return np.full(n, -np.inf), np.full(n, -np.inf), np.full(n, -np.inf)
+
+
+def _mul(a, b):
+    return _my_addition(a[0], b[0]), _my_addition(a[1], b[1]), _my_addition(a[2], b[2])
+
+
+def _scale(a, factor):
+    zero = np.zeros(np.shape(a[0]))
+    return _mul(a, (zero, zero, zero + np.log(factor)))
+
+
+def _div(a, b):
+    return _mul(a, (- b[0], - b[1], - b[2]))
+
+
+def _add(a, b):
+    (mu_1, nu_1, xi_1), (mu_2, nu_2, xi_2) = a, b
+    some_mu_is_nan = np.isnan(mu_1) | np.isnan(mu_2)
+    same_mu = _isclose(mu_1, mu_2)
+    some_nu_is_nan = np.isnan(nu_1) | np.isnan(nu_2)
+    same_nu = _isclose(nu_1, nu_2)
+    first = mu_1 > mu_2
+    mu = np.select([some_mu_is_nan, same_mu, first], [np.nan, np.maximum(mu_1, mu_2), mu_1], mu_2)
+    nu = np.select([some_mu_is_nan, first & ~ same_mu, ~ same_mu, some_nu_is_nan, same_nu, nu_1 > nu_2],
+                   [np.nan, nu_1, nu_2, np.nan, np.maximum(nu_1, nu_2), nu_1], nu_2)
+    xi = np.select([some_mu_is_nan, first & ~ same_mu, ~ same_mu, some_nu_is_nan, same_nu, nu_1 > nu_2],
+                   [np.nan, xi_1, xi_2, np.nan, np.log(np.exp(xi_1) + np.exp(xi_2)), xi_1], xi_2)
+    return mu, nu, xi
+
+
+def _limit(a):
+    mu, nu, xi = a
+    return np.select([np.isnan(mu), mu > 0, mu < 0, np.isnan(nu), nu > 0, nu < 0],
+                     [np.nan, np.inf, 0., np.nan, np.inf, 0.], np.exp(xi))
+
+
+def _where(conditions, choices, default):
+    # Like ``np.select``, for asymptotic developments.
+    return tuple(np.select(conditions, [choice[c] for choice in choices], default[c]) for c in range(3))
+
+
+def _poisson_value(tau, k):
+    tau = np.asarray(tau, dtype=float)
+    n = tau.shape
+    generic = (- tau, np.full(n, float(k)), k * np.log(tau) - np.log(factorial(k)))
+    if k == 0:
+        return _where([tau == 0], [(np.zeros(n), np.zeros(n), np.zeros(n))], generic)
+    return _where([tau == 0], [_impossible(n)], generic)
+
+
+def _poisson_x1_eq_x2_plus_k(tau_1, tau_2, k):
+    tau_1, tau_2 = np.broadcast_arrays(np.asarray(tau_1, dtype=float), np.asarray(tau_2, dtype=float))
+    n = tau_1.shape
+    tau_1_zero = (- tau_2, np.zeros(n), np.zeros(n)) if k == 0 else _impossible(n)
+    tau_2_zero = (- tau_1, np.full(n, float(k)), k * np.log(tau_1) - np.log(factorial(k)))
+    generic = (- (np.sqrt(tau_1) - np.sqrt(tau_2)) ** 2, np.full(n, -0.5),
+               -0.5 * np.log(4 * pi * np.sqrt(tau_1 * tau_2) * tau_2 ** k / tau_1 ** k))
+    return _where([tau_1 == 0, tau_2 == 0], [tau_1_zero, tau_2_zero], generic)
+
+
+def _poisson_eq(tau_1, tau_2):
+    return _poisson_x1_eq_x2_plus_k(tau_1, tau_2, 0)
+
+
+def _poisson_one_more(tau_1, tau_2):
+    return _poisson_x1_eq_x2_plus_k(tau_1, tau_2, 1)
+
+
+def _poisson_x1_ge_x2_plus_k(tau_1, tau_2, k):
+    tau_1, tau_2 = np.broadcast_arrays(np.asarray(tau_1, dtype=float), np.asarray(tau_2, dtype=float))
+    n = tau_1.shape
+    tau_1_zero = (- tau_2, np.zeros(n), np.zeros(n)) if k == 0 else _impossible(n)
+    generic = (- (np.sqrt(tau_1) - np.sqrt(tau_2)) ** 2, np.full(n, -0.5),
+               -0.5 * np.log(4 * pi * np.sqrt(tau_1 * tau_2) * tau_2 ** k / tau_1 ** k)
+               - np.log(1 - np.sqrt(tau_1 / tau_2)))
+    return _where([tau_1 == 0, tau_1 > tau_2, tau_1 == tau_2],
+                  [tau_1_zero, (np.zeros(n), np.zeros(n), np.zeros(n)),
+                   (np.zeros(n), np.zeros(n), np.full(n, - np.log(2)))],
+                  generic)
+
+
+def _poisson_ge(tau_1, tau_2):
+    return _poisson_x1_ge_x2_plus_k(tau_1, tau_2, 0)
+
+
+def _poisson_gt(tau_1, tau_2):
+    return _poisson_x1_ge_x2_plus_k(tau_1, tau_2, 1)
+
+
+def _poisson_gt_one_more(tau_1, tau_2):
+    return _poisson_x1_ge_x2_plus_k(tau_1, tau_2, 2)
+
+
+# Asymptotic method
+
+
+def _shares(d_ballot_share, x, y, z):
+    """Shares ``tau_x, tau_y, tau_z, tau_xy, tau_xz, tau_yz`` for the candidates `x`, `y`, `z`."""
+    return (d_ballot_share[x], d_ballot_share[y], d_ballot_share[z], d_ballot_share[''.join(sorted(x + y))],
+            d_ballot_share[''.join(sorted(x + z))], d_ballot_share[''.join(sorted(y + z))])
+
+
+def _pivot_tij_degenerate(tau_x, tau_y, tau_z, tau_xy, tau_xz, tau_yz):
+    # Cf. `EventPivotTij`, when the tau-vector has two consecutive zeros.
+    v, one_more, eq, ge, gt = _poisson_value, _poisson_one_more, _poisson_eq, _poisson_ge, _poisson_gt
+    return _where(
+        [(tau_x == 0) & (tau_xy == 0), (tau_y == 0) & (tau_xy == 0), (tau_y == 0) & (tau_yz == 0),
+         (tau_x == 0) & (tau_xz == 0), (tau_z == 0) & ((tau_xz == 0) | (tau_yz == 0))],
+        [_mul(_mul(v(tau_yz, 0), _add(one_more(tau_y, tau_xz), eq(tau_y, tau_xz))), v(tau_z, 0)),
+         _mul(_mul(eq(tau_x, tau_yz), v(tau_xz, 0)), v(tau_z, 0)),
+         _mul(_mul(v(tau_x, 0), v(tau_xz, 0)), ge(tau_xy, tau_z)),
+         _add(_mul(_mul(v(tau_yz, 0), _add(v(tau_y, 0), v(tau_y, 1))), ge(tau_xy, tau_z)),
+              _mul(_mul(v(tau_yz, 1), v(tau_y, 0)), gt(tau_xy, tau_z))),
+         _add(one_more(tau_y + tau_yz, tau_x + tau_xz), eq(tau_y + tau_yz, tau_x + tau_xz))],
+        (np.full(tau_x.shape, np.nan),) * 3)
+
+
+def _pivot_tjk_degenerate(tau_x, tau_y, tau_z, tau_xy, tau_xz, tau_yz):
+    # Cf. `EventPivotTjk`, when the tau-vector has two consecutive zeros.
+    v, one_more, eq, gt, gt_one_more = _poisson_value, _poisson_one_more, _poisson_eq, _poisson_gt, _poisson_gt_one_more
+    return _where(
+        [(tau_xy == 0) & ((tau_x == 0) | (tau_y == 0)), (tau_x == 0) & (tau_xz == 0), (tau_y == 0) & (tau_yz == 0),
+         (tau_z == 0) & ((tau_xz == 0) | (tau_yz == 0))],
+        [_impossible(tau_x.shape),
+         _mul(_mul(v(tau_yz, 0), v(tau_y, 0)), gt_one_more(tau_xy, tau_z)),
+         _add(_mul(_mul(v(tau_x, 0), _add(v(tau_xz, 0), v(tau_xz, 1))), gt_one_more(tau_xy, tau_z)),
+              _mul(_mul(v(tau_x, 1), v(tau_xz, 0)), gt(tau_xy, tau_z))),
+         _add(eq(tau_x + tau_xz, tau_y + tau_yz), one_more(tau_x + tau_xz, tau_y + tau_yz))],
+        (np.full(tau_x.shape, np.nan),) * 3)
+
+
+def _trio_1t_degenerate(tau_x, tau_y, tau_z, tau_xy, tau_xz, tau_yz):
+    # Cf. `EventTrio1t`, when the tau-vector has two consecutive zeros.
+    v, one_more, eq = _poisson_value, _poisson_one_more, _poisson_eq
+    cross_2 = _mul(_mul(one_more(tau_yz, tau_x), eq(tau_y, tau_xz)), eq(tau_z, tau_xy))
+    return _where(
+        [(tau_x == 0) & (tau_yz == 0),
+         ((tau_y == 0) & (tau_xz == 0)) | ((tau_z == 0) & (tau_xy == 0)),
+         ((tau_x == 0) & (tau_xy == 0)) | ((tau_x == 0) & (tau_xz == 0)),
+         ((tau_y == 0) & (tau_xy == 0)) | ((tau_z == 0) & (tau_xz == 0)),
+         ((tau_y == 0) & (tau_yz == 0)) | ((tau_z == 0) & (tau_yz == 0))],
+        [_mul(one_more(tau_y, tau_xz), one_more(tau_z, tau_xy)),
+         cross_2,
+         _add(_mul(_mul(v(tau_yz, 0), one_more(tau_y, tau_xz)), one_more(tau_z, tau_xy)),
+              _mul(_mul(v(tau_yz, 1), eq(tau_y, tau_xz)), eq(tau_z, tau_xy))),
+         cross_2,
+         _impossible(tau_x.shape)],
+        (np.full(tau_x.shape, np.nan),) * 3)
+
+
+def _trio_2t_degenerate(tau_x, tau_y, tau_z, tau_xy, tau_xz, tau_yz):
+    # Cf. `EventTrio2t`, when the tau-vector has two consecutive zeros.
+    v, one_more, eq = _poisson_value, _poisson_one_more, _poisson_eq
+    cross_2 = _mul(_mul(eq(tau_x, tau_yz), eq(tau_y, tau_xz)), one_more(tau_z, tau_xy))
+    return _where(
+        [(tau_z == 0) & (tau_xy == 0),
+         ((tau_x == 0) & (tau_yz == 0)) | ((tau_y == 0) & (tau_xz == 0)),
+         ((tau_z == 0) & (tau_xz == 0)) | ((tau_z == 0) & (tau_yz == 0)),
+         ((tau_x == 0) & (tau_xz == 0)) | ((tau_y == 0) & (tau_yz == 0)),
+         ((tau_x == 0) & (tau_xy == 0)) | ((tau_y == 0) & (tau_xy == 0))],
+        [_mul(one_more(tau_yz, tau_x), one_more(tau_xz, tau_y)),
+         cross_2,
+         _impossible(tau_x.shape),
+         cross_2,
+         _add(_mul(_mul(v(tau_z, 0), one_more(tau_yz, tau_x)), one_more(tau_xz, tau_y)),
+              _mul(_mul(one_more(tau_z, 1), eq(tau_x, tau_yz)), eq(tau_y, tau_xz)))],
+        (np.full(tau_x.shape, np.nan),) * 3)
+
+
+def _asymptotic_method(shares, utility_thresholds, justifications, rows):
+    """Asymptotic method, for tau-vectors with two consecutive zeros. Cf.
+    :attr:`BestResponseApproval.results_asymptotic_method`."""
+    d_ballot_share = dict(zip(BALLOTS_WITHOUT_INVERSIONS, shares.T))
+    for r, (i, j, k) in enumerate(RANKINGS):
+        pivot_tij = _pivot_tij_degenerate(*_shares(d_ballot_share, i, j, k))
+        pivot_tjk = _pivot_tjk_degenerate(*_shares(d_ballot_share, k, j, i))
+        trio_1t = _trio_1t_degenerate(*_shares(d_ballot_share, i, *sorted(j + k)))
+        trio_2t = _trio_2t_degenerate(*_shares(d_ballot_share, *sorted(i + j), k))
+        utility_thresholds[rows, r] = _limit(_div(
+            _add(_add(_scale(pivot_tij, 1 / 2), _scale(trio_1t, 1 / 3)), _scale(trio_2t, 1 / 6)),
+            _add(_add(_add(_scale(pivot_tij, 1 / 2), _scale(pivot_tjk, 1 / 2)), _scale(trio_1t, 2 / 3)),
+                 _scale(trio_2t, 1 / 3))
+        ))
+        justifications[rows, r] = _CODE[BestResponseApproval.ASYMPTOTIC]
+
+
+# Limit pivot theorem
+
+
+def _trio(taus):
+    """Trio event ``abc`` for tau-vectors with no two consecutive zeros. Cf. :class:`EventTrio`.
+
+    Returns
+    -------
+    asymptotic : tuple
+        Tuple of arrays ``(mu, nu, xi)``.
+    psi : dict
+        Key: a candidate or a pair of candidates (e.g. ``'ab'``). Value: the array of the pseudo-offsets.
+    """
+    n = len(taus)
+    tau_x, tau_y, tau_z, tau_xy, tau_xz, tau_yz = taus.a, taus.b, taus.c, taus.ab, taus.ac, taus.bc
+    nan = np.full(n, np.nan)
+    phi = dict()
+    # Cross diagram (since there are no two consecutive zeros, there is no flower diagram)
+    is_cross = (tau_x == 0) & (tau_yz == 0) | (tau_y == 0) & (tau_xz == 0) | (tau_z == 0) & (tau_xy == 0)
+    cross = _mul(_mul(_poisson_eq(tau_x, tau_yz), _poisson_eq(tau_y, tau_xz)), _poisson_eq(tau_z, tau_xy))
+    # Tripods
+    is_tripod = ~ is_cross & (tau_xy == 0) & (tau_xz == 0) & (tau_yz == 0)
+    is_inverted_tripod = ~ is_cross & (tau_x == 0) & (tau_y == 0) & (tau_z == 0)
+    # Natural general tie
+    is_tie = ~ is_cross & ~ is_tripod & ~ is_inverted_tripod & (
+        (tau_x - tau_yz == tau_y - tau_xz) & (tau_y - tau_xz == tau_z - tau_xy))
+    # Generic case
+    is_generic = ~ is_cross & ~ is_tripod & ~ is_inverted_tripod & ~ is_tie
+    mu_generic = nan.copy()
+    phi_generic = {label: nan.copy() for label in ['x', 'y', 'z', 'xy', 'xz', 'yz']}
+    if np.any(is_generic):
+        inf, sup, start = _trio_bounds_and_start(taus, is_generic)
+        g = is_generic
+        results = EventTrio.optimize_batch(tau_x[g], tau_y[g], tau_z[g], tau_xy[g], tau_xz[g], tau_yz[g],
+                                           inf=inf, sup=sup, start=start)
+        mu_generic[g] = results['mu']
+        for label in phi_generic.keys():
+            phi_generic[label][g] = results['phi_' + label]
+    mu = np.select([is_cross, is_tripod, is_inverted_tripod, is_tie],
+                   [cross[0], 3 * (tau_x * tau_y * tau_z) ** (1 / 3) - 1,
+                    3 * (tau_xy * tau_xz * tau_yz) ** (1 / 3) - 1, 0.], mu_generic)
+    asymptotic = (mu, np.where(is_cross, cross[1], np.nan), np.where(is_cross, cross[2], np.nan))
+    for label, tau, numerator, denominator, tripod, inverted_tripod in [
+            ('x', tau_x, tau_yz, tau_x, (tau_y * tau_z) / tau_x ** 2, nan),
+            ('y', tau_y, tau_xz, tau_y, (tau_x * tau_z) / tau_y ** 2, nan),
+            ('z', tau_z, tau_xy, tau_z, (tau_x * tau_y) / tau_z ** 2, nan),
+            ('xy', tau_xy, tau_z, tau_xy, nan, (tau_xz * tau_yz) / tau_xy ** 2),
+            ('xz', tau_xz, tau_y, tau_xz, nan, (tau_xy * tau_yz) / tau_xz ** 2),
+            ('yz', tau_yz, tau_x, tau_yz, nan, (tau_xy * tau_xz) / tau_yz ** 2)]:
+        phi[label] = np.select(
+            [is_cross, is_tripod, is_inverted_tripod, is_tie],
+            [np.where(tau > 0, np.sqrt(numerator / denominator), np.nan), tripod ** (1 / 3),
+             inverted_tripod ** (1 / 3), np.where(tau > 0, 1., np.nan)],
+            phi_generic[label])
+
+    def pseudo_offset(label, label_left, label_right):
+        return np.where(np.isnan(phi[label]), phi[label_left] * phi[label_right], phi[label])
+
+    psi = {'a': pseudo_offset('x', 'xy', 'xz'), 'b': pseudo_offset('y', 'xy', 'yz'),
+           'c': pseudo_offset('z', 'xz', 'yz'), 'ab': pseudo_offset('xy', 'x', 'y'),
+           'ac': pseudo_offset('xz', 'x', 'z'), 'bc': pseudo_offset('yz', 'y', 'z')}
+    for pair in ['ab', 'ac', 'bc']:
+        psi[pair[::-1]] = psi[pair]
+    return asymptotic, psi
+
+
+def _trio_bounds_and_start(taus, rows):
+    """Bounds and starting point for the optimizer of the trio ``abc``. Cf. :meth:`EventTrio._get_bounds_and_start`.
+    """
+    safety_epsilon = 1e-12
+    tau_x, tau_y, tau_xz, tau_yz = taus.a[rows], taus.b[rows], taus.ac[rows], taus.bc[rows]
+    n = tau_x.shape[0]
+    # Use pivot xy
+    score_xy, score_z = taus.score_ab_in_duo_ab[rows], taus.score_c_in_duo_ab[rows]
+    inf = np.where(score_xy > score_z, 0., 1 + safety_epsilon)
+    sup = np.where(score_xy > score_z, 1 - safety_epsilon, np.inf)
+    tight = np.where(score_xy == score_z, 1., np.nan)
+    # Use pivots xz and yz
+    for tau_1, tau_2, tau_12, tau_21, score_12, score_other in [
+            (tau_x, tau_y, tau_xz, tau_yz, taus.score_ac_in_duo_ac[rows], taus.score_b_in_duo_ac[rows]),
+            (tau_y, tau_x, tau_yz, tau_xz, taus.score_bc_in_duo_bc[rows], taus.score_a_in_duo_bc[rows])]:
+        relevant = ~ ((tau_1 == 0) & (tau_12 <= tau_2))
+        b = tau_12 - tau_2
+        root = np.where(tau_1 == 0, tau_21 / b, (- b + np.sqrt(b ** 2 + 4 * tau_1 * tau_21)) / (2 * tau_1))
+        inf = np.where(relevant & (score_12 > score_other), np.maximum(inf, root + safety_epsilon), inf)
+        sup = np.where(relevant & (score_12 < score_other), np.minimum(sup, root - safety_epsilon), sup)
+        tight = np.where(np.isnan(tight) & relevant & (score_12 == score_other), root, tight)
+    start = np.select([(inf == 0) & np.isposinf(sup), inf == 0, np.isposinf(sup)],
+                      [np.ones(n), sup / 2, inf * 2], np.sqrt(inf * sup))
+    inf = np.where(inf == 0, safety_epsilon, inf)
+    is_tight = ~ np.isnan(tight)
+    return np.where(is_tight, tight, inf), np.where(is_tight, tight, sup), np.where(is_tight, tight, start)
+
+
+def _pivot_weak(taus, x, y, z, trio_asymptotic, trio_psi):
+    """Pivot weak `xy` (with ``x < y``), for tau-vectors with no two consecutive zeros. Cf. :class:`EventPivotWeak`.
+
+    Returns
+    -------
+    asymptotic : tuple
+        Tuple of arrays ``(mu, nu, xi)``.
+    is_difficult : numpy.ndarray
+        Whether the computation uses the trio.
+    ratio_x, ratio_y : numpy.ndarray
+        The offsets in the duo.
+    """
+    tau_x, tau_y, tau_z, tau_xy, tau_xz, tau_yz = _shares(dict(zip(BALLOTS_WITHOUT_INVERSIONS, taus.shares.T)), x, y, z)
+    w_x, w_y = tau_x + tau_xz, tau_y + tau_yz
+    asymptotic_duo = _poisson_eq(w_x, w_y)
+    ratio_x, ratio_y = np.sqrt(w_y / w_x), np.sqrt(w_x / w_y)
+    s_x = tau_xy + tau_x * ratio_x
+    s_z = tau_z + tau_yz * ratio_y
+    is_tight = _isclose(s_x, s_z)
+    is_difficult = ~ is_tight & ~ (s_x > s_z)
+    half = is_tight & ((tau_z != 0) | (tau_xy != 0) | ((tau_x != 0) & (tau_y != 0) & (tau_xz != 0) & (tau_yz != 0)))
+    with_trio = _div(trio_asymptotic, (np.zeros(len(taus)), np.zeros(len(taus)), np.log(1 - trio_psi[z])))
+    asymptotic = _where([half, is_difficult], [_scale(asymptotic_duo, 1 / 2), with_trio], asymptotic_duo)
+    return asymptotic, is_difficult, ratio_x, ratio_y
+
+
+def _limit_pivot_theorem(taus, utility_thresholds, justifications, rows):
+    """Limit pivot theorem, for tau-vectors with no two consecutive zeros. Cf.
+    :attr:`BestResponseApproval.results_limit_pivot_theorem`."""
+    trio_asymptotic, psi = _trio(taus)
+    d_ballot_share = dict(zip(BALLOTS_WITHOUT_INVERSIONS, taus.shares.T))
+    d_pair_pivot_weak = dict()
+    for x, y, z in RANKINGS:
+        if x < y:
+            asymptotic, is_difficult, ratio_x, ratio_y = _pivot_weak(taus, x, y, z, trio_asymptotic, psi)
+            d_pair_pivot_weak[x + y] = d_pair_pivot_weak[y + x] = (
+                asymptotic, is_difficult, {x: ratio_x, y: ratio_y})
+    for r, (i, j, k) in enumerate(RANKINGS):
+        tau_i = d_ballot_share[i]
+        pivot_ij_easy_or_tight = getattr(taus, 'pivot_%s%s_easy_or_tight' % (i, j))
+        pivot_jk_easy_or_tight = getattr(taus, 'pivot_%s%s_easy_or_tight' % (j, k))
+        # Both pivots are easy => simplified asymptotic method.
+        # Personalized pivot tij (cf. `EventPivotTij`).
+        asymptotic_ij, difficult_ij, ratios_ij = d_pair_pivot_weak[i + j]
+        phi_ik_tilde = np.where(difficult_ij, psi[i + k], ratios_ij[i])
+        pivot_tij = _scale(asymptotic_ij, 1 + phi_ik_tilde)
+        # Personalized pivot tjk (cf. `EventPivotTjk`).
+        asymptotic_jk, difficult_jk, ratios_jk = d_pair_pivot_weak[j + k]
+        phi_i_tilde = np.where(difficult_jk, psi[i], np.where(tau_i != 0, 1., ratios_jk[k] * ratios_jk[j]))
+        phi_j_tilde = np.where(difficult_jk, psi[j], ratios_jk[j])
+        pivot_tjk = _scale(asymptotic_jk, phi_i_tilde ** 2 * (1 + phi_j_tilde))
+        simplified = _limit(_div(_scale(pivot_tij, 1 / 2), _add(_scale(pivot_tij, 1 / 2), _scale(pivot_tjk, 1 / 2))))
+        # Both pivots are difficult => offset method.
+        psi_i, psi_k = psi[i], psi[k]
+        psi_k_close_to_one = (psi_k >= 1) & _isclose_rel(psi_k, 1, rel_tol=1e-1)
+        psi_i_close_to_one = (psi_i >= 1) & _isclose_rel(psi_i, 1, rel_tol=1e-1)
+        pij = (1 + psi[i + k]) / (1 - psi_k)
+        pjk = (1 + psi[j]) * psi_i ** 2 / (1 - psi_i)
+        p1t = psi_i
+        p2t = psi[i + j]
+        offset = (pij / 2 + p1t / 3 + p2t / 6) / (pij / 2 + pjk / 2 + p1t * 2 / 3 + p2t / 3)
+        # Conclude
+        both_easy = pivot_ij_easy_or_tight & pivot_jk_easy_or_tight
+        both_difficult = ~ pivot_ij_easy_or_tight & ~ pivot_jk_easy_or_tight
+        conditions = [both_easy, pivot_ij_easy_or_tight, pivot_jk_easy_or_tight,
+                      both_difficult & psi_k_close_to_one, both_difficult & psi_i_close_to_one]
+        utility_thresholds[rows, r] = np.select(conditions, [simplified, 1., 0., 1., 0.], offset)
+        justifications[rows, r] = np.select(
+            conditions,
+            [_CODE[BestResponseApproval.ASYMPTOTIC_SIMPLIFIED], _CODE[BestResponseApproval.EASY_VS_DIFFICULT],
+             _CODE[BestResponseApproval.DIFFICULT_VS_EASY],
+             _CODE[BestResponseApproval.OFFSET_METHOD_WITH_TRIO_APPROXIMATION_CORRECTION],
+             _CODE[BestResponseApproval.OFFSET_METHOD_WITH_TRIO_APPROXIMATION_CORRECTION]],
+            _CODE[BestResponseApproval.OFFSET_METHOD])
+
+
+def _isclose_rel(x, y, rel_tol):
+    return np.abs(x - y) <= rel_tol * np.maximum(np.abs(x), np.abs(y))
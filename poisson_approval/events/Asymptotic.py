@@ -50,6 +50,8 @@ class Asymptotic:
         -0.5134734250965083
     """
 
+    __slots__ = ('symbolic', 'ce', 'mu', 'nu', 'xi', 'μ', 'ν', 'ξ')
+
     def __init__(self, mu, nu, xi, symbolic=False):
         self.symbolic = symbolic
         self.ce = computation_engine(symbolic)
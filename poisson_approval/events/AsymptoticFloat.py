@@ -0,0 +1,230 @@
+import math
+from poisson_approval.events.Asymptotic import Asymptotic
+from poisson_approval.utils.ComputationEngineNumeric import ComputationEngineNumeric
+
+
+def _is_float_or_int(x):
+    return isinstance(x, (float, int))
+
+
+def _look_equal(x, y):
+    # Same as ``ComputationEngineNumeric.look_equal(x, y)`` for floats and integers.
+    if isinstance(x, float) or isinstance(y, float):
+        return math.isclose(x, y)
+    return x == y
+
+
+def _my_addition(x, y):
+    # Same as the auxiliary function `my_addition` in ``Asymptotic.__mul__``.
+    return 0 if _look_equal(x, -y) else x + y
+
+
+# noinspection NonAsciiCharacters
+class AsymptoticFloat(Asymptotic):
+    r"""An asymptotic development of the form :math:`\exp(\mu n + \nu \log n + \xi + o(1))`, with float coefficients.
+
+    Parameters
+    ----------
+    mu : float or int
+        Coefficient of the term in `n` (called "magnitude").
+    nu : float or int
+        Coefficient of the term in `log n`.
+    xi : float or int
+        Constant coefficient.
+    symbolic : bool
+        Must be False (this argument is only here for compatibility with :class:`Asymptotic`).
+
+    Notes
+    -----
+    This is a fast version of :class:`Asymptotic` for numeric computation, when all the coefficients are floats or
+    integers (including ``nan`` and ``- inf``). The operations use plain float arithmetic from the standard library,
+    instead of the computation engine, but they give exactly the same results as the operations of
+    :class:`Asymptotic` with ``symbolic=False``.
+
+    When a numeric event is computed (cf. :class:`Event`), its asymptotic development is converted to this class
+    whenever possible (cf. :meth:`from_asymptotic`). In particular, this speeds up the asymptotic method in
+    :class:`BestResponseApproval`.
+
+    If the other operand of an operation is an :class:`Asymptotic` whose coefficients are not all floats or integers
+    (e.g. fractions), then the usual operation of :class:`Asymptotic` is used.
+
+    Examples
+    --------
+        >>> asymptotic = AsymptoticFloat(mu=-0.1, nu=0, xi=0.5)
+        >>> print(asymptotic * AsymptoticFloat(mu=-0.2, nu=1, xi=0.5))
+        exp(- 0.3 n + log n + 1 + o(1))
+        >>> print(asymptotic + AsymptoticFloat(mu=-0.2, nu=1, xi=0.5))
+        exp(- 0.1 n + 0.5 + o(1))
+        >>> print(asymptotic / 2)
+        exp(- 0.1 n - 0.193147 + o(1))
+        >>> asymptotic.limit
+        0
+    """
+
+    __slots__ = ()
+
+    symbolic = False
+    ce = ComputationEngineNumeric
+
+    # noinspection PyMissingConstructor
+    def __init__(self, mu, nu, xi, symbolic=False):
+        assert not symbolic
+        self.mu = mu
+        self.nu = nu
+        self.xi = xi
+
+    def __reduce__(self):
+        # The slots `symbolic` and `ce` of the parent class are hidden by class attributes, so the default pickling
+        # would fail.
+        return self.__class__, (self.mu, self.nu, self.xi)
+
+    μ = property(lambda self: self.mu, doc='Alias for `mu`.')
+    ν = property(lambda self: self.nu, doc='Alias for `nu`.')
+    ξ = property(lambda self: self.xi, doc='Alias for `xi`.')
+
+    @classmethod
+    def from_asymptotic(cls, asymptotic):
+        """Convert an asymptotic development to this class, if possible.
+
+        Parameters
+        ----------
+        asymptotic : Asymptotic
+
+        Returns
+        -------
+        Asymptotic
+            An :class:`AsymptoticFloat` with the same coefficients if the computation is numeric and the coefficients
+            are floats or integers. Otherwise, `asymptotic` itself.
+
+        Examples
+        --------
+            >>> from fractions import Fraction
+            >>> AsymptoticFloat.from_asymptotic(Asymptotic(mu=-0.1, nu=0, xi=float('nan')))
+            Asymptotic(mu=-0.1, nu=0, xi=nan)
+            >>> type(_).__name__
+            'AsymptoticFloat'
+            >>> type(AsymptoticFloat.from_asymptotic(Asymptotic(mu=Fraction(-1, 10), nu=0, xi=0))).__name__
+            'Asymptotic'
+        """
+        if (isinstance(asymptotic, cls) or asymptotic.symbolic or not _is_float_or_int(asymptotic.mu)
+                or not _is_float_or_int(asymptotic.nu) or not _is_float_or_int(asymptotic.xi)):
+            return asymptotic
+        return cls(asymptotic.mu, asymptotic.nu, asymptotic.xi)
+
+    def _convert(self, other):
+        """Convert the other operand: AsymptoticFloat if possible, None otherwise."""
+        if isinstance(other, AsymptoticFloat):
+            return other
+        if isinstance(other, Asymptotic):
+            other = AsymptoticFloat.from_asymptotic(other)
+            return other if isinstance(other, AsymptoticFloat) else None
+        return AsymptoticFloat(0, 0, math.log(other))
+
+    @property
+    def limit(self):
+        """float or int : Limit when `n` tends to infinity. Cf. :attr:`Asymptotic.limit`.
+
+        Examples
+        --------
+            >>> AsymptoticFloat(mu=0, nu=0, xi=float('nan')).limit
+            nan
+        """
+        mu = self.mu
+        if mu != mu:
+            return math.nan
+        elif mu > 0:
+            return math.inf
+        elif mu < 0:
+            return 0
+        nu = self.nu
+        if nu != nu:
+            return math.nan
+        elif nu > 0:
+            return math.inf
+        elif nu < 0:
+            return 0
+        xi = self.xi
+        if xi != xi:
+            return math.nan
+        return math.exp(xi)
+
+    def __mul__(self, other):
+        """Multiplication of two asymptotic developments. Cf. :meth:`Asymptotic.__mul__`.
+
+        Examples
+        --------
+            >>> print(AsymptoticFloat(mu=42, nu=51, xi=69) * AsymptoticFloat(mu=1, nu=float('nan'), xi=float('nan')))
+            exp(43 n + ? log n + ? + o(1))
+        """
+        converted = self._convert(other)
+        if converted is None:
+            return super().__mul__(other)
+        return AsymptoticFloat(_my_addition(self.mu, converted.mu),
+                               _my_addition(self.nu, converted.nu),
+                               _my_addition(self.xi, converted.xi))
+
+    def __rmul__(self, other):
+        converted = self._convert(other)
+        if converted is None:
+            return Asymptotic.__mul__(other, self)
+        return converted * self
+
+    def __truediv__(self, other):
+        """Division of two asymptotic developments. Cf. :meth:`Asymptotic.__truediv__`.
+
+        Examples
+        --------
+            >>> print(1 / AsymptoticFloat(mu=42, nu=51, xi=69))
+            exp(- 42 n - 51 log n - 69 + o(1))
+        """
+        converted = self._convert(other)
+        if converted is None:
+            return super().__truediv__(other)
+        return self * AsymptoticFloat(- converted.mu, - converted.nu, - converted.xi)
+
+    def __rtruediv__(self, other):
+        converted = self._convert(other)
+        if converted is None:
+            # Not ``other / self``: Python would call this method again, since this class is a subclass of `other`'s.
+            return Asymptotic.__truediv__(other, self)
+        return converted / self
+
+    def __add__(self, other):
+        """Addition of two asymptotic developments. Cf. :meth:`Asymptotic.__add__`.
+
+        Examples
+        --------
+            >>> print(AsymptoticFloat(mu=42, nu=2, xi=4) + AsymptoticFloat(mu=42, nu=2, xi=3))
+            exp(42 n + 2 log n + 4.31326 + o(1))
+            >>> print(AsymptoticFloat(mu=42, nu=2, xi=69) + AsymptoticFloat(mu=41.99999999, nu=51, xi=3))
+            exp(42 n + 51 log n + 3 + o(1))
+        """
+        converted = self._convert(other)
+        if converted is None:
+            return super().__add__(other)
+        other = converted
+        mu_1, mu_2 = self.mu, other.mu
+        if mu_1 != mu_1 or mu_2 != mu_2:
+            return AsymptoticFloat(math.nan, math.nan, math.nan)
+        elif _look_equal(mu_1, mu_2):
+            mu = max(mu_1, mu_2)
+            nu_1, nu_2 = self.nu, other.nu
+            if nu_1 != nu_1 or nu_2 != nu_2:
+                return AsymptoticFloat(mu, math.nan, math.nan)
+            elif _look_equal(nu_1, nu_2):
+                return AsymptoticFloat(mu, max(nu_1, nu_2), math.log(math.exp(self.xi) + math.exp(other.xi)))
+            elif nu_1 > nu_2:
+                return AsymptoticFloat(mu, nu_1, self.xi)
+            else:
+                return AsymptoticFloat(mu, nu_2, other.xi)
+        elif mu_1 > mu_2:
+            return AsymptoticFloat(mu_1, self.nu, self.xi)
+        else:
+            return AsymptoticFloat(mu_2, other.nu, other.xi)
+
+    def __radd__(self, other):
+        # The order of the operands matters for the type of the result, e.g. ``max(0, 0.0)`` is ``0``.
+        converted = self._convert(other)
+        if converted is None:
+            return Asymptotic.__add__(other, self)
+        return converted + self
@@ -1,3 +1,5 @@
+from time import perf_counter
+from poisson_approval.events.AsymptoticFloat import AsymptoticFloat
 from poisson_approval.utils.computation_engine import computation_engine
 from poisson_approval.utils.SuperclassMeta import SuperclassMeta
 from poisson_approval.utils.Util import isnan
@@ -21,7 +23,8 @@ class Event(metaclass=SuperclassMeta):
     Attributes
     ----------
     asymptotic : Asymptotic
-        The asymptotic development of the probability of the event when `n` tends to infinity.
+        The asymptotic development of the probability of the event when `n` tends to infinity. In numeric
+        computation, it is an :class:`AsymptoticFloat` whenever possible.
     mu : Number, ``sp.nan``, ``np.nan``, ``- sp.oo`` or ``- np.inf``
         Shortcut for ``asymptotic.mu``.
     nu : Number, ``sp.nan``, ``np.nan``, ``- sp.oo`` or ``- np.inf``
@@ -56,31 +59,29 @@ class Event(metaclass=SuperclassMeta):
         # -------------
         # Preliminaries
         # -------------
+        phase_timer = getattr(tau, 'phase_timer', None)
+        if phase_timer is not None:
+            time_start = perf_counter()
         self.symbolic = tau.symbolic
         self.ce = computation_engine(self.symbolic)
-        # Create labels
-        self._label_x, self._label_y, self._label_z = candidate_x, candidate_y, candidate_z
-        self._label_xy = ''.join(sorted([self._label_x, self._label_y]))
-        self._label_xz = ''.join(sorted([self._label_x, self._label_z]))
-        self._label_yz = ''.join(sorted([self._label_y, self._label_z]))
-        self._label_xyd = self._label_xy[1] + self._label_xy[0]
-        self._label_xzd = self._label_xz[1] + self._label_xz[0]
-        self._label_yzd = self._label_yz[1] + self._label_yz[0]
-        self._labels_std_one = {self._label_x: 'x', self._label_y: 'y', self._label_z: 'z'}
-        self._labels_std_two = {self._label_xy: 'xy', self._label_xz: 'xz', self._label_yz: 'yz'}
-        self._labels_std_two_down = {self._label_xyd: 'xy', self._label_xzd: 'xz', self._label_yzd: 'yz'}
-        self._labels_std = self._labels_std_one.copy()
-        self._labels_std.update(self._labels_std_two)
-        self._labels_std.update(self._labels_std_two_down)
+        # Create labels (shared by all the events based on the same candidates)
+        labels = _get_labels(candidate_x, candidate_y, candidate_z)
+        (self._label_x, self._label_y, self._label_z,
+         self._label_xy, self._label_xz, self._label_yz,
+         self._label_xyd, self._label_xzd, self._label_yzd) = labels['names']
+        self._labels_std_one = labels['std_one']
+        self._labels_std_two = labels['std_two']
+        self._labels_std_two_down = labels['std_two_down']
+        self._labels_std = labels['std']
         # Declare variables to tranquilize PyCharm's syntax checker
         self.tau = tau
         self._tau_x, self._tau_y, self._tau_z = 0, 0, 0
         self._tau_xy, self._tau_xz, self._tau_yz = 0, 0, 0
         # Initialize variables such as self.tau_a and self._tau_x
-        for label, label_std in self._labels_std.items():
-            # Ex: label = 'ab', label_std = 'xy'
-            # The share
-            share = tau.d_ballot_share[sort_ballot(label)]
+        d_ballot_share = tau.d_ballot_share
+        for label, label_std, label_sorted in labels['std_sorted']:
+            # Ex: label = 'ba', label_std = 'xy', label_sorted = 'ab'
+            share = d_ballot_share[label_sorted]
             # Define variable such as self._tau_xy
             setattr(self, '_tau_' + label_std, share)
             # Define variable such as tau_ab
@@ -94,6 +95,9 @@ class Event(metaclass=SuperclassMeta):
         # ------------------------------------------------
         self._compute(tau_x=self._tau_x, tau_y=self._tau_y, tau_z=self._tau_z,
                       tau_xy=self._tau_xy, tau_xz=self._tau_xz, tau_yz=self._tau_yz)
+        if not self.symbolic:
+            # Use the fast version for the operations with this asymptotic development (if possible)
+            self.asymptotic = AsymptoticFloat.from_asymptotic(self.asymptotic)
         self.mu = self.asymptotic.mu
         self.nu = self.asymptotic.nu
         self.xi = self.asymptotic.xi
@@ -132,6 +136,8 @@ class Event(metaclass=SuperclassMeta):
         self.psi[self._label_yzd] = self.psi[self._label_yz]
         for label in self._labels_std.keys():
             setattr(self, 'psi_' + label, self.psi[label])
+        if phase_timer is not None:
+            phase_timer.add('events', perf_counter() - time_start)
 
     def _compute(self, tau_x, tau_y, tau_z, tau_xy, tau_xz, tau_yz):
         """
@@ -160,3 +166,58 @@ class Event(metaclass=SuperclassMeta):
     def _repr_pretty_(self, p, cycle):  # pragma: no cover - Only for notebooks
         # https://stackoverflow.com/questions/41453624/tell-ipython-to-use-an-objects-str-instead-of-repr-for-output
         p.text(str(self) if not cycle else '...')
+
+
+_D_TRIPLE_LABELS = dict()
+
+
+def _get_labels(candidate_x, candidate_y, candidate_z):
+    """Labels used by an event.
+
+    Parameters
+    ----------
+    candidate_x, candidate_y, candidate_z : str
+        The candidates of the event.
+
+    Returns
+    -------
+    dict
+        The labels. They are computed only once for each triple of candidates: the same dictionary is returned at
+        each call (hence it must not be modified).
+
+    Examples
+    --------
+        >>> labels = _get_labels('b', 'a', 'c')
+        >>> labels['names']
+        ('b', 'a', 'c', 'ab', 'bc', 'ac', 'ba', 'cb', 'ca')
+        >>> labels['std']
+        {'b': 'x', 'a': 'y', 'c': 'z', 'ab': 'xy', 'bc': 'xz', 'ac': 'yz', 'ba': 'xy', 'cb': 'xz', 'ca': 'yz'}
+        >>> _get_labels('b', 'a', 'c') is labels
+        True
+    """
+    try:
+        return _D_TRIPLE_LABELS[(candidate_x, candidate_y, candidate_z)]
+    except KeyError:
+        pass
+    label_xy = ''.join(sorted([candidate_x, candidate_y]))
+    label_xz = ''.join(sorted([candidate_x, candidate_z]))
+    label_yz = ''.join(sorted([candidate_y, candidate_z]))
+    label_xyd = label_xy[1] + label_xy[0]
+    label_xzd = label_xz[1] + label_xz[0]
+    label_yzd = label_yz[1] + label_yz[0]
+    labels_std_one = {candidate_x: 'x', candidate_y: 'y', candidate_z: 'z'}
+    labels_std_two = {label_xy: 'xy', label_xz: 'xz', label_yz: 'yz'}
+    labels_std_two_down = {label_xyd: 'xy', label_xzd: 'xz', label_yzd: 'yz'}
+    labels_std = labels_std_one.copy()
+    labels_std.update(labels_std_two)
+    labels_std.update(labels_std_two_down)
+    labels = {
+        'names': (candidate_x, candidate_y, candidate_z, label_xy, label_xz, label_yz, label_xyd, label_xzd, label_yzd),
+        'std_one': labels_std_one,
+        'std_two': labels_std_two,
+        'std_two_down': labels_std_two_down,
+        'std': labels_std,
+        'std_sorted': [(label, label_std, sort_ballot(label)) for label, label_std in labels_std.items()]
+    }
+    _D_TRIPLE_LABELS[(candidate_x, candidate_y, candidate_z)] = labels
+    return labels
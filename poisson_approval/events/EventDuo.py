@@ -1,4 +1,3 @@
-from poisson_approval.events.Asymptotic import Asymptotic
 from poisson_approval.events.Event import Event
 
 
@@ -23,12 +22,10 @@ class EventDuo(Event):
 
     def _compute(self, tau_x, tau_y, tau_z, tau_xy, tau_xz, tau_yz):
         ce = self.ce
-        w_x = ce.S(tau_x + tau_xz)
-        w_y = ce.S(tau_y + tau_yz)
-        self.asymptotic = Asymptotic.poisson_eq(w_x, w_y, symbolic=self.symbolic)
-        self._phi_x = ce.simplify(ce.sqrt(w_y / w_x)) if tau_x > 0 else ce.nan
-        self._phi_xz = ce.simplify(ce.sqrt(w_y / w_x)) if tau_xz > 0 else ce.nan
-        self._phi_y = ce.simplify(ce.sqrt(w_x / w_y)) if tau_y > 0 else ce.nan
-        self._phi_yz = ce.simplify(ce.sqrt(w_x / w_y)) if tau_yz > 0 else ce.nan
+        _, _, self.asymptotic, ratio_x, ratio_y = self.tau._duo_terms(self._label_x, self._label_y)
+        self._phi_x = ratio_x if tau_x > 0 else ce.nan
+        self._phi_xz = ratio_x if tau_xz > 0 else ce.nan
+        self._phi_y = ratio_y if tau_y > 0 else ce.nan
+        self._phi_yz = ratio_y if tau_yz > 0 else ce.nan
         self._phi_z = ce.simplify(ce.S(1)) if tau_z > 0 else ce.nan
         self._phi_xy = ce.simplify(ce.S(1)) if tau_xy > 0 else ce.nan
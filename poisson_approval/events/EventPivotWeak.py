@@ -52,29 +52,29 @@ class EventPivotWeak(Event):
                 self._phi_xy = ce.simplify(ce.sqrt(ce.S(tau_z) / tau_xy)) if tau_xy > 0 else ce.nan
                 self._phi_z = ce.simplify(ce.sqrt(ce.S(tau_xy) / tau_z)) if tau_z > 0 else ce.nan
         else:
-            w_x = ce.S(tau_x + tau_xz)  # > 0
-            w_y = ce.S(tau_y + tau_yz)  # > 0
-            s_x = ce.simplify(tau_xy + tau_x * ce.sqrt(ce.S(w_y) / w_x))
-            s_z = ce.simplify(tau_z + tau_yz * ce.sqrt(ce.S(w_x) / w_y))
+            # w_x > 0 and w_y > 0
+            _, _, asymptotic_duo, ratio_x, ratio_y = self.tau._duo_terms(self._label_x, self._label_y)
+            s_x = ce.simplify(tau_xy + tau_x * ratio_x)
+            s_z = ce.simplify(tau_z + tau_yz * ratio_y)
             if ce.look_equal(s_x, s_z):
                 if tau_z != 0 or tau_xy != 0 or (tau_x != 0 and tau_y != 0 and tau_xz != 0 and tau_yz != 0):
-                    self.asymptotic = Asymptotic.poisson_eq(w_x, w_y, symbolic=self.symbolic) / 2
+                    self.asymptotic = asymptotic_duo / 2
                 else:
-                    self.asymptotic = Asymptotic.poisson_eq(w_x, w_y, symbolic=self.symbolic)
-                self._phi_x = ce.simplify(ce.sqrt(ce.S(w_y) / w_x)) if tau_x > 0 else ce.nan
-                self._phi_xz = ce.simplify(ce.sqrt(ce.S(w_y) / w_x)) if tau_xz > 0 else ce.nan
-                self._phi_y = ce.simplify(ce.sqrt(ce.S(w_x) / w_y)) if tau_y > 0 else ce.nan
-                self._phi_yz = ce.simplify(ce.sqrt(ce.S(w_x) / w_y)) if tau_yz > 0 else ce.nan
+                    self.asymptotic = asymptotic_duo
+                self._phi_x = ratio_x if tau_x > 0 else ce.nan
+                self._phi_xz = ratio_x if tau_xz > 0 else ce.nan
+                self._phi_y = ratio_y if tau_y > 0 else ce.nan
+                self._phi_yz = ratio_y if tau_yz > 0 else ce.nan
                 self._phi_z = ce.S(1) if tau_z > 0 else ce.nan
                 self._phi_xy = ce.S(1) if tau_xy > 0 else ce.nan
             elif s_x > s_z:
                 # "Easy" pivot
                 # P(piv_ab) ~ P(S_a = S_b)
-                self.asymptotic = Asymptotic.poisson_eq(w_x, w_y, symbolic=self.symbolic)
-                self._phi_x = ce.simplify(ce.sqrt(ce.S(w_y) / w_x)) if tau_x > 0 else ce.nan
-                self._phi_xz = ce.simplify(ce.sqrt(ce.S(w_y) / w_x)) if tau_xz > 0 else ce.nan
-                self._phi_y = ce.simplify(ce.sqrt(ce.S(w_x) / w_y)) if tau_y > 0 else ce.nan
-                self._phi_yz = ce.simplify(ce.sqrt(ce.S(w_x) / w_y)) if tau_yz > 0 else ce.nan
+                self.asymptotic = asymptotic_duo
+                self._phi_x = ratio_x if tau_x > 0 else ce.nan
+                self._phi_xz = ratio_x if tau_xz > 0 else ce.nan
+                self._phi_y = ratio_y if tau_y > 0 else ce.nan
+                self._phi_yz = ratio_y if tau_yz > 0 else ce.nan
                 self._phi_z = ce.S(1) if tau_z > 0 else ce.nan
                 self._phi_xy = ce.S(1) if tau_xy > 0 else ce.nan
             else:
@@ -83,13 +83,25 @@ class EventTrio(Event):
             inf, sup, start = self._get_bounds_and_start(tau_x_f, tau_y_f, tau_z_f,
                                                          tau_xy_f, tau_xz_f, tau_yz_f)
             # Let's go for the actual computation
-            optimizer = minimize(
-                lambda x: 2 * np.sqrt(
-                    (tau_x_f * x + tau_xz_f) * (tau_yz_f / x + tau_y_f)
-                ) + tau_xy_f * x + tau_z_f / x - 1,
-                start,
-                bounds=[(inf, sup)]
-            )
+
+            def objective(x):
+                return 2 * np.sqrt((tau_x_f * x + tau_xz_f) * (tau_yz_f / x + tau_y_f)) + tau_xy_f * x + tau_z_f / x - 1
+
+            warm_start = getattr(self.tau, 'trio_warm_start', None)
+            if warm_start is None:
+                optimizer = minimize(objective, start, bounds=[(inf, sup)])
+            else:
+                triple = (self._label_x, self._label_y, self._label_z)
+                actual_start = warm_start.start(triple, inf, sup, start)
+                optimizer = minimize(objective, actual_start, bounds=[(inf, sup)])
+                n_iterations_cold_start = None
+                if warm_start.compare_with_cold_start and actual_start != start:
+                    n_iterations_cold_start = minimize(objective, start, bounds=[(inf, sup)]).nit
+                warm_start.record(triple, x_2=float(optimizer.x[0]), n_iterations=optimizer.nit,
+                                  warm=actual_start != start, n_iterations_cold_start=n_iterations_cold_start)
+            phase_timer = getattr(self.tau, 'phase_timer', None)
+            if phase_timer is not None:
+                phase_timer.add_optimization(optimizer.nit)
             self.asymptotic = Asymptotic(mu=ce.S(float(optimizer.fun)), nu=ce.nan, xi=ce.nan, symbolic=self.symbolic)
             x_2 = ce.S(optimizer.x[0])
             x_1 = ce.simplify(ce.sqrt((ce.S(tau_yz) / x_2 + tau_y) / (tau_x * x_2 + tau_xz)))
@@ -193,3 +205,125 @@ class EventTrio(Event):
         if inf == 0:
             inf = SAFETY_EPSILON
         return inf, sup, start
+
+    @classmethod
+    def optimize_batch(cls, tau_x, tau_y, tau_z, tau_xy, tau_xz, tau_yz, inf, sup, start=None,
+                       x_tol=1e-13, max_iterations=100):
+        """Solve the optimization problem of the generic case for many trios at once.
+
+        Parameters
+        ----------
+        tau_x, tau_y, tau_z, tau_xy, tau_xz, tau_yz : array_like
+            Arrays of shape ``(n,)``: the shares of the ballots, for each trio.
+        inf, sup : array_like
+            Arrays of shape ``(n,)``: the bounds for ``x_2``, as given by :meth:`_get_bounds_and_start`. The value of
+            `sup` may be ``np.inf``.
+        start : array_like, optional
+            Arrays of shape ``(n,)``: the starting points (e.g. as given by :meth:`_get_bounds_and_start`). Default:
+            the geometric mean of `inf` and `sup` (or a point near the finite bound if `sup` is infinite).
+        x_tol : float
+            Tolerance on ``log(x_2)``.
+        max_iterations : int
+            Maximal number of iterations.
+
+        Returns
+        -------
+        dict
+            Each value is an array of shape ``(n,)``.
+
+            * Key ``'mu'``: the magnitude of the trio.
+            * Keys ``'x_1'``, ``'x_2'``: the optimal values of the auxiliary variables.
+            * Keys ``'phi_x'``, ``'phi_y'``, ``'phi_z'``, ``'phi_xy'``, ``'phi_xz'``, ``'phi_yz'``: the offsets (nan
+              where the corresponding share is 0).
+            * Keys ``'psi_x'``, etc.: the pseudo-offsets.
+            * Key ``'n_iterations'``: the number of iterations used for each trio.
+
+        Notes
+        -----
+        With ``x_2 = exp(s)``, the objective of the generic case in :meth:`_compute` is a convex function of `s`. We
+        use a safeguarded Newton method on `s`: each Newton step that falls outside the current bracket is replaced
+        by a bisection step, and the bracket shrinks at each iteration. All the trios are processed together with
+        `numpy` operations; the trios that have converged are masked out.
+
+        Examples
+        --------
+            >>> res = EventTrio.optimize_batch(
+            ...     tau_x=[0.1, 0.2], tau_y=[0.2, 0.1], tau_z=[0.3, 0.05], tau_xy=[0.1, 0.25], tau_xz=[0.2, 0.3],
+            ...     tau_yz=[0.1, 0.1], inf=[1e-12, 1e-12], sup=[np.inf, np.inf])
+            >>> print(np.round(res['mu'], 6))
+            [-0.039011 -0.100078]
+            >>> print(np.round(res['x_2'], 6))
+            [1.486041 0.674184]
+        """
+        tau_x, tau_y, tau_z = (np.asarray(tau, dtype=float) for tau in (tau_x, tau_y, tau_z))
+        tau_xy, tau_xz, tau_yz = (np.asarray(tau, dtype=float) for tau in (tau_xy, tau_xz, tau_yz))
+        inf = np.asarray(inf, dtype=float)
+        sup = np.asarray(sup, dtype=float)
+        # The objective is 2 * sqrt(p_0 + p_plus * exp(s) + p_minus * exp(-s)) + tau_xy * exp(s) + tau_z * exp(-s) - 1.
+        p_0 = tau_x * tau_yz + tau_xz * tau_y
+        p_plus = tau_x * tau_y
+        p_minus = tau_xz * tau_yz
+
+        def derivatives(s, mask):
+            e_plus, e_minus = np.exp(s), np.exp(- s)
+            p = p_0[mask] + p_plus[mask] * e_plus + p_minus[mask] * e_minus
+            dp = p_plus[mask] * e_plus - p_minus[mask] * e_minus
+            ddp = p_plus[mask] * e_plus + p_minus[mask] * e_minus
+            sqrt_p = np.sqrt(p)
+            d1 = dp / sqrt_p + tau_xy[mask] * e_plus - tau_z[mask] * e_minus
+            d2 = ddp / sqrt_p - dp ** 2 / (2 * p * sqrt_p) + tau_xy[mask] * e_plus + tau_z[mask] * e_minus
+            return d1, d2
+
+        n = tau_x.shape[0]
+        low = np.log(inf)
+        high = np.log(sup)
+        # Find a finite upper bound of the bracket where it is infinite.
+        unbounded = np.isposinf(high)
+        high[unbounded] = np.maximum(low[unbounded], 0) + 1
+        for _ in range(64):
+            if not np.any(unbounded):
+                break
+            d1, _ = derivatives(high[unbounded], unbounded)
+            still_decreasing = d1 < 0
+            indexes = np.flatnonzero(unbounded)
+            low[indexes[still_decreasing]] = high[indexes[still_decreasing]]
+            high[indexes[still_decreasing]] = 2 * high[indexes[still_decreasing]] + 1
+            unbounded[indexes[~ still_decreasing]] = False
+        # Starting point.
+        if start is None:
+            s = (low + high) / 2
+        else:
+            s = np.clip(np.log(np.asarray(start, dtype=float)), low, high)
+        # Safeguarded Newton method.
+        n_iterations = np.zeros(n, dtype=int)
+        active = high - low > x_tol
+        for _ in range(max_iterations):
+            if not np.any(active):
+                break
+            indexes = np.flatnonzero(active)
+            s_active, low_active, high_active = s[indexes], low[indexes], high[indexes]
+            d1, d2 = derivatives(s_active, active)
+            low_active = np.where(d1 < 0, s_active, low_active)
+            high_active = np.where(d1 > 0, s_active, high_active)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                s_newton = s_active - d1 / d2
+            use_bisection = ~ ((d2 > 0) & (s_newton > low_active) & (s_newton < high_active))
+            s_new = np.where(use_bisection, (low_active + high_active) / 2, s_newton)
+            s_new = np.where(d1 == 0, s_active, s_new)
+            converged = (np.abs(s_new - s_active) <= x_tol) | (high_active - low_active <= x_tol) | (d1 == 0)
+            s[indexes], low[indexes], high[indexes] = s_new, low_active, high_active
+            n_iterations[indexes] += 1
+            active[indexes[converged]] = False
+        # Conclude.
+        x_2 = np.exp(s)
+        mu = (2 * np.sqrt((tau_x * x_2 + tau_xz) * (tau_yz / x_2 + tau_y)) + tau_xy * x_2 + tau_z / x_2 - 1)
+        x_1 = np.sqrt((tau_yz / x_2 + tau_y) / (tau_x * x_2 + tau_xz))
+        results = {
+            'mu': mu, 'x_1': x_1, 'x_2': x_2,
+            'psi_x': x_1 * x_2, 'psi_y': 1 / x_1, 'psi_z': 1 / x_2,
+            'psi_xy': x_2, 'psi_xz': x_1, 'psi_yz': 1 / (x_1 * x_2),
+            'n_iterations': n_iterations
+        }
+        for label, tau in [('x', tau_x), ('y', tau_y), ('z', tau_z), ('xy', tau_xy), ('xz', tau_xz), ('yz', tau_yz)]:
+            results['phi_' + label] = np.where(tau > 0, results['psi_' + label], np.nan)
+        return results
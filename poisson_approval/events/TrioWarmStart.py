@@ -0,0 +1,131 @@
+class TrioWarmStart:
+    """Warm start for the optimization in :class:`EventTrio` (generic case).
+
+    Parameters
+    ----------
+    compare_with_cold_start : bool
+        If True, each optimization is also run from the usual (cold) starting point, in order to measure exactly the
+        number of iterations saved. This doubles the cost of the optimizations, so it is meant for benchmarks only.
+
+    Attributes
+    ----------
+    d_triple_x_2 : dict
+        Key: a triple of candidates, e.g. ``('a', 'b', 'c')``. Value: the last optimal value of ``x_2`` found for this
+        triple.
+    n_optimizations : int
+        Number of optimizations performed.
+    n_warm_starts : int
+        Number of optimizations that used a warm start, i.e. where the previous value of ``x_2`` was inside the new
+        bounds.
+    n_iterations : int
+        Total number of iterations of the optimizer.
+    n_iterations_cold_start : int
+        Total number of iterations that the optimizer would have used with the usual starting point. Only computed if
+        `compare_with_cold_start` is True (otherwise it is None).
+
+    Notes
+    -----
+    When a :class:`TauVector` has a `trio_warm_start`, its trio events use the previous optimal value of ``x_2`` for
+    the same triple of candidates as the starting point of the optimizer, provided it lies inside the bounds given by
+    :meth:`EventTrio._get_bounds_and_start`. This is useful when computing the events of successive tau-vectors that
+    are close to each other, e.g. in :meth:`~poisson_approval.ProfileCardinal.fictitious_play`.
+
+    Examples
+    --------
+        >>> from poisson_approval import TauVector
+        >>> warm_start = TrioWarmStart(compare_with_cold_start=True)
+        >>> tau = TauVector({'a': 0.1, 'b': 0.2, 'c': 0.3, 'ab': 0.1, 'ac': 0.2, 'bc': 0.1},
+        ...                 trio_warm_start=warm_start)
+        >>> print(round(tau.trio.mu, 6))
+        -0.039011
+        >>> tau = TauVector({'a': 0.1, 'b': 0.2, 'c': 0.3, 'ab': 0.1, 'ac': 0.19, 'bc': 0.11},
+        ...                 trio_warm_start=warm_start)
+        >>> print(round(tau.trio.mu, 6))
+        -0.040308
+        >>> warm_start.n_optimizations
+        2
+        >>> warm_start.n_warm_starts
+        1
+        >>> warm_start.n_iterations_saved >= 0
+        True
+    """
+
+    def __init__(self, compare_with_cold_start=False):
+        self.compare_with_cold_start = compare_with_cold_start
+        self.d_triple_x_2 = dict()
+        self.n_optimizations = 0
+        self.n_warm_starts = 0
+        self.n_iterations = 0
+        self.n_iterations_cold_start = 0 if compare_with_cold_start else None
+
+    def __repr__(self):
+        s = '<n_optimizations = %s, n_warm_starts = %s, n_iterations = %s' % (
+            self.n_optimizations, self.n_warm_starts, self.n_iterations)
+        if self.compare_with_cold_start:
+            s += ', n_iterations_cold_start = %s' % self.n_iterations_cold_start
+        return s + '>'
+
+    def start(self, triple, inf, sup, start):
+        """Starting point of the optimizer.
+
+        Parameters
+        ----------
+        triple : tuple
+            The triple of candidates, e.g. ``('a', 'b', 'c')``.
+        inf, sup, start : float
+            The bounds and the usual starting point, as given by :meth:`EventTrio._get_bounds_and_start`.
+
+        Returns
+        -------
+        float
+            The previous optimal value of ``x_2`` for this triple if it lies inside ``[inf, sup]``, and `start`
+            otherwise.
+
+        Examples
+        --------
+            >>> warm_start = TrioWarmStart()
+            >>> warm_start.start(('a', 'b', 'c'), inf=1, sup=2, start=1.5)
+            1.5
+            >>> warm_start.record(('a', 'b', 'c'), x_2=1.2, n_iterations=5, warm=False)
+            >>> warm_start.start(('a', 'b', 'c'), inf=1, sup=2, start=1.5)
+            1.2
+            >>> warm_start.start(('a', 'b', 'c'), inf=1.3, sup=float('inf'), start=2.6)
+            2.6
+        """
+        x_2 = self.d_triple_x_2.get(triple)
+        if x_2 is not None and inf <= x_2 <= sup:
+            return x_2
+        return start
+
+    def record(self, triple, x_2, n_iterations, warm, n_iterations_cold_start=None):
+        """Record the result of an optimization.
+
+        Parameters
+        ----------
+        triple : tuple
+            The triple of candidates, e.g. ``('a', 'b', 'c')``.
+        x_2 : float
+            The optimal value of ``x_2``.
+        n_iterations : int
+            The number of iterations of the optimizer.
+        warm : bool
+            Whether the optimization used a warm start.
+        n_iterations_cold_start : int, optional
+            The number of iterations with the usual starting point (only used if `compare_with_cold_start` is True).
+        """
+        self.d_triple_x_2[triple] = x_2
+        self.n_optimizations += 1
+        self.n_iterations += n_iterations
+        if warm:
+            self.n_warm_starts += 1
+        if self.compare_with_cold_start:
+            self.n_iterations_cold_start += n_iterations if n_iterations_cold_start is None else n_iterations_cold_start
+
+    @property
+    def n_iterations_saved(self):
+        """int or None : Number of iterations saved by the warm starts. Only available if `compare_with_cold_start`
+        is True (otherwise it is None).
+        """
+        if not self.compare_with_cold_start:
+            return None
+        return self.n_iterations_cold_start - self.n_iterations
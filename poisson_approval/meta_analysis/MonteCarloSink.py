@@ -0,0 +1,295 @@
+import hashlib
+import json
+import os
+import pickle
+import numpy as np
+from poisson_approval.meta_analysis.monte_carlo_fictitious_play import _merge_settings, _empty_meta_results, \
+    _final_processing, _store
+
+
+class MonteCarloSink:
+    """Chunked, append-only storage on the disk for :func:`monte_carlo_fictitious_play`.
+
+    The statistics of the samples are written in a directory, by chunks of `chunk_size` samples. Each chunk is a
+    ``.npz`` file (only `numpy` is needed), which is written atomically: if a run is interrupted, all the chunks
+    already written are complete, and the run can be resumed from the last of them.
+
+    The directory also contains a manifest (``manifest.json``), which records the voting rules, the names of the
+    statistics, the seed and the other parameters of the run (the factory, the number of episodes, etc.). When a run
+    is resumed, they are checked against the manifest (cf.
+    :meth:`check_manifest`), so that the samples of different studies are not mixed up.
+
+    Parameters
+    ----------
+    directory : str
+        The directory of the chunks. It is created if necessary.
+    chunk_size : int
+        The number of samples per chunk.
+
+    Notes
+    -----
+    In each chunk, a statistic is stored as a `numpy` array of numbers when all its values are numbers or `numpy`
+    arrays of the same shape. Otherwise (e.g. for dictionaries or None), it is stored as an array of objects, which
+    are pickled.
+
+    Examples
+    --------
+        >>> import tempfile
+        >>> from poisson_approval import RandProfileHistogramUniform, MCS_CONVERGES, monte_carlo_fictitious_play
+        >>> with tempfile.TemporaryDirectory() as directory:
+        ...     sink = MonteCarloSink(directory, chunk_size=2)
+        ...     # A run that is interrupted after 3 samples...
+        ...     _ = monte_carlo_fictitious_play(
+        ...         factory=RandProfileHistogramUniform(n_bins=1), n_samples=3, n_max_episodes=10,
+        ...         monte_carlo_settings=[MCS_CONVERGES], seed=42, sink=sink)
+        ...     print(sink)
+        ...     # ... is resumed to reach 5 samples.
+        ...     meta_results = monte_carlo_fictitious_play(
+        ...         factory=RandProfileHistogramUniform(n_bins=1), n_samples=5, n_max_episodes=10,
+        ...         monte_carlo_settings=[MCS_CONVERGES], seed=42, sink=sink)
+        ...     print(sink)
+        <n_chunks = 2, n_samples = 3>
+        <n_chunks = 3, n_samples = 5>
+        >>> meta_results['']['n_samples']
+        5
+        >>> len(meta_results['']['converges'])
+        5
+    """
+
+    def __init__(self, directory, chunk_size=1000):
+        self.directory = directory
+        self.chunk_size = chunk_size
+        os.makedirs(directory, exist_ok=True)
+        self._n_samples = None
+
+    def __repr__(self):
+        return '<n_chunks = %s, n_samples = %s>' % (self.n_chunks, self.n_samples)
+
+    @property
+    def file_names(self):
+        """list of str : The files of the completed chunks, in the order where they were written."""
+        return [os.path.join(self.directory, file_name) for file_name in sorted(os.listdir(self.directory))
+                if file_name.startswith('chunk_') and file_name.endswith('.npz')]
+
+    @property
+    def n_chunks(self):
+        """int : Number of completed chunks."""
+        return len(self.file_names)
+
+    @property
+    def n_samples(self):
+        """int : Number of samples in the completed chunks.
+
+        The chunks are read only the first time; then the number is updated by :meth:`write_chunk`.
+        """
+        if self._n_samples is None:
+            self._n_samples = 0
+            for file_name in self.file_names:
+                with np.load(file_name) as data:
+                    self._n_samples += int(data['n_samples'])
+        return self._n_samples
+
+    @property
+    def file_name_manifest(self):
+        """str : The file of the manifest."""
+        return os.path.join(self.directory, 'manifest.json')
+
+    def check_manifest(self, voting_rules, statistic_names, seed, run_parameters=None):
+        """Check that a run matches the manifest of the sink, or write the manifest if there is none.
+
+        Parameters
+        ----------
+        voting_rules : list
+            The voting rules of the run.
+        statistic_names : iterable of str
+            The names of the statistics that are stored for each sample.
+        seed : int or None
+            The root seed of the run.
+        run_parameters : dict, optional
+            The other parameters of the run, e.g. ``{'n_max_episodes': 100, 'factory': factory}``. The numbers, strings,
+            booleans and None are recorded as they are, and the other objects by a fingerprint (cf.
+            :func:`_fingerprint`).
+
+        Raises
+        ------
+        ValueError
+            If the sink already has a manifest that does not match these parameters.
+
+        Examples
+        --------
+            >>> import tempfile
+            >>> with tempfile.TemporaryDirectory() as directory:
+            ...     sink = MonteCarloSink(directory)
+            ...     sink.check_manifest(voting_rules=['Approval'], statistic_names=['converges'], seed=42)
+            ...     sink.check_manifest(voting_rules=['Approval'], statistic_names=['converges'], seed=42)
+            ...     sink.check_manifest(voting_rules=['Approval'], statistic_names=['converges'], seed=0)
+            Traceback (most recent call last):
+            ValueError: The sink contains another study: expected seed = 42, got 0.
+            >>> with tempfile.TemporaryDirectory() as directory:
+            ...     sink = MonteCarloSink(directory)
+            ...     sink.check_manifest(voting_rules=['Approval'], statistic_names=['converges'], seed=42,
+            ...                         run_parameters={'n_max_episodes': 100})
+            ...     sink.check_manifest(voting_rules=['Approval'], statistic_names=['converges'], seed=42,
+            ...                         run_parameters={'n_max_episodes': 10})
+            Traceback (most recent call last):
+            ValueError: The sink contains another study: expected n_max_episodes = 100, got 10.
+        """
+        manifest = {'voting_rules': list(voting_rules), 'statistic_names': sorted(statistic_names),
+                    'seed': None if seed is None else int(seed)}
+        if run_parameters is not None:
+            manifest.update({key: _fingerprint(value) for key, value in run_parameters.items()})
+        if not os.path.exists(self.file_name_manifest):
+            with open(self.file_name_manifest + '.tmp', 'w') as f:
+                json.dump(manifest, f)
+            os.replace(self.file_name_manifest + '.tmp', self.file_name_manifest)
+            return
+        with open(self.file_name_manifest) as f:
+            manifest_sink = json.load(f)
+        for key, value in manifest.items():
+            if manifest_sink.get(key) != value:
+                raise ValueError('The sink contains another study: expected %s = %s, got %s.'
+                                 % (key, manifest_sink.get(key), value))
+
+    def write_chunk(self, samples, voting_rules):
+        """Write a chunk.
+
+        Parameters
+        ----------
+        samples : list of dict
+            Each sample is a dictionary. Key: voting rule. Value: a dictionary whose keys are the names of the
+            statistics and whose values are the values of these statistics for this sample.
+        voting_rules : list
+            The voting rules.
+        """
+        samples = list(samples)
+        columns = {'n_samples': np.array(len(samples)), 'voting_rules': np.array(voting_rules, dtype=object)}
+        for voting_rule in voting_rules:
+            statistic_names = samples[0][voting_rule].keys() if samples else []
+            for statistic_name in statistic_names:
+                columns['%s|%s' % (voting_rule, statistic_name)] = _to_column(
+                    [sample[voting_rule][statistic_name] for sample in samples])
+        file_name = os.path.join(self.directory, 'chunk_%06d.npz' % self.n_chunks)
+        # Write in a temporary file first, so that a chunk file is always complete
+        with open(file_name + '.tmp', 'wb') as f:
+            np.savez(f, **columns)
+        os.replace(file_name + '.tmp', file_name)
+        self._n_samples = self.n_samples + len(samples)
+
+    def load(self, monte_carlo_settings=None, columnar=False, online=False, n_samples=None):
+        """Reassemble the meta-results.
+
+        Parameters
+        ----------
+        monte_carlo_settings : list of MonteCarloSetting
+            The settings of the run. They are used for the final processing (cf. ``statistics_final_processing`` in
+            :class:`MonteCarloSetting`). If None, there is no final processing.
+        columnar : bool
+            If True, the statistics whose dtype and shape are declared in the settings are converted to `numpy`
+            arrays. Cf. the option `columnar` of :func:`monte_carlo_fictitious_play`.
+        online : bool
+            If True, the statistics that declare an accumulator in the settings are aggregated, one chunk at a time.
+            Cf. the option `online` of :func:`monte_carlo_fictitious_play`.
+        n_samples : int, optional
+            If given, only the first `n_samples` samples are loaded (e.g. when the sink contains more samples than
+            requested by the current run). By default, all the samples are loaded.
+
+        Returns
+        -------
+        dict
+            The meta-results, as returned by :func:`monte_carlo_fictitious_play`.
+        """
+        file_names = self.file_names
+        if not file_names:
+            return {}
+        n_samples = self.n_samples if n_samples is None else min(n_samples, self.n_samples)
+        with np.load(file_names[0], allow_pickle=True) as data:
+            voting_rules = list(data['voting_rules'])
+        meta_results = _empty_meta_results(voting_rules, monte_carlo_settings, n_samples, columnar, online)
+        i_start = 0
+        for file_name in file_names:
+            if i_start >= n_samples:
+                break
+            with np.load(file_name, allow_pickle=True) as data:
+                n_samples_chunk = min(int(data['n_samples']), n_samples - i_start)
+                for key in data.files:
+                    if '|' not in key:
+                        continue
+                    voting_rule, _, statistic_name = key.partition('|')
+                    column = data[key][:n_samples_chunk]
+                    for i, value in enumerate(column.tolist() if column.dtype == object else column):
+                        _store(meta_results[voting_rule], statistic_name, i_start + i, value)
+                i_start += n_samples_chunk
+        _final_processing(meta_results, n_samples, _merge_settings(monte_carlo_settings)[3])
+        return meta_results
+
+
+def _fingerprint(value):
+    """Fingerprint of a parameter, for the manifest.
+
+    Parameters
+    ----------
+    value : object
+        A parameter of the run.
+
+    Returns
+    -------
+    object
+        The value itself if it is a number, a string, a boolean or None. Otherwise, the SHA-256 hash of its pickle if
+        it can be pickled (so that two equal objects have the same fingerprint, whatever their memory address), or
+        else its qualified name (for a function) or its representation.
+
+    Examples
+    --------
+        >>> _fingerprint(100)
+        100
+        >>> from poisson_approval import RandProfileHistogramUniform
+        >>> _fingerprint(RandProfileHistogramUniform(n_bins=1)) == _fingerprint(RandProfileHistogramUniform(n_bins=1))
+        True
+        >>> _fingerprint(RandProfileHistogramUniform(n_bins=1)) == _fingerprint(RandProfileHistogramUniform(n_bins=2))
+        False
+        >>> _fingerprint(lambda t: 1 / t)
+        'poisson_approval.meta_analysis.MonteCarloSink.<lambda>'
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    try:
+        return 'sha256:' + hashlib.sha256(pickle.dumps(value, protocol=4)).hexdigest()
+    except (pickle.PicklingError, AttributeError, TypeError):
+        pass
+    if hasattr(value, '__qualname__'):
+        return '%s.%s' % (getattr(value, '__module__', ''), value.__qualname__)
+    return repr(value)
+
+
+def _to_column(values):
+    """Convert the values of a statistic to a `numpy` array.
+
+    Parameters
+    ----------
+    values : list
+        The values of the statistic.
+
+    Returns
+    -------
+    numpy.ndarray
+        An array of numbers if all the values are numbers or `numpy` arrays of the same shape, otherwise a
+        one-dimensional array of objects.
+
+    Examples
+    --------
+        >>> _to_column([1.5, 2.5]).dtype
+        dtype('float64')
+        >>> _to_column([{'a': 1}, None]).dtype
+        dtype('O')
+    """
+    if all(isinstance(value, (bool, int, float, np.number, np.bool_, np.ndarray)) for value in values):
+        try:
+            column = np.array(values)
+        except ValueError:
+            column = None
+        if column is not None and column.dtype != object:
+            return column
+    column = np.empty(len(values), dtype=object)
+    for i, value in enumerate(values):
+        column[i] = value
+    return column
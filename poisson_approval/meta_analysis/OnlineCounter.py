@@ -0,0 +1,46 @@
+from collections import Counter
+
+
+class OnlineCounter:
+    """Counter of the values of a statistic, e.g. a boolean or the focus of an equilibrium.
+
+    The memory depends only on the number of distinct values, not on the number of values.
+
+    Attributes
+    ----------
+    n : int
+        Number of values added so far.
+    counts : Counter
+        Key: a value. Value: the number of times it was added.
+
+    Examples
+    --------
+        >>> accumulator = OnlineCounter()
+        >>> for value in [True, False, True, None]:
+        ...     accumulator.add(value)
+        >>> accumulator
+        <n = 4, frequencies = {True: 0.5, False: 0.25, None: 0.25}>
+    """
+
+    def __init__(self):
+        self.n = 0
+        self.counts = Counter()
+
+    def __repr__(self):
+        return '<n = %s, frequencies = %s>' % (self.n, self.frequencies)
+
+    def add(self, value):
+        """Add a value.
+
+        Parameters
+        ----------
+        value : object
+            The value. It must be hashable.
+        """
+        self.n += 1
+        self.counts[value] += 1
+
+    @property
+    def frequencies(self):
+        """dict : Key: a value. Value: the proportion of the values that are equal to it."""
+        return {k: v / self.n for k, v in self.counts.items()}
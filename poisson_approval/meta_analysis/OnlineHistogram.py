@@ -0,0 +1,53 @@
+import numpy as np
+
+
+class OnlineHistogram:
+    """Histogram of a statistic with fixed bins, with a memory that does not depend on the number of values.
+
+    Parameters
+    ----------
+    bins : array-like
+        The edges of the bins, in increasing order. Cf. the function ``histogram`` of `numpy`: all bins but the last
+        are half-open, and the values outside the range of the bins are not counted in `counts`.
+
+    Attributes
+    ----------
+    n : int
+        Number of values added so far.
+    counts : numpy.ndarray
+        Number of values in each bin. If a value is an array, each of its coordinates is counted.
+
+    Examples
+    --------
+        >>> accumulator = OnlineHistogram(bins=np.linspace(0, 1, 5))
+        >>> for value in [0.1, 0.2, 0.6, 1]:
+        ...     accumulator.add(value)
+        >>> accumulator
+        <n = 4, counts = [2 0 1 1]>
+        >>> accumulator.frequencies
+        array([0.5 , 0.  , 0.25, 0.25])
+    """
+
+    def __init__(self, bins):
+        self.bins = np.asarray(bins)
+        self.n = 0
+        self.counts = np.zeros(len(self.bins) - 1, dtype=int)
+
+    def __repr__(self):
+        return '<n = %s, counts = %s>' % (self.n, self.counts)
+
+    def add(self, value):
+        """Add a value.
+
+        Parameters
+        ----------
+        value : Number or array-like
+            The value.
+        """
+        self.n += 1
+        self.counts += np.histogram(value, bins=self.bins)[0]
+
+    @property
+    def frequencies(self):
+        """numpy.ndarray : Proportion of the counted values in each bin."""
+        return self.counts / self.counts.sum()
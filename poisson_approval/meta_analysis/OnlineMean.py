@@ -0,0 +1,77 @@
+import numpy as np
+
+
+class OnlineMean:
+    """Running mean and variance of a statistic, with a memory that does not depend on the number of values.
+
+    The values can be numbers or `numpy` arrays of the same shape (the mean and the variance are then computed
+    coordinate-wise). The update uses Welford's algorithm, which is numerically stable.
+
+    Attributes
+    ----------
+    n : int
+        Number of values added so far.
+
+    Examples
+    --------
+        >>> accumulator = OnlineMean()
+        >>> for value in [1, 2, 3, 4]:
+        ...     accumulator.add(value)
+        >>> accumulator
+        <n = 4, mean = 2.5, variance = 1.6666666666666667>
+
+        With arrays:
+
+        >>> accumulator = OnlineMean()
+        >>> accumulator.add([0, 1, 0])
+        >>> accumulator.add([0, 0, 1])
+        >>> accumulator.mean
+        array([0. , 0.5, 0.5])
+        >>> accumulator.is_binary
+        array([ True,  True,  True])
+    """
+
+    def __init__(self):
+        self.n = 0
+        self._mean = np.array(0.)
+        self._sum_squared_deviations = np.array(0.)
+        self._is_binary = np.array(True)
+
+    def __repr__(self):
+        return '<n = %s, mean = %s, variance = %s>' % (self.n, self.mean, self.variance)
+
+    def add(self, value):
+        """Add a value.
+
+        Parameters
+        ----------
+        value : Number or array-like
+            The value.
+        """
+        value = np.asarray(value, dtype=float)
+        self.n += 1
+        delta = value - self._mean
+        self._mean = self._mean + delta / self.n
+        self._sum_squared_deviations = self._sum_squared_deviations + delta * (value - self._mean)
+        self._is_binary = self._is_binary & ((value == 0) | (value == 1))
+
+    @property
+    def mean(self):
+        """Number or numpy.ndarray : Mean of the values (nan if there is no value)."""
+        if self.n == 0:
+            return np.nan
+        return self._mean[()]
+
+    @property
+    def variance(self):
+        """Number or numpy.ndarray : Unbiased estimator of the variance of the values (nan if there are less than 2
+        values)."""
+        if self.n < 2:
+            return np.nan
+        return (self._sum_squared_deviations / (self.n - 1))[()]
+
+    @property
+    def is_binary(self):
+        """bool or numpy.ndarray : Whether all the values are equal to 0 or 1 (coordinate-wise). For such a
+        statistic, the mean is a frequency."""
+        return self._is_binary[()]
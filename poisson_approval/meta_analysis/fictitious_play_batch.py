@@ -0,0 +1,276 @@
+import numpy as np
+from poisson_approval.constants.basic_constants import *
+from poisson_approval.best_response.best_responses_batch import best_responses_batch
+from poisson_approval.tau_vector.TauVector import TauVector
+from poisson_approval.tau_vector.TauVectorBatch import TauVectorBatch
+from poisson_approval.utils.Util import one_over_t, to_callable, array_to_d_candidate_value, \
+    candidates_to_d_candidate_probability
+
+
+def fictitious_play_batch(profiles, init, n_max_episodes,
+                          perception_update_ratio=one_over_t,
+                          ballot_update_ratio=1,
+                          winning_frequency_update_ratio=one_over_t):
+    """Fictitious play for several profiles at once.
+
+    The profiles are advanced together, episode by episode: in each episode, the best responses of all the profiles
+    are computed by :func:`best_responses_batch`, and the resulting tau-vectors are computed with array operations.
+    The profiles that have converged are removed from the computation.
+
+    Parameters
+    ----------
+    profiles : list of ProfileCardinal
+        The profiles. They must have the same voting rule. The continuous profiles (such as :class:`ProfileHistogram`
+        or :class:`ProfileNoisyDiscrete`) are stacked together, i.e. their tau-vectors are computed in one array
+        operation. For the other profiles, :meth:`~ProfileCardinal.tau_strategic_array` is called for each of them.
+    init : Strategy or TauVector or str
+        The initialization. Cf. :meth:`ProfileCardinal.fictitious_play`.
+    n_max_episodes : int
+        Maximal number of iterations.
+    perception_update_ratio, ballot_update_ratio, winning_frequency_update_ratio : callable or Number
+        Cf. :meth:`ProfileCardinal.fictitious_play`.
+
+    Returns
+    -------
+    list of dict
+        For each profile, the same dictionary as :meth:`ProfileCardinal.fictitious_play` (without the other
+        statistics), i.e. with keys ``converges``, ``tau``, ``strategy``, ``tau_init``, ``n_episodes`` and
+        ``d_candidate_winning_frequency``.
+
+    Notes
+    -----
+    The best responses are computed in floating point arithmetic by :func:`best_responses_batch`. As a consequence,
+    in the rare cases where the utility threshold is given by the offset method, it can differ slightly from the one
+    computed by :meth:`ProfileCardinal.fictitious_play`.
+
+    Examples
+    --------
+        >>> from fractions import Fraction
+        >>> from poisson_approval import ProfileHistogram
+        >>> profile_1 = ProfileHistogram(
+        ...     {'abc': Fraction(1, 10), 'bac': Fraction(6, 10), 'cab': Fraction(3, 10)},
+        ...     {'abc': [1], 'bac': [1, 0], 'cab': [Fraction(2, 3), 0, 0, 0, 0, 0, 0, 0, 0, Fraction(1, 3)]})
+        >>> profile_2 = ProfileHistogram({'abc': Fraction(1, 2), 'cba': Fraction(1, 2)}, {'abc': [1], 'cba': [1]})
+        >>> results = fictitious_play_batch([profile_1, profile_2], init='sincere', n_max_episodes=100)
+        >>> print(results[0]['converges'], results[0]['n_episodes'])
+        False 100
+        >>> results[0]['d_candidate_winning_frequency']
+        {'b': 1.0}
+        >>> print(results[1]['converges'], results[1]['n_episodes'])
+        True 1
+        >>> print(results[1]['tau'])
+        <a: 0.25, ab: 0.25, bc: 0.25, c: 0.25> ==> a, b, c
+        >>> print(results[1]['strategy'])
+        <abc: utility-dependent (0.5), cba: utility-dependent (0.5)> ==> a, b, c
+    """
+    perception_update_ratio = to_callable(perception_update_ratio)
+    ballot_update_ratio = to_callable(ballot_update_ratio)
+    winning_frequency_update_ratio = to_callable(winning_frequency_update_ratio)
+    n_profiles = len(profiles)
+    if n_profiles == 0:
+        return []
+    voting_rule = profiles[0].voting_rule
+    if any(profile.voting_rule != voting_rule for profile in profiles):
+        raise ValueError('The profiles must have the same voting rule.')
+    tau_response = _TauResponseBatch(profiles)
+
+    taus_init = [profile._initializer(init)[1] for profile in profiles]
+    taus_actual = np.array([[float(tau.d_ballot_share[ballot]) for ballot in BALLOTS_WITHOUT_INVERSIONS]
+                            for tau in taus_init])
+    taus_perceived = np.zeros((n_profiles, len(BALLOTS_WITHOUT_INVERSIONS)))
+    winning_frequencies = np.zeros((n_profiles, len(CANDIDATES)))
+    converges = np.zeros(n_profiles, dtype=bool)
+    n_episodes = np.full(n_profiles, n_max_episodes)
+    active = np.arange(n_profiles)
+
+    for t in range(1, n_max_episodes + 1):
+        if len(active) == 0:
+            break
+        if t == 1:
+            taus_perceived[active] = taus_actual[active]
+        else:
+            taus_perceived[active] = _my_round(_barycenter(taus_perceived[active], taus_actual[active],
+                                                           perception_update_ratio(t)))
+        perceived_batch = TauVectorBatch(taus_perceived[active], voting_rule=voting_rule,
+                                         normalization_warning=False)
+        taus_perceived[active] = perceived_batch.shares
+        utility_thresholds, _ = best_responses_batch(perceived_batch, voting_rule=voting_rule)
+        taus_full_response = tau_response(active, utility_thresholds, perceived_batch.scores)
+        if t == 1:
+            taus_actual[active] = taus_full_response
+        else:
+            taus_actual[active] = _my_round(_barycenter(taus_actual[active], taus_full_response,
+                                                        ballot_update_ratio(t)))
+        winners = TauVectorBatch(taus_actual[active], voting_rule=voting_rule, normalization_warning=False).winners
+        probabilities = winners / np.sum(winners, axis=1)[:, np.newaxis]
+        if t == 1:
+            winning_frequencies[active] = probabilities
+        else:
+            wfur = winning_frequency_update_ratio(t)
+            winning_frequencies[active] = (1 - wfur) * winning_frequencies[active] + wfur * probabilities
+        just_converged = (_isclose(taus_full_response, taus_perceived[active])
+                          & _isclose(taus_actual[active], taus_full_response))
+        converges[active[just_converged]] = True
+        n_episodes[active[just_converged]] = t
+        active = active[~just_converged]
+
+    results = []
+    for i, profile in enumerate(profiles):
+        if converges[i]:
+            tau_perceived = _to_tau_vector(taus_perceived[i], voting_rule)
+            strategy = profile.best_responses_to_strategy(tau_perceived)
+            tau = _to_tau_vector(taus_actual[i], voting_rule)
+            results.append({'converges': True, 'tau': tau, 'strategy': strategy,
+                            'tau_init': taus_init[i], 'n_episodes': int(n_episodes[i]),
+                            'd_candidate_winning_frequency': candidates_to_d_candidate_probability(tau.winners)})
+        else:
+            results.append({'converges': False, 'tau': None, 'strategy': None,
+                            'tau_init': taus_init[i], 'n_episodes': n_max_episodes,
+                            'd_candidate_winning_frequency': array_to_d_candidate_value(winning_frequencies[i])})
+    return results
+
+
+class _TauResponseBatch:
+    """Tau-vectors resulting from utility thresholds, for several profiles at once.
+
+    Parameters
+    ----------
+    profiles : list of ProfileCardinal
+        The profiles (with the same voting rule).
+
+    Notes
+    -----
+    The continuous profiles are stacked: the nodes of their cumulative distribution functions
+    (cf. :attr:`ProfileCardinalContinuous._cdf_nodes`) are padded to the same length, so that all of them can be
+    evaluated in one array operation. For the other profiles, :meth:`ProfileCardinal.tau_strategic_array` is called
+    for each of them.
+    """
+
+    def __init__(self, profiles):
+        self.profiles = profiles
+        self.is_stacked = np.array([profile.is_continuous for profile in profiles], dtype=bool)
+        self.i_stacked = np.cumsum(self.is_stacked) - 1
+        stacked_profiles = [profile for profile in profiles if profile.is_continuous]
+        self.weak_voters_split = np.array([profile._weak_voters_strategic_split_array for profile in profiles])
+        self.has_weak_voters_with_choice = np.array([
+            len(profile._d_weak_order_ballot_best_response(dict.fromkeys(CANDIDATES, 0))) > 0 for profile in profiles
+        ], dtype=bool)
+        self.sincere_fanatic = np.array([profile._tau_sincere_fanatic_array for profile in profiles])
+        self.ratio_strategic = np.array([1 - float(profile.ratio_sincere) - float(profile.ratio_fanatic)
+                                         for profile in profiles])
+        self.shares = np.array([profile._shares_array for profile in profiles])
+        self.matrix_low_u, self.matrix_high_u = profiles[0]._matrices_ballot_low_high_u
+        # Stacked nodes
+        n_nodes = max([len(x) for profile in stacked_profiles for x, _ in profile._cdf_nodes], default=2)
+        self.x = np.zeros((len(stacked_profiles), len(RANKINGS), n_nodes))
+        self.y = np.zeros((len(stacked_profiles), len(RANKINGS), n_nodes))
+        for i, profile in enumerate(stacked_profiles):
+            for r, (x, y) in enumerate(profile._cdf_nodes):
+                self.x[i, r, :] = np.concatenate((x, np.full(n_nodes - len(x), x[-1])))
+                self.y[i, r, :] = np.concatenate((y, np.full(n_nodes - len(y), y[-1])))
+
+    def __call__(self, indexes, utility_thresholds, scores):
+        """Tau-vectors resulting from utility thresholds.
+
+        Parameters
+        ----------
+        indexes : numpy.ndarray
+            The indexes of the profiles concerned, of shape ``(n,)``.
+        utility_thresholds : numpy.ndarray
+            The utility thresholds, of shape ``(n, 6)``.
+        scores : numpy.ndarray
+            The scores of the perceived tau-vectors, of shape ``(n, 3)``. They are used by the voters with a weak
+            order who have two dominant strategies.
+
+        Returns
+        -------
+        numpy.ndarray
+            The tau-vectors, of shape ``(n, 6)``.
+        """
+        taus = np.zeros((len(indexes), len(BALLOTS_WITHOUT_INVERSIONS)))
+        d_k_weak_order_ballot = {
+            k: self.profiles[indexes[k]]._d_weak_order_ballot_best_response(dict(zip(CANDIDATES, scores[k])))
+            for k in np.flatnonzero(self.has_weak_voters_with_choice[indexes])
+        }
+        # Stacked profiles
+        mask = self.is_stacked[indexes]
+        if np.any(mask):
+            weak_voters = self.weak_voters_split[indexes]
+            for k, d_weak_order_ballot in d_k_weak_order_ballot.items():
+                weak_voters[k] = self.profiles[indexes[k]]._weak_voters_strategic_array(d_weak_order_ballot)
+            i_stacked = self.i_stacked[indexes[mask]]
+            shares = self.shares[indexes[mask]]
+            thresholds = np.where(shares > 0, utility_thresholds[mask], 0.)
+            share_low_u = _interp(thresholds, self.x[i_stacked], self.y[i_stacked])
+            share_high_u = shares - share_low_u
+            taus[mask] = weak_voters[mask] + share_low_u @ self.matrix_low_u + share_high_u @ self.matrix_high_u
+        # Other profiles
+        for k in np.flatnonzero(~mask):
+            taus[k] = self.profiles[indexes[k]].tau_strategic_array(
+                utility_thresholds[k], d_weak_order_ballot=d_k_weak_order_ballot.get(k))
+        return self.ratio_strategic[indexes][:, np.newaxis] * taus + self.sincere_fanatic[indexes]
+
+
+def _interp(u, x, y):
+    """Piecewise linear interpolation, for several functions at once.
+
+    Parameters
+    ----------
+    u : numpy.ndarray
+        Points where the functions are evaluated, of shape ``(...,)``.
+    x : numpy.ndarray
+        Nodes, of shape ``(..., m)``. For each function, they must be non-decreasing.
+    y : numpy.ndarray
+        Values at the nodes, of shape ``(..., m)``.
+
+    Returns
+    -------
+    numpy.ndarray
+        The values of the functions, of shape ``(...,)``. Outside the interval of the nodes, the functions are
+        constant.
+
+    Examples
+    --------
+        >>> _interp(np.array([0.25, -1, 0.75]),
+        ...         np.array([[0, 0.5, 1], [0, 0.5, 1], [0, 1, 1]]),
+        ...         np.array([[0, 1, 3], [0, 1, 3], [0, 2, 2]]))
+        array([0.5, 0. , 1.5])
+    """
+    index = np.clip(np.sum(x <= u[..., np.newaxis], axis=-1) - 1, 0, x.shape[-1] - 2)[..., np.newaxis]
+    x_0, x_1 = np.take_along_axis(x, index, -1)[..., 0], np.take_along_axis(x, index + 1, -1)[..., 0]
+    y_0, y_1 = np.take_along_axis(y, index, -1)[..., 0], np.take_along_axis(y, index + 1, -1)[..., 0]
+    width = x_1 - x_0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        w = np.clip(np.where(width > 0, (u - x_0) / width, 1.), 0, 1)
+    return y_0 + w * (y_1 - y_0)
+
+
+def _barycenter(a, b, ratio_b):
+    """Barycenter of two arrays, preserving `a` (resp. `b`) exactly if `ratio_b` is 0 (resp. 1)."""
+    if ratio_b == 0:
+        return a
+    if ratio_b == 1:
+        return b
+    ratio_b = float(ratio_b)
+    return (1 - ratio_b) * a + ratio_b * b
+
+
+def _my_round(x):
+    """Vectorized version of :func:`ProfileCardinal._my_round`.
+
+    Examples
+    --------
+        >>> _my_round(np.array([1E-10, 0.999999999999999999, 0.123456789]))
+        array([0.        , 1.        , 0.12345679])
+    """
+    return np.where(np.isclose(x, 1, rtol=0, atol=1E-9), 1., np.where(np.abs(x) <= 1E-9, 0., x))
+
+
+def _isclose(a, b):
+    """Whether the rows of two arrays are close, in the sense of :meth:`TauVector.isclose` with `abs_tol=1E-9`."""
+    return np.all(np.abs(a - b) <= np.maximum(1E-9 * np.maximum(np.abs(a), np.abs(b)), 1E-9), axis=1)
+
+
+def _to_tau_vector(shares, voting_rule):
+    return TauVector({ballot: float(share) for ballot, share in zip(BALLOTS_WITHOUT_INVERSIONS, shares)},
+                     voting_rule=voting_rule, normalization_warning=False)
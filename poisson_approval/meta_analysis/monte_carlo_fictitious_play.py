@@ -1,10 +1,16 @@
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 import pickle
 from copy import deepcopy
+from functools import partial
+from scipy.stats import norm
 from poisson_approval.constants.basic_constants import *
+from poisson_approval.meta_analysis.OnlineCounter import OnlineCounter
+from poisson_approval.meta_analysis.OnlineMean import OnlineMean
 from poisson_approval.random_factories.RandProfileHistogramUniform import RandProfileHistogramUniform
-from poisson_approval.utils.Util import one_over_log_t_plus_one
+from poisson_approval.utils.Util import one_over_log_t_plus_one, initialize_random_seeds, spawn_random_seeds, \
+    parallel_map, wilson_half_width
 
 
 def monte_carlo_fictitious_play(factory, n_samples, n_max_episodes,
@@ -15,7 +21,17 @@ def monte_carlo_fictitious_play(factory, n_samples, n_max_episodes,
                                 statistics_update_ratio=one_over_log_t_plus_one,
                                 monte_carlo_settings=None,
                                 file_save=None,
-                                meth='fictitious_play'):
+                                meth='fictitious_play',
+                                seed=None,
+                                n_jobs=1,
+                                executor=None,
+                                chunksize=1,
+                                sink=None,
+                                columnar=False,
+                                online=False,
+                                half_widths=None,
+                                batch_size=100,
+                                confidence=0.95):
     """
     Monte-Carlo analysis of fictitious play (or iterated voting).
 
@@ -43,12 +59,68 @@ def monte_carlo_fictitious_play(factory, n_samples, n_max_episodes,
         Name of the file where the results will be stored (using ``pickle``).
     meth : str
         The name of the method (``'fictitious_play'`` or ``'iterated_voting'``).
+    seed : int, optional
+        The root seed. If given, the random generators are initialized before each sample with a seed derived from
+        `seed` (cf. :func:`spawn_random_seeds`), so that the results only depend on `seed`, whatever the number of
+        worker processes. If None and the computation is in the current process, the current state of the random
+        generators is used, as usual; if None and the computation is in worker processes, the root seed is drawn
+        with the current random generator of `numpy`.
+    n_jobs : int or None
+        Number of worker processes. If 1 (default), everything is computed in the current process. If None, the
+        number of processors of the machine is used. Cf. :func:`parallel_map`.
+    executor : concurrent.futures.Executor, optional
+        An executor to use instead of creating a pool of processes. In that case, the `factory`, the update ratios
+        and the statistics of `monte_carlo_settings` are sent with each sample, hence must be picklable (e.g. no
+        lambda). When a pool of processes is created with `n_jobs`, they are sent once to each worker; with the start
+        method ``'fork'`` (the default on Linux), they need not be picklable. The predefined settings (such as
+        ``MCS_CONVERGES``) only use module-level functions, so they can be used with any start method.
+    chunksize : int
+        Number of samples sent at once to a worker process. Cf. :func:`parallel_map`.
+    sink : MonteCarloSink, optional
+        If given, the statistics of the samples are written to the disk by chunks, instead of being kept in memory
+        until the end. If the sink already contains some samples (e.g. from an interrupted run), the computation
+        resumes after them. To obtain the same results as an uninterrupted run, give a `seed`. The voting rules, the
+        statistics, the seed and the other parameters (`factory`, `n_max_episodes`, `init`, `meth` and the update
+        ratios) must be the same as in the previous runs (cf. :meth:`MonteCarloSink.check_manifest`).
+        If the sink contains more than `n_samples` samples, only the first `n_samples` are used. At the end, the
+        meta-results are reassembled by :meth:`MonteCarloSink.load`.
+    columnar : bool
+        If True, the statistics whose dtype and shape are declared in the settings (cf. `statistics_columns` in
+        :class:`MonteCarloSetting`) are stored in preallocated `numpy` arrays of shape ``(n_samples, ) + shape``,
+        instead of lists. This saves memory and time for large studies. The other statistics are stored in lists, as
+        usual.
+    online : bool
+        If True, the statistics that declare an accumulator in the settings (cf. `statistics_online` in
+        :class:`MonteCarloSetting`) are aggregated on the fly: ``meta_results[voting_rule][name_of_the_statistic]`` is
+        the accumulator (e.g. :class:`OnlineMean`), and the values of the samples are not kept. If all the statistics
+        declare an accumulator, the memory does not depend on `n_samples` (the samples are computed by batches of
+        `batch_size`). The other statistics are stored as usual. This option has priority over `columnar`. Note that
+        the plots that need the values of each sample (such as :func:`plot_utility_thresholds` and
+        :func:`plot_welfare_losses`) cannot be used with this option.
+    half_widths : dict, optional
+        Key: name of a statistic whose values are numbers or `numpy` arrays (or dictionaries whose keys are the
+        candidates). Value: the target half-width of the confidence interval of its mean. If given, the samples are
+        drawn by batches of `batch_size`, and the computation stops as soon as the target is reached for each of these
+        statistics and each voting rule. In that case, `n_samples` is the maximum number of samples. For a statistic
+        whose values are arrays, the half-width is the maximum over the coordinates. With `online`, these statistics
+        must be accumulated in an :class:`OnlineMean` (otherwise, a ValueError is raised). Each key must be the name of
+        a statistic of the settings (otherwise, a ValueError is raised before any sample is drawn). This option cannot
+        be used with a `sink`.
+    batch_size : int
+        Number of samples computed at once (except with a `sink`, which has its own chunk size), and between two tests
+        of the stopping rule with `half_widths`.
+    confidence : float
+        Confidence level of the intervals (only used with `half_widths`). For a statistic (or a coordinate) whose
+        values are all 0 or 1, we use the Wilson score interval. Otherwise, the intervals are based on the normal
+        approximation, with the empirical variance, and the stopping rule is not applied before 30 samples.
 
     Returns
     -------
     dict
         Key: voting rule (or ``''`` if `voting_rule` is None). Value: a dictionary whose keys are keywords for the
-        computed statistics, and whose values are the corresponding outputs. Cf. :class:`MonteCarloSetting`.
+        computed statistics, and whose values are the corresponding outputs. Cf. :class:`MonteCarloSetting`. With
+        `half_widths`, there is an additional key ``'half_widths'``: a dictionary that gives the achieved half-width
+        for each statistic of `half_widths`; and ``'n_samples'`` is the number of samples actually used.
 
     Examples
     --------
@@ -75,18 +147,133 @@ def monte_carlo_fictitious_play(factory, n_samples, n_max_episodes,
     """
     if voting_rules is None:
         voting_rules = ['']
+    (statistics_tau, statistics_strategy, statistics_post_processing,
+     statistics_final_processing, _, _) = _merge_settings(monte_carlo_settings)
+    if half_widths is not None:
+        statistic_names = set(statistics_tau) | set(statistics_strategy) | set(statistics_post_processing)
+        for statistic_name in half_widths.keys():
+            if statistic_name not in statistic_names:
+                raise ValueError('The half-width is asked for %r, which is not a statistic of the settings.'
+                                 % statistic_name)
+    if sink is not None:
+        if half_widths is not None:
+            raise ValueError('The option half_widths cannot be used with a sink.')
+        sink.check_manifest(voting_rules, list(statistics_tau) + list(statistics_strategy)
+                            + list(statistics_post_processing), seed,
+                            run_parameters={'factory': factory, 'n_max_episodes': n_max_episodes, 'init': init,
+                                            'meth': meth, 'perception_update_ratio': perception_update_ratio,
+                                            'ballot_update_ratio': ballot_update_ratio,
+                                            'statistics_update_ratio': statistics_update_ratio})
+    context = {'factory': factory, 'voting_rules': voting_rules, 'meth': meth,
+               'kwargs': dict(init=init, n_max_episodes=n_max_episodes,
+                              perception_update_ratio=perception_update_ratio,
+                              ballot_update_ratio=ballot_update_ratio,
+                              winning_frequency_update_ratio=statistics_update_ratio,
+                              other_statistics_update_ratio=statistics_update_ratio,
+                              other_statistics_strategy=statistics_strategy,
+                              other_statistics_tau=statistics_tau),
+               'statistics_post_processing': statistics_post_processing}
+    in_current_process = (executor is None and n_jobs == 1)
+    if seed is None and not in_current_process:
+        seed = np.random.randint(2 ** 31)
+    pool = None
+    context_task = context
+    if executor is None and n_jobs != 1:
+        # The pool is created once for the whole run, and the context is sent once to each worker process
+        pool = ProcessPoolExecutor(max_workers=n_jobs, initializer=_initialize_worker, initargs=(context, ))
+        executor = pool
+        context_task = None
+
+    def compute_samples(start, stop):
+        # The seeds are derived batch by batch, so that the memory does not depend on `n_samples`
+        seeds = [None] * (stop - start) if seed is None else spawn_random_seeds(seed, stop - start, start=start)
+        return parallel_map(_monte_carlo_sample, [(seed_sample, context_task) for seed_sample in seeds],
+                            executor=executor, chunksize=chunksize)
+
+    try:
+        if sink is None:
+            meta_results = _empty_meta_results(voting_rules, monte_carlo_settings, n_samples, columnar, online)
+            if half_widths is not None:
+                for statistic_name in half_widths.keys():
+                    _check_half_width_storage(meta_results[voting_rules[0]][statistic_name])
+            step = max(batch_size, 1)
+            n_samples_done = 0
+            for start in range(0, n_samples, step):
+                n_samples_done = min(start + step, n_samples)
+                for i, sample in enumerate(compute_samples(start, n_samples_done), start):
+                    for voting_rule in voting_rules:
+                        for statistic_name, value in sample[voting_rule].items():
+                            _store(meta_results[voting_rule], statistic_name, i, value)
+                if half_widths is not None and all(
+                        _half_width(meta_results[voting_rule][statistic_name], n_samples_done, confidence) <= target
+                        for voting_rule in voting_rules
+                        for statistic_name, target in half_widths.items()):
+                    break
+        else:
+            for start in range(sink.n_samples, n_samples, sink.chunk_size):
+                sink.write_chunk(compute_samples(start, min(start + sink.chunk_size, n_samples)), voting_rules)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    if sink is None:
+        if half_widths is not None:
+            for voting_rule in voting_rules:
+                for statistic_name, values in meta_results[voting_rule].items():
+                    if isinstance(values, np.ndarray):
+                        meta_results[voting_rule][statistic_name] = values[:n_samples_done]
+                meta_results[voting_rule]['half_widths'] = {
+                    statistic_name: _half_width(meta_results[voting_rule][statistic_name], n_samples_done, confidence)
+                    for statistic_name in half_widths.keys()
+                }
+        _final_processing(meta_results, n_samples_done, statistics_final_processing)
+    else:
+        meta_results = sink.load(monte_carlo_settings, columnar=columnar, online=online, n_samples=n_samples)
+
+    if file_save is not None:
+        with open(file_save, "wb") as f:
+            pickle.dump(meta_results, f)
+
+    return meta_results
+
+
+def _merge_settings(monte_carlo_settings):
+    """Merge the statistics of several :class:`MonteCarloSetting`.
+
+    Returns
+    -------
+    tuple
+        The dictionaries `statistics_tau`, `statistics_strategy`, `statistics_post_processing`,
+        `statistics_final_processing`, `statistics_columns` and `statistics_online`.
+    """
     if monte_carlo_settings is None:
         monte_carlo_settings = []
     statistics_tau = {}
     statistics_strategy = {}
     statistics_post_processing = {}
     statistics_final_processing = {}
+    statistics_columns = {}
+    statistics_online = {}
     for monte_carlo_setting in monte_carlo_settings:
         statistics_tau.update(monte_carlo_setting.statistics_tau)
         statistics_strategy.update(monte_carlo_setting.statistics_strategy)
         statistics_post_processing.update(monte_carlo_setting.statistics_post_processing)
         statistics_final_processing.update(monte_carlo_setting.statistics_final_processing)
+        statistics_columns.update(monte_carlo_setting.statistics_columns)
+        statistics_online.update(monte_carlo_setting.statistics_online)
+    return (statistics_tau, statistics_strategy, statistics_post_processing,
+            statistics_final_processing, statistics_columns, statistics_online)
+
 
+def _empty_meta_results(voting_rules, monte_carlo_settings, n_samples=0, columnar=False, online=False):
+    """Meta-results before adding the samples.
+
+    For each voting rule and each statistic, the storage is a new accumulator (if `online` and the statistic declares
+    one), or else a preallocated array of length `n_samples` (if `columnar` and the statistic declares a dtype and a
+    shape), or else an empty list. Cf. :func:`_store`.
+    """
+    (statistics_tau, statistics_strategy, statistics_post_processing,
+     statistics_final_processing, statistics_columns, statistics_online) = _merge_settings(monte_carlo_settings)
     meta_results = {
         voting_rule: {
             statistic_name: []
@@ -95,37 +282,236 @@ def monte_carlo_fictitious_play(factory, n_samples, n_max_episodes,
         }
         for voting_rule in voting_rules
     }
+    for voting_rule in voting_rules:
+        if columnar:
+            for statistic_name, (dtype, shape) in statistics_columns.items():
+                meta_results[voting_rule][statistic_name] = np.zeros((n_samples, ) + shape, dtype=dtype)
+        if online:
+            for statistic_name, accumulator_factory in statistics_online.items():
+                meta_results[voting_rule][statistic_name] = accumulator_factory()
+    return meta_results
 
-    for _ in range(n_samples):
-        base_profile = factory()
-        for voting_rule in voting_rules:
-            profile = deepcopy(base_profile) if len(voting_rules) > 1 else base_profile
-            if voting_rule != '':
-                profile.voting_rule = voting_rule
-            results = getattr(profile, meth)(init=init, n_max_episodes=n_max_episodes,
-                                             perception_update_ratio=perception_update_ratio,
-                                             ballot_update_ratio=ballot_update_ratio,
-                                             winning_frequency_update_ratio=statistics_update_ratio,
-                                             other_statistics_update_ratio=statistics_update_ratio,
-                                             other_statistics_strategy=statistics_strategy,
-                                             other_statistics_tau=statistics_tau)
-            for statistic_name, statistic_f in statistics_tau.items():
-                meta_results[voting_rule][statistic_name].append(results[statistic_name])
-            for statistic_name, statistic_f in statistics_strategy.items():
-                meta_results[voting_rule][statistic_name].append(results[statistic_name])
-            for statistic_name, statistic_f in statistics_post_processing.items():
-                meta_results[voting_rule][statistic_name].append(statistic_f(results, profile))
 
-    for voting_rule in voting_rules:
+def _store(meta_results_voting_rule, statistic_name, i, value):
+    """Store the value of a statistic for the sample number `i` (in place).
+
+    Depending on the storage of the statistic in `meta_results_voting_rule`, the value is added to the accumulator,
+    written in the row `i` of the array, or appended to the list (which is created if necessary).
+    """
+    values = meta_results_voting_rule.setdefault(statistic_name, [])
+    if isinstance(values, list):
+        values.append(value)
+    elif isinstance(values, np.ndarray):
+        values[i] = _to_row(value)
+    else:
+        values.add(_to_row(value))
+
+
+def _final_processing(meta_results, n_samples, statistics_final_processing):
+    """Add the number of samples and the final statistics to the meta-results (in place)."""
+    for voting_rule in meta_results.keys():
         meta_results[voting_rule]['n_samples'] = n_samples
         for statistic_name, statistic_f in statistics_final_processing.items():
             meta_results[voting_rule][statistic_name] = statistic_f(meta_results[voting_rule])
 
-    if file_save is not None:
-        with open(file_save, "wb") as f:
-            pickle.dump(meta_results, f)
 
-    return meta_results
+def _to_row(value):
+    """Convert the value of a statistic for one sample, before storing it in a column.
+
+    A dictionary whose keys are the candidates is converted to a list in the order of ``CANDIDATES``. Other values
+    are unchanged.
+
+    Examples
+    --------
+        >>> _to_row({'c': 0.5, 'b': 0.25, 'a': 0.25})
+        [0.25, 0.25, 0.5]
+        >>> _to_row(True)
+        True
+    """
+    if isinstance(value, dict):
+        return [value[candidate] for candidate in CANDIDATES]
+    return value
+
+
+def _candidate_array(values):
+    """Array of shape ``(n_samples, 3)`` from a column, or from a list of dictionaries whose keys are the candidates.
+
+    Examples
+    --------
+        >>> _candidate_array([{'a': 0.5, 'b': 0.25, 'c': 0.25}])
+        array([[0.5 , 0.25, 0.25]])
+    """
+    if isinstance(values, (np.ndarray, OnlineMean)):
+        return values
+    return np.array([_to_row(value) for value in values]).reshape(-1, len(CANDIDATES))
+
+
+def _half_width(values, n_samples, confidence):
+    """Half-width of the confidence interval of the mean of a statistic.
+
+    For the coordinates whose values are all equal to 0 or 1, the mean is a frequency and we use the Wilson score
+    interval (cf. :func:`wilson_half_width`), which does not collapse when the frequency is 0 or 1. For the other
+    coordinates, we use the normal approximation with the empirical variance, provided that there are at least
+    ``_N_SAMPLES_MIN_NORMAL`` samples.
+
+    Parameters
+    ----------
+    values : list or numpy.ndarray or OnlineMean
+        The values of the statistic.
+    n_samples : int
+        The number of samples (if `values` is a preallocated array, only its first `n_samples` rows are used).
+    confidence : float
+        The confidence level.
+
+    Returns
+    -------
+    float
+        The half-width (maximum over the coordinates for a statistic whose values are arrays), or ``inf`` if there is
+        not enough samples.
+
+    Examples
+    --------
+        >>> print('%.4f' % _half_width([0, 1, 0, 1], n_samples=4, confidence=0.95))
+        0.3500
+        >>> print('%.4f' % _half_width([1, 1, 1, 1], n_samples=4, confidence=0.95))
+        0.2449
+        >>> print('%.4f' % _half_width([{'a': 0, 'b': 1, 'c': 0}, {'a': 1, 'b': 1, 'c': 0}], n_samples=2,
+        ...                            confidence=0.95))
+        0.4055
+        >>> _half_width([0.5, 0.25, 0.25], n_samples=3, confidence=0.95)
+        inf
+        >>> print('%.4f' % _half_width([0.25, 0.75] * 20, n_samples=40, confidence=0.95))
+        0.0785
+    """
+    _check_half_width_storage(values)
+    if n_samples == 0:
+        return np.inf
+    if isinstance(values, OnlineMean):
+        mean, variance, is_binary = values.mean, values.variance, values.is_binary
+    else:
+        values = np.array([_to_row(value) for value in values[:n_samples]], dtype=float)
+        mean = np.mean(values, axis=0)
+        variance = np.var(values, axis=0, ddof=1) if n_samples >= 2 else np.full(np.shape(mean), np.nan)
+        is_binary = np.all((values == 0) | (values == 1), axis=0)
+    z = norm.ppf((1 + confidence) / 2)
+    return max(
+        wilson_half_width(mean_coordinate, n_samples, confidence) if is_binary_coordinate
+        else np.inf if n_samples < _N_SAMPLES_MIN_NORMAL
+        else float(z * np.sqrt(variance_coordinate / n_samples))
+        for mean_coordinate, variance_coordinate, is_binary_coordinate in zip(
+            np.ravel(mean), np.ravel(variance), np.ravel(is_binary))
+    )
+
+
+def _check_half_width_storage(values):
+    """Raise ValueError if the half-width cannot be computed for a statistic stored in `values`.
+
+    Examples
+    --------
+        >>> _check_half_width_storage(OnlineCounter())
+        Traceback (most recent call last):
+        ValueError: The half-width can only be computed for a statistic stored in a list, an array or an OnlineMean, \
+not in a OnlineCounter.
+    """
+    if not isinstance(values, (list, np.ndarray, OnlineMean)):
+        raise ValueError('The half-width can only be computed for a statistic stored in a list, an array or an '
+                         'OnlineMean, not in a %s.' % type(values).__name__)
+
+
+# Minimal number of samples to use the normal approximation in :func:`_half_width`, for a statistic that is not
+# binary: with less samples, the empirical variance is unreliable (e.g. it is 0 if all the values are equal).
+_N_SAMPLES_MIN_NORMAL = 30
+
+
+def _mean(values, axis=None):
+    """Mean of the values of a statistic, stored in a list, an array or an :class:`OnlineMean`.
+
+    Examples
+    --------
+        >>> _mean([1, 2])
+        1.5
+        >>> accumulator = OnlineMean()
+        >>> accumulator.add(1)
+        >>> _mean(accumulator)
+        1.0
+    """
+    if isinstance(values, OnlineMean):
+        return values.mean
+    return np.mean(values, axis=axis)
+
+
+def _frequencies(values):
+    """Frequency of each value of a statistic, stored in a list or an :class:`OnlineCounter`.
+
+    Examples
+    --------
+        >>> _frequencies([True, False, True, True])
+        {True: 0.75, False: 0.25}
+    """
+    if isinstance(values, OnlineCounter):
+        return values.frequencies
+    return {k: v / len(values) for k, v in Counter(values).items()}
+
+
+# noinspection PyUnusedLocal
+def _result(key, results, profile):
+    """Post-processing statistic: the value of `key` in the results of fictitious play (or iterated voting)."""
+    return results[key]
+
+
+def _final_mean(statistic_name, meta_results):
+    """Final statistic: the mean of another statistic."""
+    return _mean(meta_results[statistic_name])
+
+
+def _final_frequencies(statistic_name, meta_results):
+    """Final statistic: the frequencies of the values of another statistic."""
+    return _frequencies(meta_results[statistic_name])
+
+
+# Context of :func:`monte_carlo_fictitious_play` in a worker process
+_worker_context = None
+
+
+def _initialize_worker(context):
+    global _worker_context
+    _worker_context = context
+
+
+def _monte_carlo_sample(task):
+    """One sample of :func:`monte_carlo_fictitious_play`.
+
+    Parameters
+    ----------
+    task : tuple
+        The seed of the sample (or None to use the current state of the random generators) and the context (or None
+        to use the context of the worker process).
+
+    Returns
+    -------
+    dict
+        Key: voting rule. Value: a dictionary whose keys are the names of the statistics (except the final ones) and
+        whose values are the values of these statistics for this sample.
+    """
+    seed, context = task
+    if context is None:
+        context = _worker_context
+    if seed is not None:
+        initialize_random_seeds(seed)
+    statistic_names = list(context['kwargs']['other_statistics_tau'].keys()) + list(
+        context['kwargs']['other_statistics_strategy'].keys())
+    voting_rules = context['voting_rules']
+    sample = {}
+    base_profile = context['factory']()
+    for voting_rule in voting_rules:
+        profile = deepcopy(base_profile) if len(voting_rules) > 1 else base_profile
+        if voting_rule != '':
+            profile.voting_rule = voting_rule
+        results = getattr(profile, context['meth'])(**context['kwargs'])
+        sample[voting_rule] = {statistic_name: results[statistic_name] for statistic_name in statistic_names}
+        for statistic_name, statistic_f in context['statistics_post_processing'].items():
+            sample[voting_rule][statistic_name] = statistic_f(results, profile)
+    return sample
 
 
 class MonteCarloSetting:
@@ -158,30 +544,77 @@ class MonteCarloSetting:
         Key: name of the statistic. Value: a function whose input is the ``meta_result`` already computed so far.
         Such a statistic is computed only once for each voting rule, after the whole process is finished. It is
         accessible by ``meta_results[voting_rule][name_of_the_statistic]``.
+    statistics_columns : dict
+        Key: name of a statistic (among `statistics_tau`, `statistics_strategy` and `statistics_post_processing`).
+        Value: a pair ``(dtype, shape)``, where `shape` is the shape of the value of the statistic for one sample
+        (``()`` for a number). With the option `columnar` of :func:`monte_carlo_fictitious_play`, such a statistic
+        is stored in a `numpy` array of shape ``(n_samples, ) + shape``, instead of a list. A value that is a
+        dictionary whose keys are the candidates is stored in the order of ``CANDIDATES``. The functions of
+        `statistics_final_processing` must accept both representations (e.g. by using ``numpy.asarray``).
+    statistics_online : dict
+        Key: name of a statistic (among `statistics_tau`, `statistics_strategy` and `statistics_post_processing`).
+        Value: a callable without argument that returns a new accumulator, e.g. :class:`OnlineMean`,
+        :class:`OnlineCounter` or ``functools.partial(OnlineHistogram, bins=...)``. With the option `online` of
+        :func:`monte_carlo_fictitious_play`, the values of such a statistic are added to the accumulator (after the
+        same conversion as for `statistics_columns`) instead of being stored. The functions of
+        `statistics_final_processing` must then accept the accumulator as well as the usual representations.
     """
 
     def __init__(self, statistics_tau=None, statistics_strategy=None,
-                 statistics_post_processing=None, statistics_final_processing=None):
+                 statistics_post_processing=None, statistics_final_processing=None, statistics_columns=None,
+                 statistics_online=None):
         self.statistics_tau = {} if statistics_tau is None else statistics_tau
         self.statistics_strategy = {} if statistics_strategy is None else statistics_strategy
         self.statistics_post_processing = {} if statistics_post_processing is None else statistics_post_processing
         self.statistics_final_processing = {} if statistics_final_processing is None else statistics_final_processing
+        self.statistics_columns = {} if statistics_columns is None else statistics_columns
+        self.statistics_online = {} if statistics_online is None else statistics_online
+
+
+def _share_single_votes(strategy):
+    return strategy.share_single_votes
+
+
+def _share_sincere_votes(strategy):
+    return strategy.share_sincere
+
+
+# noinspection PyUnusedLocal
+def _share_double_votes(results, profile):
+    return 1 - results['share_single_votes']
+
+
+# noinspection PyUnusedLocal
+def _share_insincere_votes(results, profile):
+    return 1 - results['share_sincere_votes']
 
 
 MCS_BALLOT_STATISTICS = MonteCarloSetting(
     statistics_strategy={
-        'share_single_votes': (lambda strategy: strategy.share_single_votes),
-        'share_sincere_votes': (lambda strategy: strategy.share_sincere)
+        'share_single_votes': _share_single_votes,
+        'share_sincere_votes': _share_sincere_votes
     },
     statistics_post_processing={
-        'share_double_votes': (lambda results, profile: 1 - results['share_single_votes']),
-        'share_insincere_votes': (lambda results, profile: 1 - results['share_sincere_votes'])
+        'share_double_votes': _share_double_votes,
+        'share_insincere_votes': _share_insincere_votes
     },
     statistics_final_processing={
-        'mean_share_single_votes': (lambda meta_results: np.mean(meta_results['share_single_votes'])),
-        'mean_share_double_votes': (lambda meta_results: np.mean(meta_results['share_double_votes'])),
-        'mean_share_sincere_votes': (lambda meta_results: np.mean(meta_results['share_sincere_votes'])),
-        'mean_share_insincere_votes': (lambda meta_results: np.mean(meta_results['share_insincere_votes']))
+        'mean_share_single_votes': partial(_final_mean, 'share_single_votes'),
+        'mean_share_double_votes': partial(_final_mean, 'share_double_votes'),
+        'mean_share_sincere_votes': partial(_final_mean, 'share_sincere_votes'),
+        'mean_share_insincere_votes': partial(_final_mean, 'share_insincere_votes')
+    },
+    statistics_columns={
+        'share_single_votes': (float, ()),
+        'share_sincere_votes': (float, ()),
+        'share_double_votes': (float, ()),
+        'share_insincere_votes': (float, ()),
+    },
+    statistics_online={
+        'share_single_votes': OnlineMean,
+        'share_sincere_votes': OnlineMean,
+        'share_double_votes': OnlineMean,
+        'share_insincere_votes': OnlineMean,
     }
 )
 """
@@ -200,15 +633,18 @@ Keywords ``'mean_share_single_votes'``, ``'mean_share_double_votes'``, ``'mean_s
 """
 
 
+def _d_candidate_mean_winning_frequency(meta_results):
+    return dict(zip(CANDIDATES, _mean(_candidate_array(meta_results['d_candidate_winning_frequency']), axis=0)))
+
+
 MCS_CANDIDATE_WINNING_FREQUENCY = MonteCarloSetting(
     statistics_post_processing={
-        'd_candidate_winning_frequency': (lambda results, profile: results['d_candidate_winning_frequency'])},
+        'd_candidate_winning_frequency': partial(_result, 'd_candidate_winning_frequency')},
     statistics_final_processing={
-        'd_candidate_mean_winning_frequency': (
-            lambda meta_results: {c: np.mean([d[c] for d in meta_results['d_candidate_winning_frequency']])
-                                  for c in CANDIDATES}
-        )
-    }
+        'd_candidate_mean_winning_frequency': _d_candidate_mean_winning_frequency
+    },
+    statistics_columns={'d_candidate_winning_frequency': (float, (len(CANDIDATES), ))},
+    statistics_online={'d_candidate_winning_frequency': OnlineMean}
 )
 """
 MonteCarloSetting: Candidates' winning frequencies.
@@ -221,11 +657,13 @@ Keyword ``'d_candidate_mean_winning_frequency'``: average winning frequency for
 
 MCS_CONVERGES = MonteCarloSetting(
     statistics_post_processing={
-        'converges': (lambda results, profile: results['converges'])
+        'converges': partial(_result, 'converges')
     },
     statistics_final_processing={
-        'mean_converges': (lambda meta_results: np.mean(meta_results['converges']))
-    }
+        'mean_converges': partial(_final_mean, 'converges')
+    },
+    statistics_columns={'converges': (bool, ())},
+    statistics_online={'converges': OnlineMean}
 )
 """
 MonteCarloSetting: Convergence.
@@ -236,17 +674,19 @@ Keyword ``'mean_converges'``: rate of convergence (over all profiles).
 """
 
 
+# noinspection PyUnusedLocal
+def _focus(results, profile):
+    return None if results['tau'] is None else results['tau'].focus
+
+
 MCS_FOCUS = MonteCarloSetting(
     statistics_post_processing={
-        'focus': (lambda results, profile: (
-            None if results['tau'] is None else results['tau'].focus
-        ))
+        'focus': _focus
     },
     statistics_final_processing={
-        'focus_stats': (lambda meta_results: (
-            {k: v / len(meta_results['focus']) for k, v in Counter(meta_results['focus']).items()}
-        ))
-    }
+        'focus_stats': partial(_final_frequencies, 'focus')
+    },
+    statistics_online={'focus': OnlineCounter}
 )
 """
 MonteCarloSetting: Focus of the equilibrium.
@@ -257,18 +697,19 @@ Keyword ``'focus_stats'``: dictionary. Key: a focus or None. Value: proportion o
 """
 
 
+# noinspection PyUnusedLocal
+def _ordinal_eq(results, profile):
+    return None if results['tau'] is None else results['tau'].is_best_response_ordinal
+
+
 MCS_IS_ORDINAL_EQ = MonteCarloSetting(
     statistics_post_processing={
-        'ordinal_eq': (lambda results, profile: (
-            None if results['tau'] is None else results['tau'].is_best_response_ordinal
-        ))
+        'ordinal_eq': _ordinal_eq
     },
     statistics_final_processing={
-        'ordinal_eq_stats': (lambda meta_results: ({
-            k: v / len(meta_results['ordinal_eq'])
-            for k, v in Counter(meta_results['ordinal_eq']).items()
-        }))
-    }
+        'ordinal_eq_stats': partial(_final_frequencies, 'ordinal_eq')
+    },
+    statistics_online={'ordinal_eq': OnlineCounter}
 )
 """
 MonteCarloSetting: Whether the equilibrium is ordinal.
@@ -281,14 +722,29 @@ convergence). Value: proportion of profiles.
 """
 
 
+def _decreasing_scores(tau):
+    return np.array(sorted(tau.scores.values(), reverse=True))
+
+
+# noinspection PyUnusedLocal
+def _score(rank, results, profile):
+    return results['decreasing_scores'][rank]
+
+
 MCS_DECREASING_SCORES = MonteCarloSetting(
     statistics_tau={
-        'decreasing_scores': (lambda tau: np.array(sorted(tau.scores.values(), reverse=True)))
+        'decreasing_scores': _decreasing_scores
     },
     statistics_post_processing={
-        'score_winner': (lambda results, profile: results['decreasing_scores'][0]),
-        'score_second': (lambda results, profile: results['decreasing_scores'][1]),
-        'score_loser': (lambda results, profile: results['decreasing_scores'][2])
+        'score_winner': partial(_score, 0),
+        'score_second': partial(_score, 1),
+        'score_loser': partial(_score, 2)
+    },
+    statistics_columns={
+        'decreasing_scores': (float, (len(CANDIDATES), )),
+        'score_winner': (float, ()),
+        'score_second': (float, ()),
+        'score_loser': (float, ()),
     }
 )
 """
@@ -312,8 +768,10 @@ def _frequency_cw_wins(results, profile):
 MCS_FREQUENCY_CW_WINS = MonteCarloSetting(
     statistics_post_processing={'frequency_cw_wins': _frequency_cw_wins},
     statistics_final_processing={
-        'mean_frequency_cw_wins': (lambda meta_results: np.mean(meta_results['frequency_cw_wins']))
-    }
+        'mean_frequency_cw_wins': partial(_final_mean, 'frequency_cw_wins')
+    },
+    statistics_columns={'frequency_cw_wins': (float, ())},
+    statistics_online={'frequency_cw_wins': OnlineMean}
 )
 """
 MonteCarloSetting: Winning frequency of the Condorcet winner.
@@ -325,7 +783,9 @@ Keyword ``'mean_frequency_cw_wins'``: average winning frequency of the Condorcet
 
 
 MCS_N_EPISODES = MonteCarloSetting(
-    statistics_post_processing={'n_episodes': (lambda results, profile: results['n_episodes'])}
+    statistics_post_processing={'n_episodes': partial(_result, 'n_episodes')},
+    statistics_columns={'n_episodes': (int, ())},
+    statistics_online={'n_episodes': OnlineMean}
 )
 """
 MonteCarloSetting: Number of episodes.
@@ -334,8 +794,13 @@ Keyword ``'n_episodes'``: the number of episodes (for each profile).
 """
 
 
+# noinspection PyUnusedLocal
+def _profile(results, profile):
+    return profile
+
+
 MCS_PROFILE = MonteCarloSetting(
-    statistics_post_processing={'profile': (lambda results, profile: profile)}
+    statistics_post_processing={'profile': _profile}
 )
 """
 MonteCarloSetting: Profile.
@@ -345,7 +810,7 @@ Keyword ``'profile'``: the profile (for each profile).
 
 
 MCS_TAU_INIT = MonteCarloSetting(
-    statistics_post_processing={'tau_init': (lambda results, profile: results['tau_init'])}
+    statistics_post_processing={'tau_init': partial(_result, 'tau_init')}
 )
 """
 MonteCarloSetting: Tau-vector used at initialization.
@@ -354,26 +819,49 @@ Keyword ``'tau_init'``: the tau-vector used at initialization (for each profile)
 """
 
 
+def _utility_thresholds(strategy):
+    return np.array([strategy.d_ranking_threshold[ranking] for ranking in RANKINGS])
+
+
+# noinspection PyUnusedLocal
+def _weights_rankings(results, profile):
+    return [profile.d_ranking_share[ranking] for ranking in RANKINGS]
+
+
+def _share_utility_threshold(threshold, results, profile):
+    return float(np.dot(np.asarray(results['utility_thresholds']) == threshold,
+                        np.array(_weights_rankings(results, profile), dtype=float)))
+
+
+def _p_utility_threshold_not_0_or_1(meta_results):
+    return 1 - meta_results['p_utility_threshold_0'] - meta_results['p_utility_threshold_1']
+
+
 MCS_UTILITY_THRESHOLDS = MonteCarloSetting(
     statistics_strategy={
-        'utility_thresholds': (lambda strategy: np.array([strategy.d_ranking_threshold[ranking]
-                                                           for ranking in RANKINGS]))
+        'utility_thresholds': _utility_thresholds
     },
     statistics_post_processing={
-        'weights_rankings': (lambda results, profile: [profile.d_ranking_share[ranking] for ranking in RANKINGS])
+        'weights_rankings': _weights_rankings,
+        'share_utility_threshold_0': partial(_share_utility_threshold, 0),
+        'share_utility_threshold_1': partial(_share_utility_threshold, 1),
     },
     statistics_final_processing={
-        'p_utility_threshold_0': (lambda meta_results: float(np.tensordot(
-            np.array(meta_results['utility_thresholds']) == 0,
-            np.array(meta_results['weights_rankings']) / meta_results['n_samples']
-        ))),
-        'p_utility_threshold_1': (lambda meta_results: float(np.tensordot(
-            np.array(meta_results['utility_thresholds']) == 1,
-            np.array(meta_results['weights_rankings']) / meta_results['n_samples']
-        ))),
-        'p_utility_threshold_not_0_or_1': (
-            lambda meta_results: 1 - meta_results['p_utility_threshold_0'] - meta_results['p_utility_threshold_1']
-        ),
+        'p_utility_threshold_0': partial(_final_mean, 'share_utility_threshold_0'),
+        'p_utility_threshold_1': partial(_final_mean, 'share_utility_threshold_1'),
+        'p_utility_threshold_not_0_or_1': _p_utility_threshold_not_0_or_1,
+    },
+    statistics_columns={
+        'utility_thresholds': (float, (len(RANKINGS), )),
+        'weights_rankings': (float, (len(RANKINGS), )),
+        'share_utility_threshold_0': (float, ()),
+        'share_utility_threshold_1': (float, ()),
+    },
+    statistics_online={
+        'utility_thresholds': OnlineMean,
+        'weights_rankings': OnlineMean,
+        'share_utility_threshold_0': OnlineMean,
+        'share_utility_threshold_1': OnlineMean,
     }
 )
 """
@@ -383,6 +871,10 @@ Keyword ``'weights_rankings'``: weights of each ranking (for each profile).
 
 Keyword ``'utility_thresholds'``: utility threshold of each ranking (for each profile).
 
+Keyword ``'share_utility_threshold_0'``: share of the voters whose utility threshold is equal to 0 (for each profile).
+
+Keyword ``'share_utility_threshold_1'``: share of the voters whose utility threshold is equal to 1 (for each profile).
+
 Keyword ``'p_utility_threshold_0'``: probability of having a utility threshold equal to 0 (over all profiles and
 rankings).
 
@@ -429,26 +921,43 @@ def _candidate_winning_frequencies(results, profile):
     ]
 
 
+def _welfare_loss(welfare_losses_f, results, profile):
+    return float(np.dot(_candidate_winning_frequencies(results, profile),
+                        np.array(welfare_losses_f(results, profile), dtype=float)))
+
+
 MCS_WELFARE_LOSSES = MonteCarloSetting(
     statistics_post_processing={
         'candidate_winning_frequencies': _candidate_winning_frequencies,
         'utilitarian_welfare_losses': _utilitarian_welfare_losses,
         'plurality_welfare_losses': _plurality_welfare_losses,
         'anti_plurality_welfare_losses': _anti_plurality_welfare_losses,
+        'utilitarian_welfare_loss': partial(_welfare_loss, _utilitarian_welfare_losses),
+        'plurality_welfare_loss': partial(_welfare_loss, _plurality_welfare_losses),
+        'anti_plurality_welfare_loss': partial(_welfare_loss, _anti_plurality_welfare_losses),
     },
     statistics_final_processing={
-        'mean_utilitarian_welfare_loss': (lambda meta_results: float(np.tensordot(
-            np.array(meta_results['candidate_winning_frequencies']),
-            np.array(meta_results['utilitarian_welfare_losses']) / meta_results['n_samples']
-        ))),
-        'mean_plurality_welfare_loss': (lambda meta_results: float(np.tensordot(
-            np.array(meta_results['candidate_winning_frequencies']),
-            np.array(meta_results['plurality_welfare_losses']) / meta_results['n_samples']
-        ))),
-        'mean_anti_plurality_welfare_loss': (lambda meta_results: float(np.tensordot(
-            np.array(meta_results['candidate_winning_frequencies']),
-            np.array(meta_results['anti_plurality_welfare_losses']) / meta_results['n_samples']
-        ))),
+        'mean_utilitarian_welfare_loss': partial(_final_mean, 'utilitarian_welfare_loss'),
+        'mean_plurality_welfare_loss': partial(_final_mean, 'plurality_welfare_loss'),
+        'mean_anti_plurality_welfare_loss': partial(_final_mean, 'anti_plurality_welfare_loss'),
+    },
+    statistics_columns={
+        'candidate_winning_frequencies': (float, (len(CANDIDATES), )),
+        'utilitarian_welfare_losses': (float, (len(CANDIDATES), )),
+        'plurality_welfare_losses': (float, (len(CANDIDATES), )),
+        'anti_plurality_welfare_losses': (float, (len(CANDIDATES), )),
+        'utilitarian_welfare_loss': (float, ()),
+        'plurality_welfare_loss': (float, ()),
+        'anti_plurality_welfare_loss': (float, ()),
+    },
+    statistics_online={
+        'candidate_winning_frequencies': OnlineMean,
+        'utilitarian_welfare_losses': OnlineMean,
+        'plurality_welfare_losses': OnlineMean,
+        'anti_plurality_welfare_losses': OnlineMean,
+        'utilitarian_welfare_loss': OnlineMean,
+        'plurality_welfare_loss': OnlineMean,
+        'anti_plurality_welfare_loss': OnlineMean,
     }
 )
 """
@@ -462,6 +971,9 @@ Keyword ``'plurality_welfare_losses'``: plurality welfare loss (for each profile
 
 Keyword ``'anti_plurality_welfare_losses'``: anti-plurality welfare loss (for each profile).
 
+Keywords ``'utilitarian_welfare_loss'``, ``'plurality_welfare_loss'``, ``'anti_plurality_welfare_loss'``:
+corresponding welfare loss, averaged with the winning frequencies of the candidates (for each profile).
+
 Keyword ``'mean_utilitarian_welfare_loss'``: average utilitarian welfare loss (over all profiles).
 
 Keyword ``'mean_plurality_welfare_loss'``: average plurality welfare loss (over all profiles).
@@ -0,0 +1,140 @@
+import random
+import numpy as np
+from poisson_approval.constants.basic_constants import *
+from poisson_approval.utils.Util import initialize_random_seeds, spawn_random_seeds, parallel_map, \
+    one_over_log_t_plus_one
+
+
+def multi_start_fictitious_play(profile, n_starts, n_max_episodes,
+                                init='random_tau',
+                                perception_update_ratio=None,
+                                ballot_update_ratio=None,
+                                winning_frequency_update_ratio=None,
+                                meth='fictitious_play',
+                                seed=None,
+                                n_jobs=1,
+                                executor=None):
+    """Fictitious play (or iterated voting) from several random initializations of the same profile.
+
+    Parameters
+    ----------
+    profile : ProfileCardinal
+        The profile.
+    n_starts : int
+        The number of initializations.
+    n_max_episodes : int
+        Maximum number of episodes for each run.
+    init : str
+        The initialization, generally random: ``'random_tau'`` or ``'random_tau_undominated'``. Cf.
+        :meth:`~poisson_approval.ProfileCardinal.fictitious_play`.
+    perception_update_ratio, ballot_update_ratio, winning_frequency_update_ratio : callable or Number, optional
+        Cf. :meth:`~poisson_approval.ProfileCardinal.fictitious_play` or
+        :meth:`~poisson_approval.ProfileCardinal.iterated_voting`. To run in worker processes, they must be picklable
+        (e.g. :func:`one_over_log_t_plus_one` or a number, but not a lambda). If None: for fictitious play, the
+        default is :func:`one_over_log_t_plus_one`; for iterated voting, the default of
+        :meth:`~poisson_approval.ProfileCardinal.iterated_voting` is used.
+    meth : str
+        The name of the method (``'fictitious_play'`` or ``'iterated_voting'``).
+    seed : int, optional
+        The root seed. The seed of each run is derived from it with :func:`spawn_random_seeds`, so that the results
+        only depend on `seed`, whatever the number of worker processes. If None, the root seed is drawn with the
+        current random generator of `numpy` (hence it can be set with :func:`initialize_random_seeds`).
+    n_jobs : int or None
+        Number of worker processes. Cf. :func:`parallel_map`.
+    executor : concurrent.futures.Executor, optional
+        An executor to use instead of creating a pool of processes. Cf. :func:`parallel_map`.
+
+    Returns
+    -------
+    dict
+        * Key ``limits``: list of dict. The distinct limits found, by decreasing frequency of their basin of
+          attraction. Each limit is a dictionary with the keys ``tau`` (:class:`TauVector`), ``strategy``
+          (:class:`StrategyThreshold`), ``basin_frequency`` (proportion of the initializations that converge to this
+          limit) and ``d_candidate_winning_frequency``.
+        * Key ``frequency_no_convergence``: proportion of the initializations that do not converge.
+        * Key ``d_candidate_winning_frequency``: dict. Key: candidate. Value: winning frequency, averaged over all
+          the initializations (including those that do not converge).
+        * Key ``results``: list of dict. The results of each run, in the order of the seeds.
+
+    Notes
+    -----
+    Two limits are considered identical when their tau-vectors are close (up to 1E-6). With iterated voting, the
+    limit of a run is only defined if it converges to a fixed point (and not to a longer cycle).
+
+    When `n_jobs` is 1, the runs are performed in the current process: in that case, the global random generators
+    are reseeded by each run, and their states are restored at the end.
+
+    Examples
+    --------
+        >>> from fractions import Fraction
+        >>> from poisson_approval import ProfileNoisyDiscrete
+        >>> profile = ProfileNoisyDiscrete({('abc', 0.4, 0.01): Fraction(1, 10), ('bac', 0.2, 0.01): Fraction(6, 10),
+        ...                                 ('cab', 0.7, 0.01): Fraction(3, 10)})
+        >>> multi_results = multi_start_fictitious_play(profile, n_starts=10, n_max_episodes=100, seed=42)
+        >>> for limit in multi_results['limits']:
+        ...     print(limit['strategy'], limit['basin_frequency'])
+        <abc: a, bac: b, cab: ac> ==> b 0.9
+        <abc: a, bac: ab, cab: c> ==> a 0.1
+        >>> multi_results['frequency_no_convergence']
+        0.0
+    """
+    if seed is None:
+        seed = np.random.randint(2 ** 31)
+    kwargs = dict(init=init, n_max_episodes=n_max_episodes)
+    for name, ratio in [('perception_update_ratio', perception_update_ratio),
+                        ('ballot_update_ratio', ballot_update_ratio),
+                        ('winning_frequency_update_ratio', winning_frequency_update_ratio)]:
+        if ratio is not None:
+            kwargs[name] = ratio
+        elif meth == 'fictitious_play':
+            kwargs[name] = one_over_log_t_plus_one
+    tasks = [(profile, seed_start, meth, kwargs) for seed_start in spawn_random_seeds(seed, n_starts)]
+    state_random, state_np_random = random.getstate(), np.random.get_state()
+    try:
+        all_results = parallel_map(_run_with_seed, tasks, n_jobs=n_jobs, executor=executor)
+    finally:
+        random.setstate(state_random)
+        np.random.set_state(state_np_random)
+    limits = []
+    n_no_convergence = 0
+    for results in all_results:
+        tau, strategy = _limit(results, meth)
+        if tau is None:
+            n_no_convergence += 1
+            continue
+        for limit in limits:
+            if limit['tau'].isclose(tau, abs_tol=1E-6):
+                limit['basin_frequency'] += 1
+                break
+        else:
+            limits.append({'tau': tau, 'strategy': strategy, 'basin_frequency': 1,
+                           'd_candidate_winning_frequency': results['d_candidate_winning_frequency']})
+    for limit in limits:
+        limit['basin_frequency'] /= n_starts
+    limits.sort(key=lambda limit: - limit['basin_frequency'])
+    return {
+        'limits': limits,
+        'frequency_no_convergence': n_no_convergence / n_starts,
+        'd_candidate_winning_frequency': {
+            candidate: float(np.mean([results['d_candidate_winning_frequency'][candidate]
+                                      for results in all_results]))
+            for candidate in CANDIDATES
+        },
+        'results': all_results
+    }
+
+
+def _run_with_seed(task):
+    """Run fictitious play (or iterated voting) after initializing the random seeds (in a worker process)."""
+    profile, seed, meth, kwargs = task
+    initialize_random_seeds(seed)
+    return getattr(profile, meth)(**kwargs)
+
+
+def _limit(results, meth):
+    """Limit tau-vector and strategy of a run, or (None, None) if it did not converge."""
+    if not results['converges']:
+        return None, None
+    if meth == 'iterated_voting':
+        return results['cycle_taus_actual'][0], results['cycle_strategies'][0]
+    return results['tau'], results['strategy']
@@ -39,8 +39,8 @@ def plot_welfare_losses(results, criterion, **kwargs):
     voting_rules = results.keys()
     for voting_rule in voting_rules:
         n_samples = results[voting_rule]['n_samples']
-        welfare_losses = np.array(results[voting_rule][criterion]).flatten()
-        weights = np.array(results[voting_rule]['candidate_winning_frequencies']).flatten() / n_samples
+        welfare_losses = np.asarray(results[voting_rule][criterion]).ravel()
+        weights = np.asarray(results[voting_rule]['candidate_winning_frequencies']).ravel() / n_samples
         plt_cdf(welfare_losses, weights, n_samples, label=voting_rule, **kwargs)
     ax.grid(True)
     ax.legend()
@@ -321,6 +321,14 @@ class Profile(DeleteCacheMixin, metaclass=SuperclassMeta):
         * For voters of type ``'a>b~c'`` (`lovers`) in Anti-Plurality, who have two dominant strategies: vote
           against `b` or `c` (i.e. respectively for `ac` or `ab`).
         """
+        return self._d_ballot_share_weak_voters_strategic(strategy.d_weak_order_ballot)
+
+    def _d_ballot_share_weak_voters_strategic(self, d_weak_order_ballot):
+        """dict : Ballot shares due to the weak orders if they vote strategically.
+
+        Cf. :meth:`d_ballot_share_weak_voters_strategic`. The difference is that only the attribute
+        `d_weak_order_ballot` of the strategy is needed.
+        """
         d = {ballot: 0 for ballot in BALLOTS_WITHOUT_INVERSIONS}
         for weak_order in self.support_in_weak_orders:
             share = self.d_weak_order_share[weak_order]
@@ -328,7 +336,7 @@ class Profile(DeleteCacheMixin, metaclass=SuperclassMeta):
                 if self.voting_rule in {APPROVAL, PLURALITY}:
                     d[weak_order[0]] += share
                 elif self.voting_rule == ANTI_PLURALITY:
-                    ballot = strategy.d_weak_order_ballot[weak_order]
+                    ballot = d_weak_order_ballot[weak_order]
                     if ballot == SPLIT:
                         d[sort_ballot(weak_order[0] + weak_order[2])] += my_division(share, 2)
                         d[sort_ballot(weak_order[0] + weak_order[4])] += my_division(share, 2)
@@ -338,7 +346,7 @@ class Profile(DeleteCacheMixin, metaclass=SuperclassMeta):
                     raise NotImplementedError
             else:  # is_hater(weak_order)
                 if self.voting_rule == PLURALITY:
-                    ballot = strategy.d_weak_order_ballot[weak_order]
+                    ballot = d_weak_order_ballot[weak_order]
                     if ballot == SPLIT:
                         d[weak_order[0]] += my_division(share, 2)
                         d[weak_order[2]] += my_division(share, 2)
@@ -381,7 +389,33 @@ class Profile(DeleteCacheMixin, metaclass=SuperclassMeta):
             The conversion of the best responses into a strategy. Only the rankings present in this profile are
             mentioned in the strategy.
         """
-        # Deal with weak orders
+        d_weak_order_ballot = self._d_weak_order_ballot_best_response(tau.scores)
+        # Finish the job
+        return StrategyThreshold(
+            {
+                ranking: tau.d_ranking_best_response[ranking].utility_threshold
+                for ranking in RANKINGS
+                if self.d_ranking_share[ranking] > 0
+            },
+            d_weak_order_ballot=d_weak_order_ballot, ratio_optimistic=ratio_optimistic,
+            profile=self, voting_rule=self.voting_rule
+        )
+
+    def _d_weak_order_ballot_best_response(self, scores):
+        """Ballots of the voters with a weak order, in reaction to some scores.
+
+        Parameters
+        ----------
+        scores : dict
+            Key: candidate. Value: her score.
+
+        Returns
+        -------
+        dict
+            Key: weak order. Value: ballot. Only the weak orders present in the profile and that have two dominant
+            strategies in this voting rule are mentioned. This is in the format of the attribute
+            `d_weak_order_ballot` of a strategy.
+        """
         d_weak_order_ballot = {}
         if self.voting_rule == APPROVAL:
             pass
@@ -389,9 +423,9 @@ class Profile(DeleteCacheMixin, metaclass=SuperclassMeta):
             for weak_order in WEAK_ORDERS_HATE_WITHOUT_INVERSIONS:  # i~j>k
                 if self.d_weak_order_share[weak_order] > 0:
                     i, j = weak_order[0], weak_order[2]
-                    if tau.scores[i] > tau.scores[j]:
+                    if scores[i] > scores[j]:
                         d_weak_order_ballot[weak_order] = i
-                    elif tau.scores[i] < tau.scores[j]:
+                    elif scores[i] < scores[j]:
                         d_weak_order_ballot[weak_order] = j
                     else:
                         d_weak_order_ballot[weak_order] = SPLIT
@@ -399,22 +433,13 @@ class Profile(DeleteCacheMixin, metaclass=SuperclassMeta):
             for weak_order in WEAK_ORDERS_LOVE_WITHOUT_INVERSIONS:  # i>j~k
                 if self.d_weak_order_share[weak_order] > 0:
                     i, j, k = weak_order[0], weak_order[2], weak_order[4]
-                    if tau.scores[j] > tau.scores[k]:  # Then vote against `j`
+                    if scores[j] > scores[k]:  # Then vote against `j`
                         d_weak_order_ballot[weak_order] = sort_ballot(i + k)
-                    elif tau.scores[j] < tau.scores[k]:  # Then vote against `k`
+                    elif scores[j] < scores[k]:  # Then vote against `k`
                         d_weak_order_ballot[weak_order] = sort_ballot(i + j)
                     else:
                         d_weak_order_ballot[weak_order] = SPLIT
-        # Finish the job
-        return StrategyThreshold(
-            {
-                ranking: best_response.utility_threshold
-                for ranking, best_response in tau.d_ranking_best_response.items()
-                if self.d_ranking_share[ranking] > 0
-            },
-            d_weak_order_ballot=d_weak_order_ballot, ratio_optimistic=ratio_optimistic,
-            profile=self, voting_rule=self.voting_rule
-        )
+        return d_weak_order_ballot
 
     @property
     def strategies_ordinal(self):
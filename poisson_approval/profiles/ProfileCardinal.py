@@ -4,6 +4,7 @@ import numpy as np
 from fractions import Fraction
 from poisson_approval.constants.basic_constants import *
 from poisson_approval.constants.EquilibriumStatus import EquilibriumStatus
+from poisson_approval.events.TrioWarmStart import TrioWarmStart
 from poisson_approval.profiles.Profile import Profile
 from poisson_approval.random_factories.RandTauVectorUniform import RandTauVectorUniform
 from poisson_approval.strategies.Strategy import Strategy
@@ -11,9 +12,12 @@ from poisson_approval.strategies.StrategyThreshold import StrategyThreshold
 from poisson_approval.tau_vector.TauVector import TauVector
 from poisson_approval.utils.ComputationEngineNumeric import ComputationEngineNumeric
 from poisson_approval.utils.DictPrintingInOrderIgnoringZeros import DictPrintingInOrderIgnoringZeros
+from poisson_approval.utils.PhaseTimer import PhaseTimer
+from poisson_approval.utils.TrajectoryRecorder import TrajectoryRecorder
 from poisson_approval.utils.Util import candidates_to_probabilities, my_division, array_to_d_candidate_value, \
     one_over_t, to_callable, candidates_to_d_candidate_probability, normalize_dict_to_0_1
-from poisson_approval.utils.UtilBallots import ballot_one, ballot_one_two, ballot_low_u, ballot_high_u
+from poisson_approval.utils.UtilBallots import ballot_one, ballot_one_two, ballot_low_u, ballot_high_u, \
+    matrix_ballot_low_u, matrix_ballot_high_u
 from poisson_approval.utils.UtilCache import cached_property, property_deleting_cache
 
 
@@ -102,6 +106,81 @@ class ProfileCardinal(Profile):
         """
         raise NotImplementedError
 
+    def have_rankings_with_utility_above_u(self, u):
+        """Vectorized version of :meth:`have_ranking_with_utility_above_u`, for all the rankings at once.
+
+        Parameters
+        ----------
+        u : array_like
+            Array of shape ``(..., 6)``: the utility thresholds, the last axis corresponding to ``RANKINGS``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of floats with the same shape as `u`. Each value is the share of voters who have the corresponding
+            ranking and a utility for their middle candidate strictly greater than the corresponding threshold.
+
+        Notes
+        -----
+        This generic version simply calls :meth:`have_ranking_with_utility_above_u` for each value. The subclasses
+        may implement a faster version.
+        """
+        u = np.asarray(u, dtype=float)
+        results = np.zeros(u.shape)
+        for index in np.ndindex(u.shape):
+            results[index] = float(self.have_ranking_with_utility_above_u(RANKINGS[index[-1]], u[index]))
+        return results
+
+    def have_rankings_with_utility_u(self, u):
+        """Vectorized version of :meth:`have_ranking_with_utility_u`, for all the rankings at once.
+
+        Parameters
+        ----------
+        u : array_like
+            Array of shape ``(..., 6)``: the utility thresholds, the last axis corresponding to ``RANKINGS``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of floats with the same shape as `u`. Each value is the share of voters who have the corresponding
+            ranking and a utility for their middle candidate equal to the corresponding threshold.
+
+        Notes
+        -----
+        This generic version simply calls :meth:`have_ranking_with_utility_u` for each value. The subclasses
+        may implement a faster version.
+        """
+        u = np.asarray(u, dtype=float)
+        results = np.zeros(u.shape)
+        for index in np.ndindex(u.shape):
+            results[index] = float(self.have_ranking_with_utility_u(RANKINGS[index[-1]], u[index]))
+        return results
+
+    def have_rankings_with_utility_below_u(self, u):
+        """Vectorized version of :meth:`have_ranking_with_utility_below_u`, for all the rankings at once.
+
+        Parameters
+        ----------
+        u : array_like
+            Array of shape ``(..., 6)``: the utility thresholds, the last axis corresponding to ``RANKINGS``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of floats with the same shape as `u`. Each value is the share of voters who have the corresponding
+            ranking and a utility for their middle candidate strictly lower than the corresponding threshold.
+
+        Notes
+        -----
+        This generic version simply calls :meth:`have_ranking_with_utility_below_u` for each value. The subclasses
+        may implement a faster version.
+        """
+        u = np.asarray(u, dtype=float)
+        results = np.zeros(u.shape)
+        for index in np.ndindex(u.shape):
+            results[index] = float(self.have_ranking_with_utility_below_u(RANKINGS[index[-1]], u[index]))
+        return results
+
     @cached_property
     def d_ranking_share(self):
         return DictPrintingInOrderIgnoringZeros({
@@ -253,6 +332,126 @@ class ProfileCardinal(Profile):
                     share_limit_voters, 1 - ratio_optimistic)
         return TauVector(t, voting_rule=self.voting_rule, symbolic=self.symbolic)
 
+    # Array-based tau
+
+    @cached_property
+    def _shares_array(self):
+        """numpy.ndarray : Shares of the rankings, in the order of ``RANKINGS``."""
+        return np.array([float(self.d_ranking_share[ranking]) for ranking in RANKINGS])
+
+    @cached_property
+    def _matrices_ballot_low_high_u(self):
+        """tuple : The matrices :func:`matrix_ballot_low_u` and :func:`matrix_ballot_high_u` of the voting rule."""
+        return matrix_ballot_low_u(self.voting_rule), matrix_ballot_high_u(self.voting_rule)
+
+    @cached_property
+    def _tau_sincere_fanatic_array(self):
+        """numpy.ndarray : Ballot shares due to the sincere and fanatic voters, in the order of
+        ``BALLOTS_WITHOUT_INVERSIONS``. They are already weighted by `ratio_sincere` and `ratio_fanatic` respectively.
+        """
+        return np.array([
+            float(self.ratio_sincere * self.tau_sincere.d_ballot_share[ballot]
+                  + self.ratio_fanatic * self.tau_fanatic.d_ballot_share[ballot])
+            for ballot in BALLOTS_WITHOUT_INVERSIONS
+        ])
+
+    @cached_property
+    def _weak_voters_strategic_split_array(self):
+        """numpy.ndarray : Ballot shares due to the weak orders if they vote strategically, in the order of
+        ``BALLOTS_WITHOUT_INVERSIONS``, when the voters who have two dominant strategies split equally between them.
+        """
+        return self._weak_voters_strategic_array({weak_order: SPLIT for weak_order in self.support_in_weak_orders})
+
+    def _weak_voters_strategic_array(self, d_weak_order_ballot):
+        """numpy.ndarray : Ballot shares due to the weak orders if they vote strategically, in the order of
+        ``BALLOTS_WITHOUT_INVERSIONS``.
+        """
+        d_ballot_share = self._d_ballot_share_weak_voters_strategic(d_weak_order_ballot)
+        return np.array([float(d_ballot_share[ballot]) for ballot in BALLOTS_WITHOUT_INVERSIONS])
+
+    def tau_strategic_array(self, thresholds, ratio_optimistic=0.5, d_weak_order_ballot=None):
+        """Array version of :meth:`tau_strategic`.
+
+        Parameters
+        ----------
+        thresholds : array_like
+            Array of shape ``(..., 6)``: the utility thresholds, the last axis corresponding to ``RANKINGS``. The
+            thresholds of the rankings that are absent from the profile are ignored (they may be ``nan``).
+        ratio_optimistic : Number or array_like
+            The ratio of optimistic voters, for the voters whose utility is equal to the threshold. It can be an array
+            that is broadcastable with `thresholds`. Default: 1/2.
+        d_weak_order_ballot : dict, optional
+            The ballots of the voters with a weak order, in the same format as in :class:`StrategyThreshold`. By
+            default, the voters who have two dominant strategies split equally between them.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of floats with the same shape as `thresholds`: the shares of the ballots, the last axis
+            corresponding to ``BALLOTS_WITHOUT_INVERSIONS``.
+
+        Notes
+        -----
+        The computation is a linear map from the shares of voters with each ranking, below and above the thresholds,
+        to the shares of the ballots (cf. :func:`matrix_ballot_low_u` and :func:`matrix_ballot_high_u`). No
+        :class:`TauVector` is created: the result can be converted to tau-vectors if necessary, or passed to a
+        :class:`TauVectorBatch`.
+
+        Examples
+        --------
+            >>> from fractions import Fraction
+            >>> from poisson_approval import ProfileNoisyDiscrete
+            >>> profile = ProfileNoisyDiscrete({
+            ...     ('abc', 0.4, 0.01): Fraction(1, 10), ('bac', 0.2, 0.01): Fraction(6, 10),
+            ...     ('cab', 0.7, 0.01): Fraction(3, 10)})
+            >>> profile.tau_strategic_array([[0, 0, 1, 0, 0, 0],
+            ...                              [1, 0, 0, 0, 1, 0]])
+            array([[0. , 0.6, 0. , 0.1, 0.3, 0. ],
+                   [0.1, 0. , 0.3, 0.6, 0. , 0. ]])
+        """
+        thresholds = np.where(self._shares_array > 0, thresholds, 0.)
+        share_low_u = self.have_rankings_with_utility_below_u(thresholds)
+        share_high_u = self.have_rankings_with_utility_above_u(thresholds)
+        if not self.is_continuous:
+            share_limit_voters = self.have_rankings_with_utility_u(thresholds)
+            share_low_u += share_limit_voters * ratio_optimistic
+            share_high_u += share_limit_voters * (1 - np.asarray(ratio_optimistic, dtype=float))
+        if d_weak_order_ballot is None:
+            weak_voters = self._weak_voters_strategic_split_array
+        else:
+            weak_voters = self._weak_voters_strategic_array(d_weak_order_ballot)
+        matrix_low_u, matrix_high_u = self._matrices_ballot_low_high_u
+        return weak_voters + share_low_u @ matrix_low_u + share_high_u @ matrix_high_u
+
+    def tau_array(self, thresholds, ratio_optimistic=0.5, d_weak_order_ballot=None):
+        """Array version of :meth:`tau`.
+
+        Parameters
+        ----------
+        thresholds, ratio_optimistic, d_weak_order_ballot
+            Cf. :meth:`tau_strategic_array`.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of floats with the same shape as `thresholds`: the shares of the ballots, the last axis
+            corresponding to ``BALLOTS_WITHOUT_INVERSIONS``. As in :meth:`tau`, this is the barycenter of sincere,
+            fanatic and strategic voting.
+
+        Examples
+        --------
+            >>> from fractions import Fraction
+            >>> from poisson_approval import ProfileNoisyDiscrete
+            >>> profile = ProfileNoisyDiscrete({
+            ...     ('abc', 0.4, 0.01): Fraction(1, 10), ('bac', 0.2, 0.01): Fraction(6, 10),
+            ...     ('cab', 0.7, 0.01): Fraction(3, 10)}, ratio_sincere=Fraction(1, 2))
+            >>> profile.tau_array([0, 0, 1, 0, 0, 0])
+            array([0.05, 0.6 , 0.  , 0.05, 0.3 , 0.  ])
+        """
+        ratio_strategic = 1 - float(self.ratio_sincere) - float(self.ratio_fanatic)
+        return (ratio_strategic * self.tau_strategic_array(thresholds, ratio_optimistic, d_weak_order_ballot)
+                + self._tau_sincere_fanatic_array)
+
     def share_sincere(self, strategy):
         """Share of voters that happen to cast a sincere ballot.
 
@@ -455,6 +654,8 @@ class ProfileCardinal(Profile):
                         other_statistics_update_ratio=one_over_t,
                         other_statistics_tau=None,
                         other_statistics_strategy=None,
+                        recorder=None,
+                        phase_timer=None,
                         verbose=False):
         """Seek for convergence by iterated voting.
 
@@ -498,6 +699,13 @@ class ProfileCardinal(Profile):
             Key: name of the statistic (different from ``converges``, ``tau``, ``strategy``, ``tau_init``,
             ``n_episodes``, ``d_candidate_winning_frequency`` and the names in ``other_statistics_tau``). Value: a
             function whose input is a strategy, and whose output is a number or a `numpy` array.
+        recorder : bool or TrajectoryRecorder
+            If True (or if it is a :class:`TrajectoryRecorder`), the trajectory (perceived tau-vector, actual
+            tau-vector, utility thresholds and winning probabilities in each episode) is recorded in `numpy` arrays.
+        phase_timer : bool or PhaseTimer
+            If True (or if it is a :class:`PhaseTimer`), the wall time and the number of calls of each phase of the
+            episodes (tau-vectors, events, best responses, statistics, convergence), as well as the number of
+            iterations of the optimizer of the trio events, are measured.
         verbose : bool
             If True, print all intermediate steps.
 
@@ -519,6 +727,8 @@ class ProfileCardinal(Profile):
             * Key ``d_candidate_winning_frequency``: dict. Key: candidate. Value: winning frequency. If the process
               reached a limit or a periodical orbit, the winning frequencies are computed in the limit only. If the
               process did not converge, the frequency is computed on the whole history.
+            * Key ``recorder``: the :class:`TrajectoryRecorder` used (only if `recorder` is not False).
+            * Key ``phase_timer``: the :class:`PhaseTimer` used (only if `phase_timer` is not False).
             * Others keys are those of ``other_statistics_tau`` and ``other_statistics_strategy``. Similarly to
               ``d_candidate_winning_frequency``, they give the long-run average of the corresponding statistics.
 
@@ -545,6 +755,14 @@ class ProfileCardinal(Profile):
             other_statistics_tau = {}
         if other_statistics_strategy is None:
             other_statistics_strategy = {}
+        if recorder is True:
+            recorder = TrajectoryRecorder()
+        elif recorder is False:
+            recorder = None
+        if phase_timer is True:
+            phase_timer = PhaseTimer()
+        elif phase_timer is False:
+            phase_timer = None
 
         strategy, tau_init = self._initializer(init)
         tau_actual = tau_init
@@ -553,9 +771,12 @@ class ProfileCardinal(Profile):
             print('t = %s' % 0)
             print('strategy: %s' % strategy)
             print('tau_actual: %s' % tau_actual)
-        strategies = []
-        taus_actual = []
-        taus_perceived = []
+        if recorder is not None:
+            recorder.start(n_max_episodes)
+        # History of the pairs (tau_actual, tau_perceived), stored as tuples of shares. The set of the pairs already
+        # seen is used to detect an exact cycle in constant time.
+        history = []
+        seen_shares = set()
         array_candidate_winning_frequency = None
         d_name_statistic_tau_averaged = {name: None for name in other_statistics_tau.keys()}
         d_name_statistic_strategy_actual = {name: None for name in other_statistics_strategy.keys()}
@@ -563,19 +784,32 @@ class ProfileCardinal(Profile):
 
         n_episodes = n_max_episodes
         for t in range(1, n_max_episodes + 1):
+            if phase_timer is not None:
+                phase_timer.start()
             if t == 1:
-                tau_perceived = tau_actual
+                if phase_timer is None:
+                    tau_perceived = tau_actual
+                else:
+                    tau_perceived = TauVector(tau_actual.d_ballot_share, voting_rule=self.voting_rule,
+                                              symbolic=self.symbolic, normalization_warning=False,
+                                              phase_timer=phase_timer)
             else:
                 tau_perceived = TauVector({
                     ballot: _my_round(ComputationEngineNumeric.barycenter(a=tau_perceived.d_ballot_share[ballot],
                                                                           b=tau_actual.d_ballot_share[ballot],
                                                                           ratio_b=perception_update_ratio))
                     for ballot in BALLOTS_WITHOUT_INVERSIONS
-                }, voting_rule=self.voting_rule, symbolic=self.symbolic)
+                }, voting_rule=self.voting_rule, symbolic=self.symbolic, phase_timer=phase_timer)
+            if phase_timer is not None:
+                phase_timer.lap('tau_vectors')
             strategy = self.best_responses_to_strategy(tau_perceived)
+            if phase_timer is not None:
+                phase_timer.lap('best_responses')
             tau_full_response = strategy.tau
             if t == 1:
                 tau_actual = tau_full_response
+                if phase_timer is not None:
+                    phase_timer.lap('tau_vectors')
                 array_candidate_winning_frequency = candidates_to_probabilities(tau_actual.winners)
                 for statistic_name, statistic_f in other_statistics_tau.items():
                     d_name_statistic_tau_averaged[statistic_name] = statistic_f(tau_actual)
@@ -590,7 +824,10 @@ class ProfileCardinal(Profile):
                                                                           b=tau_full_response.d_ballot_share[ballot],
                                                                           ratio_b=ballot_update_ratio))
                     for ballot in BALLOTS_WITHOUT_INVERSIONS
-                }, normalization_warning=False, voting_rule=self.voting_rule, symbolic=self.symbolic)
+                }, normalization_warning=False, voting_rule=self.voting_rule, symbolic=self.symbolic,
+                    phase_timer=phase_timer)
+                if phase_timer is not None:
+                    phase_timer.lap('tau_vectors')
                 array_candidate_winning_frequency = (
                     (1 - wfur) * array_candidate_winning_frequency
                     + wfur * candidates_to_probabilities(tau_actual.winners))
@@ -605,6 +842,8 @@ class ProfileCardinal(Profile):
                     d_name_statistic_strategy_averaged[statistic_name] = (
                         (1 - osur) * d_name_statistic_strategy_averaged[statistic_name]
                         + osur * d_name_statistic_strategy_actual[statistic_name])
+            if phase_timer is not None:
+                phase_timer.lap('statistics')
 
             if verbose:
                 print('t = %s' % t)
@@ -613,24 +852,27 @@ class ProfileCardinal(Profile):
                 print('strategy: %s' % strategy)
                 print('tau_full_response: %s' % tau_full_response)
                 print('tau_actual: %s' % tau_actual)
+            if recorder is not None:
+                recorder.record(tau_perceived, tau_actual, strategy)
             # If there is an exact cycle, it is useless to continue looping.
-            break_ = (tau_actual, tau_perceived) in zip(taus_actual, taus_perceived)
-
-            taus_actual.append(tau_actual)
-            taus_perceived.append(tau_perceived)
-            strategies.append(strategy)
-            if break_:
+            shares = (tuple(tau_actual.d_ballot_share[ballot] for ballot in BALLOTS_WITHOUT_INVERSIONS)
+                      + tuple(tau_perceived.d_ballot_share[ballot] for ballot in BALLOTS_WITHOUT_INVERSIONS))
+            history.append(shares)
+            is_cycle = shares in seen_shares
+            seen_shares.add(shares)
+            if phase_timer is not None:
+                phase_timer.lap('convergence')
+            if is_cycle:
                 n_episodes = t
                 break
-        try:
-            end = len(taus_actual) - 1
-            begin = next(begin
-                         for begin in range(end - 1, -1, -1)
-                         if taus_actual[begin].isclose(taus_actual[end], abs_tol=1E-9)
-                         and taus_perceived[begin].isclose(taus_perceived[end], abs_tol=1E-9))
-            cycle_taus_actual = taus_actual[begin + 1:end + 1]
-            cycle_taus_perceived = taus_perceived[begin + 1:end + 1]
-            cycle_strategies = strategies[begin + 1:end + 1]
+        begin = _begin_of_cycle(history)
+        if begin is not None:
+            cycle_taus_actual = [self._tau_vector_from_shares(shares[:len(BALLOTS_WITHOUT_INVERSIONS)])
+                                 for shares in history[begin + 1:]]
+            cycle_taus_perceived = [self._tau_vector_from_shares(shares[len(BALLOTS_WITHOUT_INVERSIONS):])
+                                    for shares in history[begin + 1:]]
+            cycle_strategies = [self.best_responses_to_strategy(tau_perceived)
+                                for tau_perceived in cycle_taus_perceived]
             d_candidate_winning_frequency = _d_candidate_winning_frequency(cycle_taus_actual)
             for statistic_name, statistic_f in other_statistics_tau.items():
                 d_name_statistic_tau_averaged[statistic_name] = _average_statistic(
@@ -638,7 +880,7 @@ class ProfileCardinal(Profile):
             for statistic_name, statistic_f in other_statistics_strategy.items():
                 d_name_statistic_strategy_averaged[statistic_name] = _average_statistic(
                     statistic_f, cycle_strategies)
-        except StopIteration:
+        else:
             cycle_taus_actual = []
             cycle_taus_perceived = []
             cycle_strategies = []
@@ -652,8 +894,19 @@ class ProfileCardinal(Profile):
                   'd_candidate_winning_frequency': d_candidate_winning_frequency}
         results.update(d_name_statistic_tau_averaged)
         results.update(d_name_statistic_strategy_averaged)
+        if recorder is not None:
+            recorder.stop()
+            results['recorder'] = recorder
+        if phase_timer is not None:
+            phase_timer.stop()
+            results['phase_timer'] = phase_timer
         return results
 
+    def _tau_vector_from_shares(self, shares):
+        """Tau-vector with the given shares, in the order of ``BALLOTS_WITHOUT_INVERSIONS``."""
+        return TauVector(dict(zip(BALLOTS_WITHOUT_INVERSIONS, shares)), normalization_warning=False,
+                         voting_rule=self.voting_rule, symbolic=self.symbolic)
+
     def fictitious_play(self, init, n_max_episodes,
                         perception_update_ratio=one_over_t,
                         ballot_update_ratio=1,
@@ -661,6 +914,9 @@ class ProfileCardinal(Profile):
                         other_statistics_update_ratio=one_over_t,
                         other_statistics_tau=None,
                         other_statistics_strategy=None,
+                        trio_warm_start=False,
+                        recorder=None,
+                        phase_timer=None,
                         verbose=False):
         """Seek for convergence by fictitious play.
 
@@ -711,6 +967,17 @@ class ProfileCardinal(Profile):
             Key: name of the statistic (different from ``converges``, ``tau``, ``strategy``, ``tau_init``,
             ``n_episodes``, ``d_candidate_winning_frequency`` and the names in ``other_statistics_tau``). Value: a
             function whose input is a strategy, and whose output is a number or a `numpy` array.
+        trio_warm_start : bool or TrioWarmStart
+            If True (or if it is a :class:`TrioWarmStart`), the optimizer of the trio events in each episode starts
+            from its optimal value in the previous episode (when possible). Since the perceived tau-vector moves only
+            slightly between successive episodes, this saves iterations of the optimizer.
+        recorder : bool or TrajectoryRecorder
+            If True (or if it is a :class:`TrajectoryRecorder`), the trajectory (perceived tau-vector, actual
+            tau-vector, utility thresholds and winning probabilities in each episode) is recorded in `numpy` arrays.
+        phase_timer : bool or PhaseTimer
+            If True (or if it is a :class:`PhaseTimer`), the wall time and the number of calls of each phase of the
+            episodes (tau-vectors, events, best responses, statistics, convergence), as well as the number of
+            iterations of the optimizer of the trio events, are measured.
         verbose : bool
             If True, print all intermediate steps.
 
@@ -728,6 +995,12 @@ class ProfileCardinal(Profile):
             * Key ``d_candidate_winning_frequency``: dict. Key: candidate. Value: winning frequency. If the process
               reached a limit, the winning frequencies are computed in the limit only. If the process did not converge,
               the frequency is computed on the whole history.
+            * Key ``trio_warm_start``: the :class:`TrioWarmStart` used, with its statistics about the iterations of
+              the optimizer (only if `trio_warm_start` is not False).
+            * Key ``recorder``: the :class:`TrajectoryRecorder` used, with the trajectory (only if `recorder` is not
+              False).
+            * Key ``phase_timer``: the :class:`PhaseTimer` used, with the time spent in each phase (only if
+              `phase_timer` is not False).
             * Others keys are those of ``other_statistics_tau`` and ``other_statistics_strategy``. Similarly to
               ``d_candidate_winning_frequency``, they give the long-run average of the corresponding statistics.
 
@@ -751,6 +1024,18 @@ class ProfileCardinal(Profile):
             other_statistics_tau = {}
         if other_statistics_strategy is None:
             other_statistics_strategy = {}
+        if trio_warm_start is True:
+            trio_warm_start = TrioWarmStart()
+        elif trio_warm_start is False:
+            trio_warm_start = None
+        if recorder is True:
+            recorder = TrajectoryRecorder()
+        elif recorder is False:
+            recorder = None
+        if phase_timer is True:
+            phase_timer = PhaseTimer()
+        elif phase_timer is False:
+            phase_timer = None
 
         strategy, tau_init = self._initializer(init)
         tau_actual = tau_init
@@ -759,25 +1044,41 @@ class ProfileCardinal(Profile):
             print('t = %s' % 0)
             print('strategy: %s' % strategy)
             print('tau_actual: %s' % tau_actual)
+        if recorder is not None:
+            recorder.start(n_max_episodes)
         array_candidate_winning_frequency = None
         d_name_statistic_tau_averaged = {name: None for name in other_statistics_tau.keys()}
         d_name_statistic_strategy_actual = {name: None for name in other_statistics_strategy.keys()}
         d_name_statistic_strategy_averaged = {name: None for name in other_statistics_strategy.keys()}
 
         for t in range(1, n_max_episodes + 1):
+            if phase_timer is not None:
+                phase_timer.start()
             if t == 1:
-                tau_perceived = tau_actual
+                if trio_warm_start is None and phase_timer is None:
+                    tau_perceived = tau_actual
+                else:
+                    tau_perceived = TauVector(tau_actual.d_ballot_share, voting_rule=self.voting_rule,
+                                              symbolic=self.symbolic, normalization_warning=False,
+                                              trio_warm_start=trio_warm_start, phase_timer=phase_timer)
             else:
                 tau_perceived = TauVector({
                     ballot: _my_round(ComputationEngineNumeric.barycenter(a=tau_perceived.d_ballot_share[ballot],
                                                                           b=tau_actual.d_ballot_share[ballot],
                                                                           ratio_b=perception_update_ratio(t)))
                     for ballot in BALLOTS_WITHOUT_INVERSIONS
-                }, voting_rule=self.voting_rule, symbolic=self.symbolic)
+                }, voting_rule=self.voting_rule, symbolic=self.symbolic, trio_warm_start=trio_warm_start,
+                    phase_timer=phase_timer)
+            if phase_timer is not None:
+                phase_timer.lap('tau_vectors')
             strategy = self.best_responses_to_strategy(tau_perceived)
+            if phase_timer is not None:
+                phase_timer.lap('best_responses')
             tau_full_response = strategy.tau
             if t == 1:
                 tau_actual = tau_full_response
+                if phase_timer is not None:
+                    phase_timer.lap('tau_vectors')
                 array_candidate_winning_frequency = candidates_to_probabilities(tau_actual.winners)
                 for statistic_name, statistic_f in other_statistics_tau.items():
                     d_name_statistic_tau_averaged[statistic_name] = statistic_f(tau_actual)
@@ -793,7 +1094,10 @@ class ProfileCardinal(Profile):
                                                                           b=tau_full_response.d_ballot_share[ballot],
                                                                           ratio_b=bur))
                     for ballot in BALLOTS_WITHOUT_INVERSIONS
-                }, normalization_warning=False, voting_rule=self.voting_rule, symbolic=self.symbolic)
+                }, normalization_warning=False, voting_rule=self.voting_rule, symbolic=self.symbolic,
+                    phase_timer=phase_timer)
+                if phase_timer is not None:
+                    phase_timer.lap('tau_vectors')
                 array_candidate_winning_frequency = (
                     (1 - wfur) * array_candidate_winning_frequency
                     + wfur * candidates_to_probabilities(tau_actual.winners))
@@ -808,6 +1112,8 @@ class ProfileCardinal(Profile):
                     d_name_statistic_strategy_averaged[statistic_name] = (
                         (1 - osur) * d_name_statistic_strategy_averaged[statistic_name]
                         + osur * d_name_statistic_strategy_actual[statistic_name])
+            if phase_timer is not None:
+                phase_timer.lap('statistics')
 
             if verbose:
                 print('t = %s' % t)
@@ -816,8 +1122,13 @@ class ProfileCardinal(Profile):
                 print('strategy: %s' % strategy)
                 print('tau_full_response: %s' % tau_full_response)
                 print('tau_actual: %s' % tau_actual)
-            if tau_full_response.isclose(tau_perceived, abs_tol=1E-9) and tau_actual.isclose(
-                    tau_full_response, abs_tol=1E-9):
+            if recorder is not None:
+                recorder.record(tau_perceived, tau_actual, strategy)
+            converges = (tau_full_response.isclose(tau_perceived, abs_tol=1E-9)
+                         and tau_actual.isclose(tau_full_response, abs_tol=1E-9))
+            if phase_timer is not None:
+                phase_timer.lap('convergence')
+            if converges:
                 results = {'converges': True, 'tau': tau_full_response, 'strategy': strategy,
                            'tau_init': tau_init, 'n_episodes': t,
                            'd_candidate_winning_frequency': candidates_to_d_candidate_probability(tau_actual.winners)}
@@ -829,6 +1140,14 @@ class ProfileCardinal(Profile):
                     statistic_name: statistic_f(strategy)
                     for statistic_name, statistic_f in other_statistics_strategy.items()
                 })
+                if trio_warm_start is not None:
+                    results['trio_warm_start'] = trio_warm_start
+                if recorder is not None:
+                    recorder.stop()
+                    results['recorder'] = recorder
+                if phase_timer is not None:
+                    phase_timer.stop()
+                    results['phase_timer'] = phase_timer
                 return results
         d_candidate_winning_frequency = array_to_d_candidate_value(array_candidate_winning_frequency)
         results = {'converges': False, 'tau': None, 'strategy': None,
@@ -836,8 +1155,144 @@ class ProfileCardinal(Profile):
                    'd_candidate_winning_frequency': d_candidate_winning_frequency}
         results.update(d_name_statistic_tau_averaged)
         results.update(d_name_statistic_strategy_averaged)
+        if trio_warm_start is not None:
+            results['trio_warm_start'] = trio_warm_start
+        if recorder is not None:
+            recorder.stop()
+            results['recorder'] = recorder
+        if phase_timer is not None:
+            phase_timer.stop()
+            results['phase_timer'] = phase_timer
         return results
 
+    def accelerated_fixed_point(self, init, n_max_episodes, memory=5, damping=Fraction(1, 2), abs_tol=1E-12,
+                                verbose=False):
+        """Seek for an equilibrium by an accelerated fixed-point iteration.
+
+        Parameters
+        ----------
+        init : Strategy or TauVector or str
+            The initialization. Cf. :meth:`fictitious_play`.
+        n_max_episodes : int
+            Maximal number of iterations.
+        memory : int
+            Number of previous iterations used by the Anderson mixing. If 0, this is a damped iteration.
+        damping : Number
+            Number in (0, 1]. The relaxation coefficient: without acceleration, the next perceived tau-vector is
+            `(1 - damping) * tau_perceived + damping * tau_response`.
+        abs_tol : float
+            The process converges when the response tau-vector is equal to the perceived one, up to `abs_tol`. Since
+            the convergence is fast, the default value is smaller than the tolerance of :meth:`fictitious_play`
+            (1E-9), so that the limit is more likely to pass the test of :meth:`is_equilibrium`.
+        verbose : bool
+            If True, print all intermediate steps.
+
+        Returns
+        -------
+        dict
+            * Key ``converges``: bool. True if the process converges.
+            * Key ``tau``: :class:`TauVector` or None. The limit tau-vector. If None, it means that the process did not
+              converge.
+            * Key ``strategy``: :class:`StrategyThreshold` or None. The limit strategy. If None, it means that the
+              process did not converge.
+            * Key ``is_equilibrium``: :class:`EquilibriumStatus` or None. The result of :meth:`is_equilibrium` for the
+              limit strategy. If None, it means that the process did not converge.
+            * Key ``tau_init``: the tau-vector at initialization.
+            * Key ``n_episodes``: the number of iterations until convergence. If the process did not converge, by
+              convention, this value is `n_max_episodes`.
+
+        Notes
+        -----
+        In each iteration, the perceived tau-vector `x` gives the best responses, hence the response tau-vector
+        `g(x)` (computed with :meth:`tau_array`). The limits of :meth:`fictitious_play` are the fixed points of `g`.
+        We iterate on the tau-vector rather than on the utility thresholds, because the thresholds are a function of
+        the tau-vector, whereas the tau-vector is not a continuous function of the thresholds in a discrete profile.
+
+        Anderson mixing computes the next perceived tau-vector as the combination of the last `memory` + 1 iterates
+        whose linearized residual `g(x) - x` is minimal in the least squares sense, then projects it on the simplex.
+        If the residual increases, the older iterates are forgotten and only the last one is used. When the residuals
+        bring no information (e.g. in the first iteration, or when `g` is locally constant, which is frequent in a
+        discrete profile), this falls back to a damped iteration.
+
+        Examples
+        --------
+            >>> from fractions import Fraction
+            >>> from poisson_approval import ProfileHistogram, one_over_log_t_plus_one
+            >>> profile = ProfileHistogram({'abc': Fraction(1, 10), 'bac': Fraction(6, 10), 'cab': Fraction(3, 10)},
+            ...                            {'abc': [1], 'bac': [1], 'cab': [1]})
+            >>> results = profile.accelerated_fixed_point(init='sincere', n_max_episodes=100)
+            >>> results['converges']
+            True
+            >>> print(results['strategy'])
+            <abc: a, bac: b, cab: ac> ==> b
+            >>> results['n_episodes']
+            3
+            >>> results['is_equilibrium']
+            EquilibriumStatus.EQUILIBRIUM
+
+        For comparison, fictitious play needs more episodes to reach the same limit:
+
+            >>> results = profile.fictitious_play(init='sincere', n_max_episodes=100,
+            ...                                   perception_update_ratio=one_over_log_t_plus_one)
+            >>> print(results['strategy'])
+            <abc: a, bac: b, cab: ac> ==> b
+            >>> results['n_episodes']
+            40
+        """
+        damping = float(damping)
+        _, tau_init = self._initializer(init)
+        x = np.array([float(tau_init.d_ballot_share[ballot]) for ballot in BALLOTS_WITHOUT_INVERSIONS])
+        # Differences between successive iterates and between successive residuals
+        differences_x = []
+        differences_f = []
+        x_previous, f_previous = None, None
+        norm_previous = np.inf
+        for t in range(1, n_max_episodes + 1):
+            tau_perceived = self._tau_vector_from_shares([_my_round(share) for share in x])
+            strategy = self.best_responses_to_strategy(tau_perceived)
+            f = self._tau_response_array(strategy) - x
+            norm = np.max(np.abs(f))
+            if verbose:
+                print('t = %s' % t)
+                print('tau_perceived: %s' % tau_perceived)
+                print('strategy: %s' % strategy)
+                print('residual: %s' % norm)
+            if norm <= abs_tol:
+                return {'converges': True, 'tau': strategy.tau, 'strategy': strategy,
+                        'is_equilibrium': self.is_equilibrium(strategy),
+                        'tau_init': tau_init, 'n_episodes': t}
+            if norm > norm_previous:
+                # Restart: forget the older iterates
+                differences_x, differences_f = [], []
+            if x_previous is not None:
+                differences_x.append(x - x_previous)
+                differences_f.append(f - f_previous)
+                if len(differences_x) > memory:
+                    differences_x.pop(0)
+                    differences_f.pop(0)
+            x_previous, f_previous, norm_previous = x, f, norm
+            x = x + damping * f
+            if differences_x:
+                matrix_x = np.array(differences_x).T
+                matrix_f = np.array(differences_f).T
+                gamma = np.linalg.lstsq(matrix_f, f, rcond=None)[0]
+                x = x - (matrix_x + damping * matrix_f) @ gamma
+                x = np.maximum(x, 0)
+                x /= np.sum(x)
+        return {'converges': False, 'tau': None, 'strategy': None, 'is_equilibrium': None,
+                'tau_init': tau_init, 'n_episodes': n_max_episodes}
+
+    def _tau_response_array(self, strategy):
+        """Shares of the ballots when the strategic voters use `strategy`, in the order of
+        ``BALLOTS_WITHOUT_INVERSIONS`` (cf. :meth:`tau_array`).
+        """
+        thresholds = [float(strategy.d_ranking_threshold[ranking]) if self.d_ranking_share[ranking] > 0 else 0.
+                      for ranking in RANKINGS]
+        ratio_optimistic = [0.5 if strategy.d_ranking_ratio_optimistic[ranking] is None
+                            else float(strategy.d_ranking_ratio_optimistic[ranking])
+                            for ranking in RANKINGS]
+        return self.tau_array(thresholds, ratio_optimistic, strategy.d_weak_order_ballot)
+
     @classmethod
     def order_and_label(cls, t):
         raise NotImplementedError
@@ -872,6 +1327,37 @@ def _my_round(x):
     return float(x)
 
 
+def _begin_of_cycle(history):
+    """Beginning of the final cycle in the history of iterated voting.
+
+    Parameters
+    ----------
+    history : list of tuple
+        Each element gives the shares of the actual and perceived tau-vectors at some episode.
+
+    Returns
+    -------
+    int or None
+        The last index `begin` (before the last element of the history) such that the element of index `begin` is
+        close to the last element. The cycle is then given by the elements from `begin + 1` to the end. If there is
+        no such index, return None.
+
+    Examples
+    --------
+        >>> _begin_of_cycle([(0, 1), (1, 0), (0.5, 0.5), (1, 0), (0.5, 0.5)])
+        2
+        >>> print(_begin_of_cycle([(0, 1), (1, 0), (0.5, 0.5)]))
+        None
+    """
+    if len(history) < 2:
+        return None
+    shares = np.array(history, dtype=float)
+    a, b = shares[:-1, :], shares[-1, :]
+    is_close = np.all(np.abs(a - b) <= np.maximum(1E-9 * np.maximum(np.abs(a), np.abs(b)), 1E-9), axis=1)
+    indexes = np.flatnonzero(is_close)
+    return int(indexes[-1]) if len(indexes) > 0 else None
+
+
 def _d_candidate_winning_frequency(taus):
     """Winning frequencies of the candidates.
 
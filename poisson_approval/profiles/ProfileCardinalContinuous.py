@@ -1,5 +1,8 @@
+import numpy as np
 from poisson_approval.profiles.ProfileCardinal import ProfileCardinal
+from poisson_approval.constants.basic_constants import *
 from poisson_approval.strategies.StrategyThreshold import StrategyThreshold
+from poisson_approval.utils.UtilCache import cached_property
 
 
 # noinspection PyAbstractClass
@@ -21,6 +24,68 @@ class ProfileCardinalContinuous(ProfileCardinal):
         """
         return 0
 
+    @cached_property
+    def _cdf_nodes(self):
+        """list : Nodes of the cumulative distribution functions.
+
+        For each ranking (in the order of ``RANKINGS``), a tuple `(x, y)` of float arrays, where `x` is increasing,
+        such that the function ``u -> have_ranking_with_utility_below_u(ranking, u)`` is the piecewise linear
+        interpolation of these nodes. The subclasses must implement this, since it is used by the vectorized methods
+        :meth:`have_rankings_with_utility_above_u` and :meth:`have_rankings_with_utility_below_u`.
+        """
+        raise NotImplementedError
+
+    def have_rankings_with_utility_above_u(self, u):
+        """Vectorized version of :meth:`have_ranking_with_utility_above_u`, for all the rankings at once.
+
+        Cf. :meth:`ProfileCardinal.have_rankings_with_utility_above_u`.
+
+        Examples
+        --------
+            >>> from fractions import Fraction
+            >>> from poisson_approval import ProfileHistogram
+            >>> profile = ProfileHistogram(
+            ...     {'abc': Fraction(1, 10), 'bac': Fraction(6, 10), 'cab': Fraction(3, 10)},
+            ...     {'abc': [1], 'bac': [1, 0], 'cab': [Fraction(2, 3), 0, 0, 0, 0, 0, 0, 0, 0, Fraction(1, 3)]})
+            >>> profile.have_rankings_with_utility_above_u([[0, 0, 0.5, 0, 0.99, 0],
+            ...                                             [1, 1, 0.25, 1, 0.01, 1]])
+            array([[0.1 , 0.  , 0.  , 0.  , 0.01, 0.  ],
+                   [0.  , 0.  , 0.3 , 0.  , 0.28, 0.  ]])
+        """
+        u = np.asarray(u, dtype=float)
+        shares = np.array([float(self.d_ranking_share[ranking]) for ranking in RANKINGS])
+        return shares - self.have_rankings_with_utility_below_u(u)
+
+    def have_rankings_with_utility_u(self, u):
+        """Vectorized version of :meth:`have_ranking_with_utility_u`, for all the rankings at once.
+
+        Since it is a continuous profile, this method always returns an array of zeros.
+        """
+        return np.zeros(np.shape(u))
+
+    def have_rankings_with_utility_below_u(self, u):
+        """Vectorized version of :meth:`have_ranking_with_utility_below_u`, for all the rankings at once.
+
+        Cf. :meth:`ProfileCardinal.have_rankings_with_utility_below_u`.
+
+        Examples
+        --------
+            >>> from fractions import Fraction
+            >>> from poisson_approval import ProfileHistogram
+            >>> profile = ProfileHistogram(
+            ...     {'abc': Fraction(1, 10), 'bac': Fraction(6, 10), 'cab': Fraction(3, 10)},
+            ...     {'abc': [1], 'bac': [1, 0], 'cab': [Fraction(2, 3), 0, 0, 0, 0, 0, 0, 0, 0, Fraction(1, 3)]})
+            >>> profile.have_rankings_with_utility_below_u([[0, 0, 0.5, 0, 0.99, 0],
+            ...                                             [1, 1, 0.25, 1, 0.01, 1]])
+            array([[0.  , 0.  , 0.6 , 0.  , 0.29, 0.  ],
+                   [0.1 , 0.  , 0.3 , 0.  , 0.02, 0.  ]])
+        """
+        u = np.asarray(u, dtype=float)
+        results = np.empty(u.shape)
+        for r, (x, y) in enumerate(self._cdf_nodes):
+            results[..., r] = np.interp(u[..., r], x, y)
+        return results
+
     def best_responses_to_strategy(self, tau, ratio_optimistic=None):
         """Convert best responses to a :class:`StrategyThreshold`.
 
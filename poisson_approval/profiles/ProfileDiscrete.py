@@ -1,4 +1,6 @@
 import warnings
+import numpy as np
+from bisect import bisect_left, bisect_right
 from poisson_approval.constants.basic_constants import *
 from poisson_approval.profiles.ProfileCardinal import ProfileCardinal
 from poisson_approval.strategies.StrategyThreshold import StrategyThreshold
@@ -180,17 +182,126 @@ d_weak_order_share={'a~b>c': Fraction(53, 100)})
     def d_weak_order_share(self):
         return self._d_weak_order_share
 
+    @cached_property
+    def _d_ranking_sorted_utilities(self):
+        """dict : Sorted utilities and cumulative shares of each ranking.
+
+        * Key: a ranking, e.g. ``'abc'``.
+        * Value: a tuple `(utilities, shares, prefix_sums, suffix_sums)`. The list `utilities` contains the utilities
+          of the voters with this ranking, in increasing order, and `shares` the corresponding shares of voters. The
+          lists `prefix_sums` and `suffix_sums` have one more element: ``prefix_sums[k]`` is the share of the voters
+          with the `k` lowest utilities, and ``suffix_sums[k]`` is the share of the other voters.
+
+        Examples
+        --------
+            >>> from fractions import Fraction
+            >>> profile = ProfileDiscrete({'abc': {0.8: Fraction(1, 2), 0.3: Fraction(1, 4), 0.5: Fraction(1, 4)}})
+            >>> utilities, shares, prefix_sums, suffix_sums = profile._d_ranking_sorted_utilities['abc']
+            >>> utilities
+            [0.3, 0.5, 0.8]
+            >>> prefix_sums
+            [0, Fraction(1, 4), Fraction(1, 2), Fraction(1, 1)]
+            >>> suffix_sums
+            [Fraction(1, 1), Fraction(3, 4), Fraction(1, 2), 0]
+        """
+        d_ranking_sorted_utilities = dict()
+        for ranking, d_utility_share in self.d_ranking_utility_share.items():
+            utilities_and_shares = sorted((self.ce.S(utility), share) for utility, share in d_utility_share.items())
+            utilities = [utility for utility, _ in utilities_and_shares]
+            shares = [share for _, share in utilities_and_shares]
+            prefix_sums = [0]
+            for share in shares:
+                prefix_sums.append(prefix_sums[-1] + share)
+            suffix_sums = [0]
+            for share in reversed(shares):
+                suffix_sums.append(share + suffix_sums[-1])
+            d_ranking_sorted_utilities[ranking] = (utilities, shares, prefix_sums, suffix_sums[::-1])
+        return d_ranking_sorted_utilities
+
     def have_ranking_with_utility_above_u(self, ranking, u):
-        d_utility_share = self.d_ranking_utility_share[ranking]
-        return sum([share for utility, share in d_utility_share.items() if self.ce.S(utility) > self.ce.S(u)])
+        utilities, _, _, suffix_sums = self._d_ranking_sorted_utilities[ranking]
+        return suffix_sums[bisect_right(utilities, self.ce.S(u))]
 
     def have_ranking_with_utility_u(self, ranking, u):
-        d_utility_share = self.d_ranking_utility_share[ranking]
-        return sum([share for utility, share in d_utility_share.items() if self.ce.S(utility) == self.ce.S(u)])
+        utilities, shares, _, _ = self._d_ranking_sorted_utilities[ranking]
+        u = self.ce.S(u)
+        return sum(shares[bisect_left(utilities, u):bisect_right(utilities, u)])
 
     def have_ranking_with_utility_below_u(self, ranking, u):
-        d_utility_share = self.d_ranking_utility_share[ranking]
-        return sum([share for utility, share in d_utility_share.items() if self.ce.S(utility) < self.ce.S(u)])
+        utilities, _, prefix_sums, _ = self._d_ranking_sorted_utilities[ranking]
+        return prefix_sums[bisect_left(utilities, self.ce.S(u))]
+
+    @cached_property
+    def _sorted_arrays(self):
+        """list : For each ranking (in the order of ``RANKINGS``), the tuple `(utilities, prefix_sums)` of float
+        arrays, as in :attr:`_d_ranking_sorted_utilities`."""
+        return [(np.array(self._d_ranking_sorted_utilities[ranking][0], dtype=float),
+                 np.array(self._d_ranking_sorted_utilities[ranking][2], dtype=float))
+                for ranking in RANKINGS]
+
+    def have_rankings_with_utility_above_u(self, u):
+        """Vectorized version of :meth:`have_ranking_with_utility_above_u`, for all the rankings at once.
+
+        Cf. :meth:`ProfileCardinal.have_rankings_with_utility_above_u`.
+
+        Examples
+        --------
+            >>> from fractions import Fraction
+            >>> profile = ProfileDiscrete({'abc': {0.3: Fraction(1, 4), 0.8: Fraction(1, 2)},
+            ...                            'bac': {0.1: Fraction(1, 4)}})
+            >>> profile.have_rankings_with_utility_above_u([[0.3, 0, 0.1, 0, 0, 0],
+            ...                                             [0.5, 0, 0.2, 0, 0, 0]])
+            array([[0.5, 0. , 0. , 0. , 0. , 0. ],
+                   [0.5, 0. , 0. , 0. , 0. , 0. ]])
+        """
+        u = np.asarray(u, dtype=float)
+        results = np.empty(u.shape)
+        for r, (utilities, prefix_sums) in enumerate(self._sorted_arrays):
+            results[..., r] = prefix_sums[-1] - prefix_sums[np.searchsorted(utilities, u[..., r], side='right')]
+        return results
+
+    def have_rankings_with_utility_u(self, u):
+        """Vectorized version of :meth:`have_ranking_with_utility_u`, for all the rankings at once.
+
+        Cf. :meth:`ProfileCardinal.have_rankings_with_utility_u`.
+
+        Examples
+        --------
+            >>> from fractions import Fraction
+            >>> profile = ProfileDiscrete({'abc': {0.3: Fraction(1, 4), 0.8: Fraction(1, 2)},
+            ...                            'bac': {0.1: Fraction(1, 4)}})
+            >>> profile.have_rankings_with_utility_u([[0.3, 0, 0.1, 0, 0, 0],
+            ...                                       [0.5, 0, 0.2, 0, 0, 0]])
+            array([[0.25, 0.  , 0.25, 0.  , 0.  , 0.  ],
+                   [0.  , 0.  , 0.  , 0.  , 0.  , 0.  ]])
+        """
+        u = np.asarray(u, dtype=float)
+        results = np.empty(u.shape)
+        for r, (utilities, prefix_sums) in enumerate(self._sorted_arrays):
+            results[..., r] = (prefix_sums[np.searchsorted(utilities, u[..., r], side='right')]
+                               - prefix_sums[np.searchsorted(utilities, u[..., r], side='left')])
+        return results
+
+    def have_rankings_with_utility_below_u(self, u):
+        """Vectorized version of :meth:`have_ranking_with_utility_below_u`, for all the rankings at once.
+
+        Cf. :meth:`ProfileCardinal.have_rankings_with_utility_below_u`.
+
+        Examples
+        --------
+            >>> from fractions import Fraction
+            >>> profile = ProfileDiscrete({'abc': {0.3: Fraction(1, 4), 0.8: Fraction(1, 2)},
+            ...                            'bac': {0.1: Fraction(1, 4)}})
+            >>> profile.have_rankings_with_utility_below_u([[0.3, 0, 0.1, 0, 0, 0],
+            ...                                             [0.5, 0, 0.2, 0, 0, 0]])
+            array([[0.  , 0.  , 0.  , 0.  , 0.  , 0.  ],
+                   [0.25, 0.  , 0.25, 0.  , 0.  , 0.  ]])
+        """
+        u = np.asarray(u, dtype=float)
+        results = np.empty(u.shape)
+        for r, (utilities, prefix_sums) in enumerate(self._sorted_arrays):
+            results[..., r] = prefix_sums[np.searchsorted(utilities, u[..., r], side='left')]
+        return results
 
     def __repr__(self):
         """
@@ -265,13 +265,61 @@ d_weak_order_share={'a~c>b': Fraction(3, 10)})
         if u == 1:
             return self.ce.simplify(share_ranking)
         histogram = self.d_ranking_histogram[ranking]
+        cumulative_histogram = self._d_ranking_cumulative_histogram[ranking]
         n_bins = len(histogram)
         k = int(u * n_bins)
         if histogram[k] == 0:
             # Not really an exception, but handles fractions more nicely.
-            return self.ce.simplify(share_ranking * np.sum(histogram[0:k]))
+            return self.ce.simplify(share_ranking * cumulative_histogram[k])
         else:
-            return self.ce.simplify(share_ranking * (np.sum(histogram[0:k]) + histogram[k] * (u * n_bins - k)))
+            return self.ce.simplify(share_ranking * (cumulative_histogram[k] + histogram[k] * (u * n_bins - k)))
+
+    @cached_property
+    def _d_ranking_cumulative_histogram(self):
+        """dict : Cumulative sums of the histograms.
+
+        * Key: a ranking, e.g. ``'abc'``.
+        * Value: an array of length ``n_bins + 1``, whose element of index `k` is the sum of the first `k` bins of the
+          histogram. In other words, it is the value of the cumulative distribution function (CDF) at ``k / n_bins``.
+
+        Examples
+        --------
+            >>> from fractions import Fraction
+            >>> profile = ProfileHistogram({'abc': Fraction(1, 10), 'bac': Fraction(9, 10)},
+            ...                            {'abc': [Fraction(1, 2), Fraction(1, 2)], 'bac': [0.25, 0, 0.75]})
+            >>> profile._d_ranking_cumulative_histogram['abc']
+            array([0, Fraction(1, 2), Fraction(1, 1)], dtype=object)
+            >>> profile._d_ranking_cumulative_histogram['bac']
+            array([0.  , 0.25, 0.25, 1.  ])
+        """
+        return {ranking: np.concatenate(([0], np.cumsum(histogram)))
+                for ranking, histogram in self.d_ranking_histogram.items()}
+
+    @cached_property
+    def _cdf_nodes(self):
+        """list : Nodes of the cumulative distribution functions. Cf. :attr:`ProfileCardinalContinuous._cdf_nodes`.
+
+        Examples
+        --------
+            >>> from fractions import Fraction
+            >>> profile = ProfileHistogram({'abc': Fraction(1, 10), 'bac': Fraction(9, 10)},
+            ...                            {'abc': [Fraction(1, 2), Fraction(1, 2)], 'bac': [0.25, 0, 0.75]})
+            >>> x, y = profile._cdf_nodes[0]
+            >>> x
+            array([0. , 0.5, 1. ])
+            >>> y
+            array([0.  , 0.05, 0.1 ])
+        """
+        nodes = []
+        for ranking in RANKINGS:
+            cumulative_histogram = self._d_ranking_cumulative_histogram[ranking]
+            n_bins = len(cumulative_histogram) - 1
+            share = float(self.d_ranking_share[ranking])
+            if share == 0 or n_bins == 0:
+                nodes.append((np.array([0., 1.]), np.zeros(2)))
+            else:
+                nodes.append((np.arange(n_bins + 1) / n_bins, share * cumulative_histogram.astype(float)))
+        return nodes
 
     def __repr__(self):
         """
@@ -459,7 +507,7 @@ d_weak_order_share={'a~c>b': Fraction(3, 10)})
             y_label = 'Cumulative proportion of the voters %s' % ranking
         n_bins = len(self.d_ranking_histogram[ranking])
         x = np.array(range(0, n_bins + 1)) / n_bins
-        y = np.concatenate(([0], np.cumsum(self.d_ranking_histogram[ranking])))
+        y = self._d_ranking_cumulative_histogram[ranking]
         plt.plot(x, y, **kwargs)
         plt.xlabel(x_label)
         plt.ylabel(y_label)
@@ -1,4 +1,6 @@
 import warnings
+import numpy as np
+from bisect import bisect_right
 from poisson_approval.constants.basic_constants import *
 from poisson_approval.profiles.ProfileCardinalContinuous import ProfileCardinalContinuous
 from poisson_approval.strategies.StrategyThreshold import StrategyThreshold
@@ -222,19 +224,68 @@ d_weak_order_share={'a~b>c': Fraction(53, 100)})
     def d_weak_order_share(self):
         return self._d_weak_order_share
 
+    @cached_property
+    def _d_ranking_cdf_breakpoints(self):
+        """dict : Breakpoints of the piecewise linear cumulative distribution functions.
+
+        It maps a ranking to a tuple `(x, y_below, y_above)`, where `x` is the sorted list of the breakpoints (0, 1, and
+        all the bounds `umin` and `umax` of the intervals), and `y_below[k]` (resp. `y_above[k]`) is the share of
+        voters with this ranking and a utility below (resp. above) `x[k]`. Between two consecutive breakpoints, these
+        functions are linear.
+
+        Examples
+        --------
+            >>> from fractions import Fraction
+            >>> profile = ProfileNoisyDiscrete({('abc', Fraction(3, 10), Fraction(1, 10)): Fraction(1, 4),
+            ...                                 ('abc', Fraction(1, 2), Fraction(1, 10)): Fraction(3, 4)})
+            >>> x, y_below, y_above = profile._d_ranking_cdf_breakpoints['abc']
+            >>> print([str(v) for v in x])
+            ['0', '1/5', '2/5', '3/5', '1']
+            >>> print([str(v) for v in y_below])
+            ['0', '0', '1/4', '1', '1']
+            >>> print([str(v) for v in y_above])
+            ['1', '1', '3/4', '0', '0']
+        """
+        d_ranking_breakpoints = dict()
+        for ranking, d_umin_umax_share in self.d_ranking_umin_umax_share.items():
+            x = sorted({0, 1} | {bound for umin_umax in d_umin_umax_share.keys() for bound in umin_umax})
+            y_below = [sum([
+                _share_between(umin, u, umin, umax, share)
+                for (umin, umax), share in d_umin_umax_share.items()
+            ]) for u in x]
+            y_above = [sum([
+                _share_between(u, umax, umin, umax, share)
+                for (umin, umax), share in d_umin_umax_share.items()
+            ]) for u in x]
+            d_ranking_breakpoints[ranking] = (x, y_below, y_above)
+        return d_ranking_breakpoints
+
+    @cached_property
+    def _cdf_nodes(self):
+        """list : Nodes of the cumulative distribution functions. Cf. :attr:`ProfileCardinalContinuous._cdf_nodes`.
+
+        Examples
+        --------
+            >>> from fractions import Fraction
+            >>> profile = ProfileNoisyDiscrete({('abc', Fraction(3, 10), Fraction(1, 10)): Fraction(1, 4),
+            ...                                 ('abc', Fraction(1, 2), Fraction(1, 10)): Fraction(3, 4)})
+            >>> x, y = profile._cdf_nodes[0]
+            >>> x
+            array([0. , 0.2, 0.4, 0.6, 1. ])
+            >>> y
+            array([0.  , 0.  , 0.25, 1.  , 1.  ])
+        """
+        return [(np.array([float(v) for v in self._d_ranking_cdf_breakpoints[ranking][0]]),
+                 np.array([float(v) for v in self._d_ranking_cdf_breakpoints[ranking][1]]))
+                for ranking in RANKINGS]
+
     def have_ranking_with_utility_above_u(self, ranking, u):
-        d_umin_umax_share = self.d_ranking_umin_umax_share[ranking]
-        return sum([
-            _crop(my_division(umax - u, umax - umin)) * share
-            for (umin, umax), share in d_umin_umax_share.items()
-        ])
+        x, _, y_above = self._d_ranking_cdf_breakpoints[ranking]
+        return _interpolate(x, y_above, u)
 
     def have_ranking_with_utility_below_u(self, ranking, u):
-        d_umin_umax_share = self.d_ranking_umin_umax_share[ranking]
-        return sum([
-            _crop(my_division(u - umin, umax - umin)) * share
-            for (umin, umax), share in d_umin_umax_share.items()
-        ])
+        x, y_below, _ = self._d_ranking_cdf_breakpoints[ranking]
+        return _interpolate(x, y_below, u)
 
     def __repr__(self):
         """
@@ -436,27 +487,73 @@ d_weak_order_share={'a~b>c': Fraction(53, 100)})
             return cls.order_and_label_weak(t)
 
 
-def _crop(x, low=0, high=1):
-    """Crop a number to an interval.
+def _share_between(low, high, umin, umax, share):
+    """Share of voters whose utility is between two values, in a population whose utility is uniform.
 
     Parameters
     ----------
-    x : Number
     low : Number
     high : Number
+    umin : Number
+        Lower bound of the support of the uniform distribution.
+    umax : Number
+        Upper bound of the support of the uniform distribution.
+    share : Number
+        Total share of voters in this population.
 
     Returns
     -------
     Number
-        `x` in the general case, but `low` if `x` is lower and `high` if `x` is higher.
+        The share of voters whose utility is between `low` and `high`. When the interval `[low, high]` contains
+        (resp. does not meet) the interval `[umin, umax]`, the result is exactly `share` (resp. 0).
 
     Examples
     --------
-        >>> _crop(- 0.2)
+        >>> from fractions import Fraction
+        >>> _share_between(Fraction(1, 2), 1, 0, 1, Fraction(1, 3))
+        Fraction(1, 6)
+        >>> _share_between(0, 1, 0.2, 0.4, Fraction(1, 3))
+        Fraction(1, 3)
+        >>> _share_between(0.4, 1, 0.2, 0.4, Fraction(1, 3))
         0
-        >>> _crop(0.5)
+    """
+    low, high = max(low, umin), min(high, umax)
+    if low >= high:
+        return 0
+    if low == umin and high == umax:
+        return share
+    return my_division((high - low) * share, umax - umin)
+
+
+def _interpolate(x, y, u):
+    """Evaluate a piecewise linear function.
+
+    Parameters
+    ----------
+    x : list
+        Sorted list of the breakpoints.
+    y : list
+        Values of the function at the breakpoints.
+    u : Number
+        The point where the function is evaluated.
+
+    Returns
+    -------
+    Number
+        The value of the function at `u`. Outside the interval `[x[0], x[-1]]`, the function is constant.
+
+    Examples
+    --------
+        >>> _interpolate([0, 0.5, 1], [0, 1, 3], 0.25)
         0.5
-        >>> _crop(1.5)
+        >>> _interpolate([0, 0.5, 1], [0, 1, 3], 0.5)
         1
+        >>> _interpolate([0, 0.5, 1], [0, 1, 3], 1.5)
+        3
     """
-    return min(max(x, low), high)
+    k = bisect_right(x, u) - 1
+    if k < 0:
+        return y[0]
+    if x[k] == u or k == len(x) - 1 or y[k + 1] == y[k]:
+        return y[k]
+    return y[k] + my_division((y[k + 1] - y[k]) * (u - x[k]), x[k + 1] - x[k])
@@ -1,6 +1,9 @@
 from poisson_approval.constants.basic_constants import *
+import numpy as np
+from poisson_approval.random_factories.RandomBatch import RandomBatch
 from poisson_approval.random_factories.RandSimplexGridUniform import RandSimplexGridUniform
-from poisson_approval.utils.Util import initialize_random_seeds, rand_simplex_grid
+from poisson_approval.utils.Util import initialize_random_seeds, rand_simplex_grid, rand_integers_fixed_sum, \
+    my_division
 from poisson_approval.profiles.ProfileOrdinal import ProfileOrdinal
 from poisson_approval.profiles.ProfileHistogram import ProfileHistogram
 
@@ -66,6 +69,52 @@ cba: 1/17 [Fraction(3, 7) Fraction(4, 7) 0]> (Condorcet winner: a)
         d_ranking_histogram = {}
         for ranking in sorted(profile_ordinal.support_in_rankings):
             d_ranking_histogram[ranking] = rand_simplex_grid(d=self.n_bins, denominator=self.denominator_bins)
+        return self._profile_histogram(profile_ordinal, d_ranking_histogram)
+
+    def sample(self, n):
+        """Draw several profiles at once.
+
+        Parameters
+        ----------
+        n : int
+            Number of profiles.
+
+        Returns
+        -------
+        RandomBatch
+            The batch of profiles. The numerators of the random shares are drawn in one call to `numpy` and stored in
+            the array ``arrays[0]``, of shape ``(n, len(orders))``; the numerators of the random histograms are drawn
+            in another call and stored in the array ``arrays[1]``, of shape ``(n, 6, n_bins)`` (one histogram for each
+            ranking, in the order of ``RANKINGS``). The profiles are built only when they are accessed. They follow the
+            same distribution as the outputs of the factory, but they are not the same as with `n` successive calls
+            to the factory.
+
+        Examples
+        --------
+            >>> initialize_random_seeds()
+            >>> rand_profile = RandProfileHistogramGridUniform(denominator=17, denominator_bins=7, n_bins=2)
+            >>> batch = rand_profile.sample(1000)
+            >>> batch.arrays[1].shape
+            (1000, 6, 2)
+            >>> print(batch[0])
+            <abc: 4/17 [0 1], acb: 4/17 [Fraction(6, 7) Fraction(1, 7)], bac: 4/17 [Fraction(2, 7) Fraction(5, 7)], \
+cba: 5/17 [Fraction(5, 7) Fraction(2, 7)]>
+        """
+        return RandomBatch(arrays=(rand_integers_fixed_sum(d=self.n_keys, fixed_sum=self.denominator, n=n),
+                                   rand_integers_fixed_sum(d=self.n_bins, fixed_sum=self.denominator_bins,
+                                                           n=n * len(RANKINGS)).reshape(n, len(RANKINGS), self.n_bins)),
+                           build=self._build_histogram)
+
+    def _build_histogram(self, numerators, numerators_histograms):
+        """Build a profile from the numerators of a random point of the grid and of a random histogram for each
+        ranking."""
+        profile_ordinal = self._build(numerators)
+        return self._profile_histogram(profile_ordinal, {
+            ranking: np.array([my_division(int(numerator), self.denominator_bins)
+                               for numerator in numerators_histograms[RANKINGS.index(ranking)]])
+            for ranking in sorted(profile_ordinal.support_in_rankings)})
+
+    def _profile_histogram(self, profile_ordinal, d_ranking_histogram):
         return ProfileHistogram(d_ranking_share=profile_ordinal.d_ranking_share,
                                 d_ranking_histogram=d_ranking_histogram,
                                 d_weak_order_share=profile_ordinal.d_weak_order_share,
@@ -1,4 +1,5 @@
 from poisson_approval.constants.basic_constants import *
+from poisson_approval.random_factories.RandomBatch import RandomBatch
 from poisson_approval.random_factories.RandSimplexUniform import RandSimplexUniform
 from poisson_approval.utils.Util import initialize_random_seeds, rand_simplex
 from poisson_approval.profiles.ProfileOrdinal import ProfileOrdinal
@@ -59,6 +60,52 @@ cba: 0.2848106336275805 [0.0202184 0.0669109 0.9128707]> (Condorcet winner: a)
         d_ranking_histogram = {}
         for ranking in sorted(profile_ordinal.support_in_rankings):
             d_ranking_histogram[ranking] = rand_simplex(d=self.n_bins)
+        return self._profile_histogram(profile_ordinal, d_ranking_histogram)
+
+    def sample(self, n):
+        """Draw several profiles at once.
+
+        Parameters
+        ----------
+        n : int
+            Number of profiles.
+
+        Returns
+        -------
+        RandomBatch
+            The batch of profiles. The random shares are drawn in one call to `numpy` and stored in the array
+            ``arrays[0]``, of shape ``(n, len(orders))``; the random histograms are drawn in another call and stored
+            in the array ``arrays[1]``, of shape ``(n, 6, n_bins)`` (one histogram for each ranking, in the order of
+            ``RANKINGS``). The profiles are built only when they are accessed. They follow the same distribution as
+            the outputs of the factory, but they are not the same as with `n` successive calls to the factory.
+
+        Examples
+        --------
+            >>> initialize_random_seeds()
+            >>> rand_profile = RandProfileHistogramUniform(n_bins=2)
+            >>> batch = rand_profile.sample(1000)
+            >>> batch.arrays[1].shape
+            (1000, 6, 2)
+            >>> print(batch[0])
+            <abc: 0.4236547993389047 [0.36678022 0.63321978], \
+acb: 0.12122838365799216 [0.29762418 0.70237582], \
+bac: 0.0039303209304278885 [0.06859959 0.93140041], \
+bca: 0.05394987214431912 [0.35252753 0.64747247], \
+cab: 0.1124259903007756 [0.23219605 0.76780395], \
+cba: 0.2848106336275805 [0.76292734 0.23707266]> (Condorcet winner: a)
+        """
+        return RandomBatch(arrays=(rand_simplex(d=self.n_keys, n=n),
+                                   rand_simplex(d=self.n_bins, n=n * len(RANKINGS)).reshape(
+                                       n, len(RANKINGS), self.n_bins)),
+                           build=self._build_histogram)
+
+    def _build_histogram(self, x_simplex, histograms):
+        """Build a profile from a random point of the simplex and a random histogram for each ranking."""
+        profile_ordinal = self._build(x_simplex)
+        return self._profile_histogram(profile_ordinal, {
+            ranking: histograms[RANKINGS.index(ranking)] for ranking in sorted(profile_ordinal.support_in_rankings)})
+
+    def _profile_histogram(self, profile_ordinal, d_ranking_histogram):
         return ProfileHistogram(d_ranking_share=profile_ordinal.d_ranking_share,
                                 d_ranking_histogram=d_ranking_histogram,
                                 d_weak_order_share=profile_ordinal.d_weak_order_share,
@@ -1,4 +1,7 @@
-from poisson_approval.utils.Util import rand_simplex_grid, initialize_random_seeds
+import numpy as np
+from poisson_approval.random_factories.RandomBatch import RandomBatch
+from poisson_approval.utils.Util import rand_simplex_grid, initialize_random_seeds, rand_integers_fixed_sum, \
+    my_division
 from poisson_approval.utils.DictPrintingInOrder import DictPrintingInOrder
 
 
@@ -64,8 +67,43 @@ class RandSimplexGridUniform:
         self.total_variable_share = 1 - sum(self.d_key_fixed_share.values())
 
     def __call__(self):
-        x_simplex = rand_simplex_grid(d=self.n_keys, denominator=self.denominator) * self.total_variable_share
-        d_key_share = dict(zip(self.keys, x_simplex))
+        return self._build_from_simplex(rand_simplex_grid(d=self.n_keys, denominator=self.denominator))
+
+    def sample(self, n):
+        """Draw several objects at once.
+
+        Parameters
+        ----------
+        n : int
+            Number of objects.
+
+        Returns
+        -------
+        RandomBatch
+            The batch of objects. The numerators of the random shares are drawn in one call to `numpy` and stored in
+            the array ``arrays[0]``, of shape ``(n, len(keys))``; the objects are built only when they are accessed.
+
+        Examples
+        --------
+            >>> initialize_random_seeds()
+            >>> rand_dict = RandSimplexGridUniform(cls=DictPrintingInOrder, denominator=7, keys=['a', 'b'])
+            >>> batch = rand_dict.sample(3)
+            >>> batch
+            <RandomBatch of 3 objects>
+            >>> batch[0]
+            {'a': Fraction(4, 7), 'b': Fraction(3, 7)}
+        """
+        return RandomBatch(arrays=(rand_integers_fixed_sum(d=self.n_keys, fixed_sum=self.denominator, n=n), ),
+                           build=self._build)
+
+    def _build(self, numerators):
+        """Build an object from the numerators of a random point of the grid."""
+        return self._build_from_simplex(np.array([my_division(int(numerator), self.denominator)
+                                                  for numerator in numerators]))
+
+    def _build_from_simplex(self, x_simplex):
+        """Build an object from a random point of the grid."""
+        d_key_share = dict(zip(self.keys, x_simplex * self.total_variable_share))
         for key, fixed_share in self.d_key_fixed_share.items():
             d_key_share[key] = d_key_share.get(key, 0) + fixed_share
         return self.cls(d_key_share, **self.kwargs)
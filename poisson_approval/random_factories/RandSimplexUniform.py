@@ -1,3 +1,4 @@
+from poisson_approval.random_factories.RandomBatch import RandomBatch
 from poisson_approval.utils.Util import rand_simplex, initialize_random_seeds
 from poisson_approval.utils.DictPrintingInOrder import DictPrintingInOrder
 
@@ -60,8 +61,38 @@ class RandSimplexUniform:
         self.total_variable_share = 1 - sum(d_key_fixed_share.values())
 
     def __call__(self):
-        x_simplex = rand_simplex(d=self.n_keys) * self.total_variable_share
-        d_key_share = dict(zip(self.keys, x_simplex))
+        return self._build(rand_simplex(d=self.n_keys))
+
+    def sample(self, n):
+        """Draw several objects at once.
+
+        Parameters
+        ----------
+        n : int
+            Number of objects.
+
+        Returns
+        -------
+        RandomBatch
+            The batch of objects. The random shares are drawn in one call to `numpy` and stored in the array
+            ``arrays[0]``, of shape ``(n, len(keys))``; the objects are built only when they are accessed. They are the
+            same as with `n` successive calls to the factory.
+
+        Examples
+        --------
+            >>> initialize_random_seeds()
+            >>> rand_dict = RandSimplexUniform(cls=DictPrintingInOrder, keys=['a', 'b'])
+            >>> batch = rand_dict.sample(3)
+            >>> batch
+            <RandomBatch of 3 objects>
+            >>> batch[0]
+            {'a': 0.5488135039273248, 'b': 0.45118649607267525}
+        """
+        return RandomBatch(arrays=(rand_simplex(d=self.n_keys, n=n), ), build=self._build)
+
+    def _build(self, x_simplex):
+        """Build an object from a random point of the simplex."""
+        d_key_share = dict(zip(self.keys, x_simplex * self.total_variable_share))
         for key, fixed_share in self.d_key_fixed_share.items():
             d_key_share[key] = d_key_share.get(key, 0) + fixed_share
         return self.cls(d_key_share, **self.kwargs)
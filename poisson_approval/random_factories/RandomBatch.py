@@ -0,0 +1,46 @@
+from collections.abc import Sequence
+
+
+class RandomBatch(Sequence):
+    """A batch of random objects, stored in arrays and built lazily.
+
+    The random numbers of the whole batch are drawn at once and stored in `numpy` arrays. An object is only built
+    when it is accessed, e.g. by ``batch[i]`` or by iterating over the batch. It is built again at each access: to
+    keep the objects, use e.g. ``list(batch)``.
+
+    Parameters
+    ----------
+    arrays : tuple of numpy.ndarray
+        The random numbers. The first dimension of each array is the index of the object in the batch.
+    build : callable
+        A function whose inputs are the rows of the arrays for one object (in the same order as `arrays`), and whose
+        output is the object.
+
+    Examples
+    --------
+        >>> import numpy as np
+        >>> batch = RandomBatch(arrays=(np.array([[1, 2], [3, 4], [5, 6]]), ), build=lambda row: int(row.sum()))
+        >>> len(batch)
+        3
+        >>> batch[1]
+        7
+        >>> list(batch)
+        [3, 7, 11]
+        >>> batch[1:]
+        <RandomBatch of 2 objects>
+    """
+
+    def __init__(self, arrays, build):
+        self.arrays = arrays
+        self.build = build
+
+    def __repr__(self):
+        return '<RandomBatch of %s objects>' % len(self)
+
+    def __len__(self):
+        return len(self.arrays[0])
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return RandomBatch(arrays=tuple(array[item] for array in self.arrays), build=self.build)
+        return self.build(*[array[item] for array in self.arrays])
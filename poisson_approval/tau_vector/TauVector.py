@@ -7,6 +7,7 @@ from poisson_approval.best_response.BestResponsePlurality import BestResponsePlu
 from poisson_approval.constants.basic_constants import *
 from poisson_approval.constants.Focus import Focus
 from poisson_approval.containers.Scores import Scores
+from poisson_approval.events.Asymptotic import Asymptotic
 from poisson_approval.events.EventDuo import EventDuo
 from poisson_approval.events.EventPivotStrict import EventPivotStrict
 from poisson_approval.events.EventPivotTij import EventPivotTij
@@ -15,8 +16,9 @@ from poisson_approval.events.EventTrio import EventTrio
 from poisson_approval.events.EventTrio1t import EventTrio1t
 from poisson_approval.events.EventTrio2t import EventTrio2t
 from poisson_approval.events.EventPivotWeak import EventPivotWeak
+from poisson_approval.tau_vector.TauVectorCache import TauVectorCache
 from poisson_approval.utils.computation_engine import computation_engine
-from poisson_approval.utils.DictPrintingInOrder import DictPrintingInOrder
+from poisson_approval.utils.DictPrintingInOrderLazy import DictPrintingInOrderLazy
 from poisson_approval.utils.DictPrintingInOrderIgnoringZeros import DictPrintingInOrderIgnoringZeros
 from poisson_approval.utils.Util import my_division
 from poisson_approval.utils.UtilBallots import sort_ballot
@@ -37,12 +39,22 @@ class TauVector:
         Whether the computations are symbolic or numeric.
     normalization_warning : bool
         Whether a warning should be issued if the input distribution is not normalized.
+    trio_warm_start : TrioWarmStart, optional
+        If given, the optimizer of the trio events starts from the optimal values found for the previous tau-vectors
+        sharing the same :class:`TrioWarmStart` (if possible). This is useful when successive tau-vectors are close to
+        each other, e.g. in :meth:`~poisson_approval.ProfileCardinal.fictitious_play`.
+    phase_timer : PhaseTimer, optional
+        If given, the time spent in the computation of the events of this tau-vector, and the iterations of the
+        optimizer of its trio events, are recorded in this :class:`PhaseTimer`.
 
     Notes
     -----
     If the input distribution `d_ballot_share` is not normalized, the tau vector will be normalized anyway and a
     warning will be issued (unless `normalization_warning` is False).
 
+    If a :class:`TauVectorCache` is active, the tau-vector shares its analyses (events, best responses, etc.) with
+    the previous tau-vectors having the same ballot shares and voting rule.
+
     Examples
     --------
         >>> from fractions import Fraction
@@ -168,8 +180,10 @@ phi_ab = 0.707107>
     """
 
     def __init__(self, d_ballot_share: dict, voting_rule=APPROVAL, symbolic=False,
-                 normalization_warning: bool = True):
+                 normalization_warning: bool = True, trio_warm_start=None, phase_timer=None):
         self.symbolic = symbolic
+        self.trio_warm_start = trio_warm_start
+        self.phase_timer = phase_timer
         self.ce = computation_engine(symbolic)
         # Populate the dictionary and check for typos in the input
         self.d_ballot_share = DictPrintingInOrderIgnoringZeros({
@@ -189,6 +203,9 @@ phi_ab = 0.707107>
             assert self.ab == self.ac == self.bc == 0
         elif self.voting_rule == ANTI_PLURALITY:
             assert self.a == self.b == self.c == 0
+        # Share the analyses with the previous identical tau-vectors (if a cache is active)
+        if TauVectorCache.active is not None:
+            self._cached_properties = TauVectorCache.active.cached_properties(self)
 
     def __repr__(self):
         arguments = repr(self.d_ballot_share)
@@ -312,10 +329,28 @@ phi_ab = 0.707107>
             >>> tau.standardized_version
             TauVector({'a': Fraction(3, 10), 'b': Fraction(1, 10), 'bc': Fraction(3, 5)})
         """
+        return self._standardization[0]
+
+    @cached_property
+    def _standardization(self):
+        """tuple : Tuple ``(standardized_version, d_candidate_standardized_candidate)``.
+
+        The dictionary `d_candidate_standardized_candidate` gives, for each candidate of this tau-vector, the
+        corresponding candidate in :attr:`standardized_version`.
+
+        Examples
+        --------
+            >>> from fractions import Fraction
+            >>> tau = TauVector({'a': Fraction(1, 10), 'ab': Fraction(3, 5), 'c': Fraction(3, 10)})
+            >>> standardized_version, d_candidate_standardized_candidate = tau._standardization
+            >>> d_candidate_standardized_candidate
+            {'a': 'b', 'b': 'c', 'c': 'a'}
+        """
         def translate(s, permute):
             return ''.join(sorted(s.replace('a', permute[0]).replace('b', permute[1]).replace('c', permute[2])))
 
         best_d = {}
+        best_perm = None
         best_signature = []
         for perm in XYZ_PERMUTATIONS:
             d_test = {translate(ballot, perm): share for ballot, share in self.d_ballot_share.items()}
@@ -323,9 +358,15 @@ phi_ab = 0.707107>
             if signature_test > best_signature:
                 best_signature = signature_test
                 best_d = d_test
-        return TauVector({ballot: best_d[xyz_ballot]
-                          for ballot, xyz_ballot in zip(BALLOTS_WITHOUT_INVERSIONS, XYZ_BALLOTS_WITHOUT_INVERSION)},
-                         voting_rule=self.voting_rule)
+                best_perm = perm
+        standardized_version = TauVector(
+            {ballot: best_d[xyz_ballot]
+             for ballot, xyz_ballot in zip(BALLOTS_WITHOUT_INVERSIONS, XYZ_BALLOTS_WITHOUT_INVERSION)},
+            voting_rule=self.voting_rule, symbolic=self.symbolic)
+        d_xyz_candidate = dict(zip(XYZ_BALLOTS_WITHOUT_INVERSION[:3], CANDIDATES))
+        d_candidate_standardized_candidate = {
+            candidate: d_xyz_candidate[best_perm[i]] for i, candidate in enumerate(CANDIDATES)}
+        return standardized_version, d_candidate_standardized_candidate
 
     @cached_property
     def is_standardized(self):
@@ -513,7 +554,7 @@ phi_ab = 0.707107>
 
     @cached_property
     def d_ranking_best_response(self):
-        """dict : Best response profile.
+        """DictPrintingInOrderLazy : Best response profile.
 
         * Key: a ranking (e.g. ``'abc'``).
         * Value: a :class:`BestResponse` (whose subclass depends on `voting_rule`).
@@ -524,17 +565,62 @@ phi_ab = 0.707107>
             >>> tau = TauVector({'a': Fraction(1, 10), 'ab': Fraction(3, 5), 'c': Fraction(3, 10)})
             >>> tau.d_ranking_best_response['abc']
             <ballot = a, utility_threshold = 1, justification = Asymptotic method>
+
+        The best response of a ranking is created only when it is accessed. Hence, when only a few rankings are
+        needed (e.g. those present in a profile), the events used only by the other rankings are not computed.
+
+        If a :class:`TauVectorCache` with `symmetry` is active, the best responses are computed on the
+        :attr:`standardized_version`, then mapped back to this tau-vector (cf. :meth:`_best_response_by_symmetry`).
         """
         if self.voting_rule == APPROVAL:
-            return DictPrintingInOrder({
-                ranking: BestResponseApproval(tau=self, ranking=ranking) for ranking in RANKINGS})
-        if self.voting_rule == PLURALITY:
-            return DictPrintingInOrder({
-                ranking: BestResponsePlurality(tau=self, ranking=ranking) for ranking in RANKINGS})
-        if self.voting_rule == ANTI_PLURALITY:
-            return DictPrintingInOrder({
-                ranking: BestResponseAntiPlurality(tau=self, ranking=ranking) for ranking in RANKINGS})
-        raise NotImplementedError
+            best_response_class = BestResponseApproval
+        elif self.voting_rule == PLURALITY:
+            best_response_class = BestResponsePlurality
+        elif self.voting_rule == ANTI_PLURALITY:
+            best_response_class = BestResponseAntiPlurality
+        else:
+            raise NotImplementedError
+        if TauVectorCache.active is not None and TauVectorCache.active.symmetry and not self.is_standardized:
+            return DictPrintingInOrderLazy(
+                RANKINGS, partial(self._best_response_by_symmetry, best_response_class))
+        return DictPrintingInOrderLazy(
+            RANKINGS, partial(best_response_class, self))
+
+    def _best_response_by_symmetry(self, best_response_class, ranking):
+        """Best response of a ranking, deduced from the standardized version.
+
+        Parameters
+        ----------
+        best_response_class : type
+            The subclass of :class:`BestResponse` corresponding to the voting rule.
+        ranking : str
+            A ranking, e.g. ``'abc'``.
+
+        Returns
+        -------
+        BestResponse
+            The best response of `ranking`. Cf. :attr:`d_ranking_best_response`.
+
+        Notes
+        -----
+        The best response of a ranking only depends on the tau-vector up to a permutation of the candidates. Hence
+        the :attr:`~BestResponse.results` of the ranking ``'abc'`` are those of the ranking ``sigma(a) sigma(b)
+        sigma(c)`` in the :attr:`standardized_version`, where `sigma` is the permutation of the candidates. Only the
+        results are transferred: the events of this tau-vector are computed only if they are accessed.
+
+        Examples
+        --------
+            >>> from poisson_approval import BestResponseApproval
+            >>> tau = TauVector({'a': 0.1, 'ab': 0.6, 'c': 0.3})
+            >>> tau._best_response_by_symmetry(BestResponseApproval, 'abc')
+            <ballot = a, utility_threshold = 1, justification = Asymptotic method>
+        """
+        standardized_version, d_candidate_standardized_candidate = self._standardization
+        standardized_ranking = ''.join(d_candidate_standardized_candidate[candidate] for candidate in ranking)
+        best_response = best_response_class(tau=self, ranking=ranking)
+        best_response._cached_properties = {
+            'results': standardized_version.d_ranking_best_response[standardized_ranking].results}
+        return best_response
 
     @cached_property
     def is_best_response_ordinal(self):
@@ -552,26 +638,87 @@ phi_ab = 0.707107>
             for best_response in self.d_ranking_best_response.values()
         ])
 
+    @cached_property
+    def _d_pair_duo_terms(self):
+        """dict : Cache for :meth:`_duo_terms`. Key: a pair of candidates, e.g. ``'ab'``."""
+        return dict()
+
+    def _duo_terms(self, candidate_x, candidate_y):
+        """Intermediate results shared by the events based on the duo `xy`.
+
+        Parameters
+        ----------
+        candidate_x, candidate_y : str
+            Two candidates.
+
+        Returns
+        -------
+        w_x : Number
+            The share of the ballots supporting `x` but not `y`.
+        w_y : Number
+            The share of the ballots supporting `y` but not `x`.
+        asymptotic : Asymptotic
+            Asymptotic development of ``P(S_x = S_y)``.
+        ratio_x : Number
+            The offset of the ballots supporting `x` but not `y` (or nan if `w_x` is 0).
+        ratio_y : Number
+            The offset of the ballots supporting `y` but not `x` (or nan if `w_y` is 0).
+
+        Notes
+        -----
+        These values are computed only once for each pair, and used by :attr:`duo_ab`, :attr:`pivot_weak_ab`,
+        :attr:`pivot_strict_ab`, :attr:`score_ab_in_duo_ab`, etc.
+
+        Examples
+        --------
+            >>> from fractions import Fraction
+            >>> tau = TauVector({'a': Fraction(1, 10), 'ab': Fraction(3, 5), 'c': Fraction(3, 10)})
+            >>> w_a, w_c, asymptotic, ratio_a, ratio_c = tau._duo_terms('a', 'c')
+            >>> w_a, w_c
+            (Fraction(7, 10), Fraction(3, 10))
+            >>> print(asymptotic)
+            exp(- 0.0834849 n - 0.5 log n - 0.87535 + o(1))
+            >>> ratio_a, ratio_c
+            (0.6546536707079771, 1.5275252316519468)
+        """
+        try:
+            return self._d_pair_duo_terms[candidate_x + candidate_y]
+        except KeyError:
+            pass
+        candidate_z = ({'a', 'b', 'c'} - {candidate_x, candidate_y}).pop()
+        ce = self.ce
+        w_x = ce.S(getattr(self, candidate_x) + getattr(self, candidate_x + candidate_z))
+        w_y = ce.S(getattr(self, candidate_y) + getattr(self, candidate_y + candidate_z))
+        asymptotic = Asymptotic.poisson_eq(w_x, w_y, symbolic=self.symbolic)
+        ratio_x = ce.simplify(ce.sqrt(w_y / w_x)) if w_x > 0 else ce.nan
+        ratio_y = ce.simplify(ce.sqrt(w_x / w_y)) if w_y > 0 else ce.nan
+        terms = (w_x, w_y, asymptotic, ratio_x, ratio_y)
+        self._d_pair_duo_terms[candidate_x + candidate_y] = terms
+        return terms
+
     @cached_property
     def score_ab_in_duo_ab(self):
         """Number : Common score of `a` and `b` in duo `ab`."""
-        return (self.ce.multiply_with_absorbing_zero(self.a, self.duo_ab.phi_a)
-                + self.ce.multiply_with_absorbing_zero(self.ab, self.duo_ab.phi_ab)
-                + self.ce.multiply_with_absorbing_zero(self.ac, self.duo_ab.phi_ac))
+        _, _, _, ratio_a, _ = self._duo_terms('a', 'b')
+        return (self.ce.multiply_with_absorbing_zero(self.a, ratio_a)
+                + self.ab
+                + self.ce.multiply_with_absorbing_zero(self.ac, ratio_a))
 
     @cached_property
     def score_ac_in_duo_ac(self):
         """Number : Common score of `a` and `c` in duo `ac`."""
-        return (self.ce.multiply_with_absorbing_zero(self.a, self.duo_ac.phi_a)
-                + self.ce.multiply_with_absorbing_zero(self.ab, self.duo_ac.phi_ab)
-                + self.ce.multiply_with_absorbing_zero(self.ac, self.duo_ac.phi_ac))
+        _, _, _, ratio_a, _ = self._duo_terms('a', 'c')
+        return (self.ce.multiply_with_absorbing_zero(self.a, ratio_a)
+                + self.ce.multiply_with_absorbing_zero(self.ab, ratio_a)
+                + self.ac)
 
     @cached_property
     def score_bc_in_duo_bc(self):
         """Number : Common score of `b` and `c` in duo `bc`."""
-        return (self.ce.multiply_with_absorbing_zero(self.b, self.duo_bc.phi_b)
-                + self.ce.multiply_with_absorbing_zero(self.ab, self.duo_bc.phi_ab)
-                + self.ce.multiply_with_absorbing_zero(self.bc, self.duo_bc.phi_bc))
+        _, _, _, ratio_b, _ = self._duo_terms('b', 'c')
+        return (self.ce.multiply_with_absorbing_zero(self.b, ratio_b)
+                + self.ce.multiply_with_absorbing_zero(self.ab, ratio_b)
+                + self.bc)
 
     @cached_property
     def score_ba_in_duo_ba(self):
@@ -591,23 +738,26 @@ phi_ab = 0.707107>
     @cached_property
     def score_c_in_duo_ab(self):
         """Number : Score of `c` in duo `ab`."""
-        return (self.ce.multiply_with_absorbing_zero(self.c, self.duo_ab.phi_c)
-                + self.ce.multiply_with_absorbing_zero(self.ac, self.duo_ab.phi_ac)
-                + self.ce.multiply_with_absorbing_zero(self.bc, self.duo_ab.phi_bc))
+        _, _, _, ratio_a, ratio_b = self._duo_terms('a', 'b')
+        return (self.c
+                + self.ce.multiply_with_absorbing_zero(self.ac, ratio_a)
+                + self.ce.multiply_with_absorbing_zero(self.bc, ratio_b))
 
     @cached_property
     def score_b_in_duo_ac(self):
         """Number : Score of `b` in duo `ac`."""
-        return (self.ce.multiply_with_absorbing_zero(self.b, self.duo_ac.phi_b)
-                + self.ce.multiply_with_absorbing_zero(self.ab, self.duo_ac.phi_ab)
-                + self.ce.multiply_with_absorbing_zero(self.bc, self.duo_ac.phi_bc))
+        _, _, _, ratio_a, ratio_c = self._duo_terms('a', 'c')
+        return (self.b
+                + self.ce.multiply_with_absorbing_zero(self.ab, ratio_a)
+                + self.ce.multiply_with_absorbing_zero(self.bc, ratio_c))
 
     @cached_property
     def score_a_in_duo_bc(self):
         """Number : Score of `a` in duo `bc`."""
-        return (self.ce.multiply_with_absorbing_zero(self.a, self.duo_bc.phi_a)
-                + self.ce.multiply_with_absorbing_zero(self.ab, self.duo_bc.phi_ab)
-                + self.ce.multiply_with_absorbing_zero(self.ac, self.duo_bc.phi_ac))
+        _, _, _, ratio_b, ratio_c = self._duo_terms('b', 'c')
+        return (self.a
+                + self.ce.multiply_with_absorbing_zero(self.ab, ratio_b)
+                + self.ce.multiply_with_absorbing_zero(self.ac, ratio_c))
 
     @cached_property
     def score_c_in_duo_ba(self):
@@ -0,0 +1,258 @@
+import warnings
+import numpy as np
+from functools import partial
+from poisson_approval.constants.basic_constants import *
+from poisson_approval.tau_vector.TauVector import TauVector
+from poisson_approval.utils.UtilBallots import sort_ballot
+from poisson_approval.utils.UtilCache import cached_property
+
+
+# noinspection PyUnresolvedReferences
+class TauVectorBatch:
+    """A batch of tau-vectors, stored as a 2d array.
+
+    Parameters
+    ----------
+    shares : array_like
+        Array of shape ``(n, 6)``. Each row is a tau-vector, the columns being the ballots
+        of :attr:`~poisson_approval.BALLOTS_WITHOUT_INVERSIONS` (in this order). Rows are normalized if necessary.
+    voting_rule : str
+        The voting rule. Possible values are ``APPROVAL``, ``PLURALITY`` and ``ANTI_PLURALITY``.
+    normalization_warning : bool
+        Whether a warning should be issued if some input rows are not normalized.
+
+    Notes
+    -----
+    This class computes the same quantities as :class:`TauVector` for all the rows at once, with `numpy` operations
+    on floats. It is meant for large sweeps (e.g. ternary plots or Monte-Carlo analyses), where building one
+    :class:`TauVector` object per tau-vector would be too costly. Symbolic computation is not supported.
+
+    For a given attribute, the value in row ``i`` is the same as the value of the corresponding attribute of
+    ``self[i]``, which is a :class:`TauVector`. For attributes indexed by the candidates (such as :attr:`scores`),
+    the columns correspond to :attr:`~poisson_approval.CANDIDATES`.
+
+    Examples
+    --------
+        >>> taus = TauVectorBatch([[0.1, 0, 0.3, 0.6, 0, 0],
+        ...                        [0.4, 0.6, 0, 0, 0, 0]])
+        >>> len(taus)
+        2
+        >>> taus.ab
+        array([0.6, 0. ])
+        >>> taus[0]
+        TauVector({'a': 0.1, 'ab': 0.6, 'c': 0.3})
+        >>> taus.scores
+        array([[0.7, 0.6, 0.3],
+               [0.4, 0.6, 0. ]])
+        >>> taus.winners
+        array([[ True, False, False],
+               [False,  True, False]])
+    """
+
+    def __init__(self, shares, voting_rule=APPROVAL, normalization_warning: bool = True):
+        self.shares = np.array(shares, dtype=float, ndmin=2)
+        if self.shares.ndim != 2 or self.shares.shape[1] != len(BALLOTS_WITHOUT_INVERSIONS):
+            raise ValueError('shares must be an array of shape (n, %s).' % len(BALLOTS_WITHOUT_INVERSIONS))
+        # Normalize if necessary
+        totals = np.sum(self.shares, axis=1)
+        if not np.all(np.isclose(totals, 1, rtol=1e-9, atol=0)):
+            if normalization_warning and not np.all(np.isclose(totals, 1, rtol=1e-5, atol=0)):
+                warnings.warn(NORMALIZATION_WARNING)
+            self.shares = self.shares / totals[:, np.newaxis]
+        # Voting rule
+        self.voting_rule = voting_rule
+        if self.voting_rule == PLURALITY:
+            assert np.all(self.ab == 0) and np.all(self.ac == 0) and np.all(self.bc == 0)
+        elif self.voting_rule == ANTI_PLURALITY:
+            assert np.all(self.a == 0) and np.all(self.b == 0) and np.all(self.c == 0)
+
+    @classmethod
+    def from_tau_vectors(cls, taus):
+        """Build a batch from tau-vectors.
+
+        Parameters
+        ----------
+        taus : iterable of TauVector
+            The tau-vectors. They must all have the same voting rule.
+
+        Returns
+        -------
+        TauVectorBatch
+            The batch of these tau-vectors.
+
+        Examples
+        --------
+            >>> taus = TauVectorBatch.from_tau_vectors([TauVector({'a': 0.4, 'b': 0.6}),
+            ...                                         TauVector({'ab': 1})])
+            >>> taus.shares
+            array([[0.4, 0.6, 0. , 0. , 0. , 0. ],
+                   [0. , 0. , 0. , 1. , 0. , 0. ]])
+        """
+        taus = list(taus)
+        voting_rules = {tau.voting_rule for tau in taus}
+        if len(voting_rules) > 1:
+            raise ValueError('All the tau-vectors must have the same voting rule.')
+        voting_rule = voting_rules.pop() if voting_rules else APPROVAL
+        shares = np.array([[float(tau.d_ballot_share[ballot]) for ballot in BALLOTS_WITHOUT_INVERSIONS]
+                           for tau in taus], dtype=float).reshape((len(taus), len(BALLOTS_WITHOUT_INVERSIONS)))
+        return cls(shares, voting_rule=voting_rule, normalization_warning=False)
+
+    def __len__(self):
+        return self.shares.shape[0]
+
+    def __getitem__(self, i):
+        """TauVector: The tau-vector in row `i`."""
+        return TauVector({ballot: float(share) for ballot, share in zip(BALLOTS_WITHOUT_INVERSIONS, self.shares[i, :])},
+                         voting_rule=self.voting_rule, normalization_warning=False)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__(self):
+        arguments = np.array2string(self.shares, separator=', ')
+        if self.voting_rule != APPROVAL:
+            arguments += ', voting_rule=%r' % self.voting_rule
+        return 'TauVectorBatch(%s)' % arguments
+
+    @cached_property
+    def scores(self):
+        """numpy.ndarray : The scores. Array of shape ``(n, 3)``.
+
+        Examples
+        --------
+            >>> taus = TauVectorBatch([[0.1, 0, 0.3, 0.6, 0, 0]])
+            >>> taus.scores
+            array([[0.7, 0.6, 0.3]])
+        """
+        return np.stack([self.a + self.ab + self.ac,
+                         self.b + self.ab + self.bc,
+                         self.c + self.ac + self.bc], axis=1)
+
+    @cached_property
+    def winners(self):
+        """numpy.ndarray : The winners. Array of booleans of shape ``(n, 3)``.
+
+        Examples
+        --------
+            >>> taus = TauVectorBatch([[0.1, 0, 0.3, 0.6, 0, 0]])
+            >>> taus.winners
+            array([[ True, False, False]])
+        """
+        return self.scores == np.max(self.scores, axis=1)[:, np.newaxis]
+
+    @cached_property
+    def has_two_consecutive_zeros(self):
+        """numpy.ndarray : Whether each tau-vector has two consecutive holes in the "compass" representation. Array of
+        booleans of shape ``(n,)``.
+
+        Examples
+        --------
+            >>> taus = TauVectorBatch([[0.1, 0, 0.3, 0.6, 0, 0],
+            ...                        [0.1, 0.2, 0.3, 0.4, 0, 0]])
+            >>> taus.has_two_consecutive_zeros
+            array([ True, False])
+        """
+        a, b, c, ab, ac, bc = self.shares.T
+        return (((a == 0) & ((ab == 0) | (ac == 0)))
+                | ((b == 0) & ((ab == 0) | (bc == 0)))
+                | ((c == 0) & ((ac == 0) | (bc == 0))))
+
+    def _duo_scores(self, x, y, z):
+        """Scores in the duo `xy`.
+
+        Parameters
+        ----------
+        x, y, z : str
+            The candidates, with ``x < y``.
+
+        Returns
+        -------
+        score_xy : numpy.ndarray
+            Common score of `x` and `y` in duo `xy`.
+        score_z : numpy.ndarray
+            Score of `z` in duo `xy`.
+        """
+        tau_x, tau_y, tau_z = getattr(self, x), getattr(self, y), getattr(self, z)
+        tau_xy, tau_xz, tau_yz = getattr(self, x + y), getattr(self, x + z), getattr(self, y + z)
+        w_x = tau_x + tau_xz
+        w_y = tau_y + tau_yz
+        # In the duo, phi_x = phi_xz = sqrt(w_y / w_x) and phi_y = phi_yz = sqrt(w_x / w_y). When one of the weights
+        # is 0, the corresponding shares are 0 as well, and the offset is absorbed.
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio_y_x = np.where(w_x > 0, np.sqrt(w_y / w_x), 0.)
+            ratio_x_y = np.where(w_y > 0, np.sqrt(w_x / w_y), 0.)
+        score_xy = tau_x * ratio_y_x + tau_xy + tau_xz * ratio_y_x
+        score_z = tau_z + tau_xz * ratio_y_x + tau_yz * ratio_x_y
+        return score_xy, score_z
+
+    @cached_property
+    def _d_pair_duo_scores(self):
+        return {x + y: self._duo_scores(x, y, z) for x, y, z in RANKINGS if x < y}
+
+    def _pivot_tight(self, pair):
+        score_xy, score_z = self._d_pair_duo_scores[pair]
+        # Same as ``math.isclose`` with its default tolerance, as in :meth:`ComputationEngine.look_equal`.
+        return np.abs(score_xy - score_z) <= 1e-9 * np.maximum(np.abs(score_xy), np.abs(score_z))
+
+    def _pivot_easy(self, pair):
+        score_xy, score_z = self._d_pair_duo_scores[pair]
+        return (score_xy > score_z) & ~ self._pivot_tight(pair)
+
+
+def _f_ballot_share(self, ballot):
+    """Shares of this ballot"""
+    # This function is used to define an attribute for each ballot.
+    return self.shares[:, BALLOTS_WITHOUT_INVERSIONS.index(sort_ballot(ballot))]
+
+
+for my_ballot in BALLOTS_WITH_INVERSIONS:
+    setattr(TauVectorBatch, my_ballot, property(partial(_f_ballot_share, ballot=my_ballot)))
+    if sort_ballot(my_ballot) == my_ballot:
+        getattr(TauVectorBatch, my_ballot).__doc__ = \
+            "numpy.ndarray: Shares of the ballot ``'%s'``. Array of shape ``(n,)``." % my_ballot
+    else:
+        getattr(TauVectorBatch, my_ballot).__doc__ = \
+            "numpy.ndarray: Shares of the ballot ``'%s'`` (alternate notation)." % sort_ballot(my_ballot)
+
+
+# Duo scores and pivot flags: create cached properties like score_ab_in_duo_ab, pivot_ab_easy, etc.
+
+
+def _f_score_xy_in_duo_xy(self, pair):
+    return self._d_pair_duo_scores[pair][0]
+
+
+def _f_score_z_in_duo_xy(self, pair):
+    return self._d_pair_duo_scores[pair][1]
+
+
+def _f_pivot_easy(self, pair):
+    return self._pivot_easy(pair)
+
+
+def _f_pivot_tight(self, pair):
+    return self._pivot_tight(pair)
+
+
+def _f_pivot_easy_or_tight(self, pair):
+    return self._pivot_easy(pair) | self._pivot_tight(pair)
+
+
+for my_x, my_y, my_z in RANKINGS:
+    my_pair = ''.join(sorted(my_x + my_y))
+    for my_name, my_f, my_doc in [
+            ('score_%s%s_in_duo_%s%s' % (my_x, my_y, my_x, my_y), _f_score_xy_in_duo_xy,
+             'numpy.ndarray : Common score of `%s` and `%s` in duo `%s%s`.' % (my_x, my_y, my_x, my_y)),
+            ('score_%s_in_duo_%s%s' % (my_z, my_x, my_y), _f_score_z_in_duo_xy,
+             'numpy.ndarray : Score of `%s` in duo `%s%s`.' % (my_z, my_x, my_y)),
+            ('pivot_%s%s_easy' % (my_x, my_y), _f_pivot_easy,
+             'numpy.ndarray : True if the pivot `%s%s` is easy (and not tight).' % (my_x, my_y)),
+            ('pivot_%s%s_tight' % (my_x, my_y), _f_pivot_tight,
+             'numpy.ndarray : True if the pivot `%s%s` is tight.' % (my_x, my_y)),
+            ('pivot_%s%s_easy_or_tight' % (my_x, my_y), _f_pivot_easy_or_tight,
+             'numpy.ndarray : True if the pivot `%s%s` is easy or tight, False if it is difficult.' % (my_x, my_y))]:
+        setattr(TauVectorBatch, my_name, partial(my_f, pair=my_pair))
+        getattr(TauVectorBatch, my_name).__name__ = my_name
+        setattr(TauVectorBatch, my_name, cached_property(getattr(TauVectorBatch, my_name)))
+        getattr(TauVectorBatch, my_name).__doc__ = my_doc
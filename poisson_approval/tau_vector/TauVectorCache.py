@@ -0,0 +1,177 @@
+from collections import OrderedDict
+from poisson_approval.constants.basic_constants import *
+
+
+class TauVectorCache:
+    """A bounded cache of tau-vector analyses, shared by all tau-vectors (LRU policy).
+
+    Parameters
+    ----------
+    max_size : int
+        Maximal number of tau-vectors whose analyses are stored. When the cache is full, the least recently used entry
+        is evicted.
+    decimals : int
+        Number of decimals used to round the float shares in the key of a tau-vector.
+    symmetry : bool
+        If True, the best responses of a tau-vector are deduced from those of its
+        :attr:`~TauVector.standardized_version` (cf. below).
+
+    Attributes
+    ----------
+    n_hits : int
+        Number of tau-vectors that reused an analysis already in the cache.
+    n_misses : int
+        Number of tau-vectors that started a new entry in the cache.
+    n_evictions : int
+        Number of entries evicted because the cache was full.
+
+    Notes
+    -----
+    The cache is used only when it is active, typically in a ``with`` block (cf. examples below). When a
+    :class:`TauVector` is created, its key is computed: its voting rule, whether it is symbolic, and its ballot shares
+    (float shares are rounded to `decimals` decimals). If a previous tau-vector had the same key, the new one reuses
+    everything that was computed for the previous one (events, :attr:`~TauVector.d_ranking_best_response`,
+    :attr:`~TauVector.winners`, etc.), and everything it computes is stored for the next ones.
+
+    This is useful when the same tau-vectors appear repeatedly, e.g. in the converged tail of
+    :meth:`~poisson_approval.ProfileCardinal.fictitious_play`, or in grid sweeps.
+
+    With `symmetry`, the tau-vectors that are identical up to a permutation of the candidates share their best
+    responses as well: the best responses are computed once on the standardized version (which is stored in the
+    cache like any other tau-vector), then mapped back through the permutation of the candidates. This is useful
+    for profiles or sweeps that are symmetric with respect to the candidates.
+
+    Examples
+    --------
+        >>> from poisson_approval import TauVector
+        >>> with TauVectorCache(max_size=2) as cache:
+        ...     tau = TauVector({'a': 0.4, 'ab': 0.6})
+        ...     best_responses = tau.d_ranking_best_response
+        ...     tau_again = TauVector({'a': 0.4, 'ab': 0.6})
+        ...     tau_again.d_ranking_best_response is best_responses
+        True
+        >>> cache
+        <n_entries = 1, max_size = 2, n_hits = 1, n_misses = 1, n_evictions = 0>
+
+    Outside the ``with`` block, the cache is not used anymore:
+
+        >>> TauVector({'a': 0.4, 'ab': 0.6}).d_ranking_best_response is best_responses
+        False
+        >>> cache.n_hits
+        1
+
+    Reuse the best responses across permutations of the candidates:
+
+        >>> with TauVectorCache(symmetry=True) as cache:
+        ...     tau = TauVector({'a': 0.4, 'ab': 0.6})
+        ...     tau_permuted = TauVector({'c': 0.4, 'bc': 0.6})
+        ...     print(tau.d_ranking_best_response['abc'])
+        ...     print(tau_permuted.d_ranking_best_response['cba'])
+        <ballot = a, utility_threshold = 1, justification = Asymptotic method>
+        <ballot = c, utility_threshold = 1, justification = Asymptotic method>
+        >>> len(cache)
+        2
+    """
+
+    #: The active cache, i.e. the one that is used when a tau-vector is created (or None).
+    active = None
+
+    def __init__(self, max_size=10000, decimals=12, symmetry=False):
+        self.max_size = max_size
+        self.decimals = decimals
+        self.symmetry = symmetry
+        self._d_key_cached_properties = OrderedDict()
+        self._previous_caches = []
+        self.n_hits = 0
+        self.n_misses = 0
+        self.n_evictions = 0
+
+    def __repr__(self):
+        return '<n_entries = %s, max_size = %s, n_hits = %s, n_misses = %s, n_evictions = %s>' % (
+            len(self), self.max_size, self.n_hits, self.n_misses, self.n_evictions)
+
+    def __len__(self):
+        return len(self._d_key_cached_properties)
+
+    def __enter__(self):
+        self.activate()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.deactivate()
+
+    def activate(self):
+        """Make this cache the active one.
+
+        The cache that was active before is restored by :meth:`deactivate`.
+        """
+        self._previous_caches.append(TauVectorCache.active)
+        TauVectorCache.active = self
+
+    def deactivate(self):
+        """Stop using this cache: restore the cache that was active before :meth:`activate` (if any)."""
+        TauVectorCache.active = self._previous_caches.pop() if self._previous_caches else None
+
+    def clear(self):
+        """Remove all the entries (the statistics are kept)."""
+        self._d_key_cached_properties.clear()
+
+    @property
+    def hit_rate(self):
+        """float : Proportion of tau-vectors that reused an analysis (or nan if there was no tau-vector yet)."""
+        n_requests = self.n_hits + self.n_misses
+        return self.n_hits / n_requests if n_requests > 0 else float('nan')
+
+    def key(self, tau):
+        """Key of a tau-vector.
+
+        Parameters
+        ----------
+        tau : TauVector
+
+        Returns
+        -------
+        tuple
+            The key of the tau-vector in this cache.
+
+        Examples
+        --------
+            >>> from poisson_approval import TauVector
+            >>> cache = TauVectorCache(decimals=3)
+            >>> cache.key(TauVector({'a': 0.1234, 'ab': 0.8766})) == cache.key(TauVector({'a': 0.1231, 'ab': 0.8769}))
+            True
+        """
+        return (tau.voting_rule, tau.symbolic) + tuple(
+            (float, round(tau.d_ballot_share[ballot], self.decimals))
+            if isinstance(tau.d_ballot_share[ballot], float)
+            else (type(tau.d_ballot_share[ballot]), tau.d_ballot_share[ballot])
+            for ballot in BALLOTS_WITHOUT_INVERSIONS
+        )
+
+    def cached_properties(self, tau):
+        """Storage of the analyses of a tau-vector.
+
+        Parameters
+        ----------
+        tau : TauVector
+
+        Returns
+        -------
+        dict
+            The dictionary where the cached properties of `tau` are stored. It is shared by all the tau-vectors with
+            the same key.
+        """
+        key = self.key(tau)
+        try:
+            cached_properties = self._d_key_cached_properties[key]
+        except KeyError:
+            self.n_misses += 1
+            cached_properties = dict()
+            self._d_key_cached_properties[key] = cached_properties
+            while len(self._d_key_cached_properties) > self.max_size:
+                self._d_key_cached_properties.popitem(last=False)
+                self.n_evictions += 1
+        else:
+            self.n_hits += 1
+            self._d_key_cached_properties.move_to_end(key)
+        return cached_properties
@@ -0,0 +1,77 @@
+from collections.abc import Mapping
+
+
+class DictPrintingInOrderLazy(Mapping):
+    """A read-only dictionary whose values are computed on demand, and that prints in the order of the keys.
+
+    Parameters
+    ----------
+    keys : iterable
+        The keys of the dictionary.
+    f : callable
+        The function that computes the value of a key. It is called only once per key, when the value is accessed
+        for the first time.
+
+    Notes
+    -----
+    Iterating over the keys, or testing whether a key is present, does not compute any value. On the other hand,
+    iterating over the values or items, as well as printing the dictionary, computes all the values.
+
+    Examples
+    --------
+        >>> def f(key):
+        ...     print('Compute %s' % key)
+        ...     return key.upper()
+        >>> d = DictPrintingInOrderLazy(['b', 'a', 'c'], f)
+        >>> d['a']
+        Compute a
+        'A'
+        >>> d['a']
+        'A'
+        >>> sorted(d)
+        ['a', 'b', 'c']
+        >>> print(d)
+        Compute b
+        Compute c
+        {a: A, b: B, c: C}
+        >>> print(repr(d))
+        {'a': 'A', 'b': 'B', 'c': 'C'}
+    """
+
+    def __init__(self, keys, f):
+        self._keys = list(keys)
+        self._f = f
+        self._d_key_value = dict()
+
+    def __getitem__(self, key):
+        try:
+            return self._d_key_value[key]
+        except KeyError:
+            pass
+        if key not in self._keys:
+            raise KeyError(key)
+        value = self._f(key)
+        self._d_key_value[key] = value
+        return value
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, key):
+        return key in self._keys
+
+    def __repr__(self):
+        return "{" + ", ".join([
+             "%r: %r" % (key, self[key]) for key in sorted(self)
+        ]) + "}"
+
+    def __str__(self):
+        return "{" + ", ".join([
+             "%s: %s" % (key, self[key]) for key in sorted(self)
+        ]) + "}"
+
+    def _repr_pretty_(self, p, cycle):  # pragma: no cover - Only for notebooks
+        p.text(str(self) if not cycle else '...')
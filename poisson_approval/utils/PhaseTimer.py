@@ -0,0 +1,125 @@
+from time import perf_counter
+
+
+class PhaseTimer:
+    """Timer of the phases of fictitious play or iterated voting.
+
+    Parameters
+    ----------
+    sink : callable, optional
+        If given, it is called with this :class:`PhaseTimer` as its only argument at the end of each run of
+        :meth:`~poisson_approval.ProfileCardinal.fictitious_play` or
+        :meth:`~poisson_approval.ProfileCardinal.iterated_voting` (e.g. to log the statistics).
+
+    Attributes
+    ----------
+    d_phase_time : dict
+        Key: name of the phase. Value: cumulative wall time spent in this phase (in seconds).
+    d_phase_n_calls : dict
+        Key: name of the phase. Value: number of times this phase was executed.
+    n_optimizations : int
+        Number of optimizations performed in the trio events (generic case of :class:`EventTrio`).
+    n_optimizer_iterations : int
+        Total number of iterations of the optimizer in these optimizations.
+
+    Notes
+    -----
+    The phases of each episode are:
+
+    * ``'tau_vectors'``: computation of the perceived tau-vector, the full response and the actual tau-vector.
+    * ``'events'``: computation of the events (pivots, trios, etc.) of these tau-vectors. It happens lazily, mostly
+      during the best responses.
+    * ``'best_responses'``: computation of the best responses, except the time spent in the events.
+    * ``'statistics'``: update of the winning frequencies and of the other statistics. Similarly, if a statistic
+      computes an event, the corresponding time is counted in ``'events'``.
+    * ``'convergence'``: test of convergence (or detection of a cycle).
+
+    The statistics are cumulative: if the same :class:`PhaseTimer` is used for several runs, e.g. for several
+    profiles, they are added up.
+
+    Examples
+    --------
+        >>> from fractions import Fraction
+        >>> from poisson_approval import ProfileHistogram
+        >>> profile = ProfileHistogram({'abc': Fraction(1, 2), 'cba': Fraction(1, 2)}, {'abc': [1], 'cba': [1]})
+        >>> timer = PhaseTimer()
+        >>> results = profile.fictitious_play(init='sincere', n_max_episodes=10, phase_timer=timer)
+        >>> results['phase_timer'] is timer
+        True
+        >>> timer
+        <d_phase_n_calls = {'tau_vectors': 2, 'events': 6, 'best_responses': 1, 'statistics': 1, 'convergence': 1}, \
+n_optimizations = 0, n_optimizer_iterations = 0>
+        >>> timer.total_time == sum(timer.d_phase_time.values())
+        True
+    """
+
+    def __init__(self, sink=None):
+        self.sink = sink
+        self.d_phase_time = dict()
+        self.d_phase_n_calls = dict()
+        self.n_optimizations = 0
+        self.n_optimizer_iterations = 0
+        self._time_lap = None
+        self._time_nested = 0
+
+    def __repr__(self):
+        return '<d_phase_n_calls = %s, n_optimizations = %s, n_optimizer_iterations = %s>' % (
+            self.d_phase_n_calls, self.n_optimizations, self.n_optimizer_iterations)
+
+    def start(self):
+        """Start timing the first phase of an episode."""
+        self._time_lap = perf_counter()
+        self._time_nested = 0
+
+    def lap(self, phase):
+        """End a phase and start timing the next one.
+
+        Parameters
+        ----------
+        phase : str
+            Name of the phase that ends. Its time is measured since the previous call to :meth:`start` or
+            :meth:`lap`, minus the time of the nested phases recorded with :meth:`add` in the meantime.
+        """
+        time_lap = perf_counter()
+        self._add(phase, time_lap - self._time_lap - self._time_nested)
+        self._time_lap = time_lap
+        self._time_nested = 0
+
+    def add(self, phase, elapsed):
+        """Record a nested phase, e.g. the computation of an event during the best responses.
+
+        Parameters
+        ----------
+        phase : str
+            Name of the nested phase.
+        elapsed : float
+            Time spent in this nested phase (in seconds). It is deduced from the time of the current phase.
+        """
+        self._add(phase, elapsed)
+        self._time_nested += elapsed
+
+    def _add(self, phase, elapsed):
+        self.d_phase_time[phase] = self.d_phase_time.get(phase, 0) + elapsed
+        self.d_phase_n_calls[phase] = self.d_phase_n_calls.get(phase, 0) + 1
+
+    def add_optimization(self, n_iterations):
+        """Record an optimization.
+
+        Parameters
+        ----------
+        n_iterations : int
+            The number of iterations of the optimizer.
+        """
+        self.n_optimizations += 1
+        self.n_optimizer_iterations += n_iterations
+
+    def stop(self):
+        """End of a run. If there is a `sink`, send this timer to it."""
+        self._time_lap = None
+        if self.sink is not None:
+            self.sink(self)
+
+    @property
+    def total_time(self):
+        """float : Total time spent in all the phases (in seconds)."""
+        return sum(self.d_phase_time.values())
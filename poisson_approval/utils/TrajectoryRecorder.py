@@ -0,0 +1,143 @@
+import os
+import numpy as np
+from poisson_approval.constants.basic_constants import *
+from poisson_approval.utils.Util import candidates_to_probabilities
+
+
+class TrajectoryRecorder:
+    """Recorder of the trajectory of fictitious play or iterated voting.
+
+    In each episode, the perceived tau-vector, the actual tau-vector, the utility thresholds of the strategy and the
+    winning probabilities of the candidates are written into preallocated `numpy` arrays (one row per episode), so
+    that recording a long trajectory does not keep any :class:`TauVector` or :class:`StrategyThreshold` object.
+
+    Parameters
+    ----------
+    file_name : str, optional
+        If given, the arrays are stored in a memory-mapped ``.npy`` file with this name, instead of the memory. This is
+        useful for very long runs. The file can be read later with ``numpy.load(file_name, mmap_mode='r')``: it is a
+        structured array with the fields ``'tau_perceived'``, ``'tau_actual'``, ``'utility_thresholds'`` and
+        ``'winning_probabilities'``, and one row per recorded episode. During the run, the file has `n_max_episodes`
+        rows; it is truncated to the recorded episodes by :meth:`stop` (if the run is interrupted, the rows after the
+        last recorded episode are zeros).
+
+    Attributes
+    ----------
+    n_episodes : int
+        Number of episodes recorded so far.
+
+    Notes
+    -----
+    The arrays are allocated by :meth:`start`, which is called by
+    :meth:`~poisson_approval.ProfileCardinal.fictitious_play` and
+    :meth:`~poisson_approval.ProfileCardinal.iterated_voting` with their value of `n_max_episodes`. The columns of the
+    tau-vectors are in the order of ``BALLOTS_WITHOUT_INVERSIONS``, those of the utility thresholds are in the order of
+    ``RANKINGS`` (``nan`` for the rankings that are not in the strategy), and those of the winning probabilities are in
+    the order of ``CANDIDATES``.
+
+    Examples
+    --------
+        >>> from fractions import Fraction
+        >>> from poisson_approval import ProfileHistogram
+        >>> profile = ProfileHistogram({'abc': Fraction(1, 2), 'cba': Fraction(1, 2)}, {'abc': [1], 'cba': [1]})
+        >>> recorder = TrajectoryRecorder()
+        >>> results = profile.fictitious_play(init='sincere', n_max_episodes=10, recorder=recorder)
+        >>> results['recorder'] is recorder
+        True
+        >>> recorder
+        <n_episodes = 1>
+        >>> recorder.taus_actual
+        array([[0.25, 0.  , 0.25, 0.25, 0.  , 0.25]])
+        >>> recorder.utility_thresholds
+        array([[0.5, nan, nan, nan, nan, 0.5]])
+        >>> recorder.winning_probabilities
+        array([[0.33333333, 0.33333333, 0.33333333]])
+    """
+
+    dtype = np.dtype([
+        ('tau_perceived', float, (len(BALLOTS_WITHOUT_INVERSIONS), )),
+        ('tau_actual', float, (len(BALLOTS_WITHOUT_INVERSIONS), )),
+        ('utility_thresholds', float, (len(RANKINGS), )),
+        ('winning_probabilities', float, (len(CANDIDATES), )),
+    ])
+
+    def __init__(self, file_name=None):
+        self.file_name = file_name
+        self.n_episodes = 0
+        self._data = np.zeros(0, dtype=self.dtype)
+
+    def __repr__(self):
+        return '<n_episodes = %s>' % self.n_episodes
+
+    def start(self, n_max_episodes):
+        """Allocate the arrays.
+
+        Parameters
+        ----------
+        n_max_episodes : int
+            Maximal number of episodes.
+        """
+        self.n_episodes = 0
+        if self.file_name is None:
+            self._data = np.zeros(n_max_episodes, dtype=self.dtype)
+        else:
+            self._data = np.lib.format.open_memmap(self.file_name, mode='w+', dtype=self.dtype,
+                                                   shape=(n_max_episodes, ))
+
+    def record(self, tau_perceived, tau_actual, strategy):
+        """Record an episode.
+
+        Parameters
+        ----------
+        tau_perceived : TauVector
+            The perceived tau-vector.
+        tau_actual : TauVector
+            The actual tau-vector.
+        strategy : Strategy
+            The strategy (best response to `tau_perceived`). For the rankings where it has no utility threshold, the
+            recorded threshold is ``nan``.
+        """
+        row = self._data[self.n_episodes]
+        row['tau_perceived'] = [float(tau_perceived.d_ballot_share[ballot]) for ballot in BALLOTS_WITHOUT_INVERSIONS]
+        row['tau_actual'] = [float(tau_actual.d_ballot_share[ballot]) for ballot in BALLOTS_WITHOUT_INVERSIONS]
+        d_ranking_threshold = getattr(strategy, 'd_ranking_threshold', dict())
+        row['utility_thresholds'] = [np.nan if d_ranking_threshold.get(ranking) is None
+                                     else float(d_ranking_threshold[ranking])
+                                     for ranking in RANKINGS]
+        row['winning_probabilities'] = candidates_to_probabilities(tau_actual.winners).astype(float)
+        self.n_episodes += 1
+
+    def stop(self):
+        """End of the recording.
+
+        If the arrays are memory-mapped, the file is rewritten with the recorded episodes only, so that it can be read
+        without knowing `n_episodes`.
+        """
+        if isinstance(self._data, np.memmap):
+            self._data.flush()
+            file_name_tmp = self.file_name + '.tmp.npy'
+            np.save(file_name_tmp, self._data[:self.n_episodes])
+            # Release the memory map of the old file before replacing it
+            self._data = None
+            os.replace(file_name_tmp, self.file_name)
+            self._data = np.load(self.file_name, mmap_mode='r+' if self.n_episodes > 0 else None)
+
+    @property
+    def taus_perceived(self):
+        """numpy.ndarray : Perceived tau-vectors. Array of shape ``(n_episodes, 6)``."""
+        return self._data['tau_perceived'][:self.n_episodes]
+
+    @property
+    def taus_actual(self):
+        """numpy.ndarray : Actual tau-vectors. Array of shape ``(n_episodes, 6)``."""
+        return self._data['tau_actual'][:self.n_episodes]
+
+    @property
+    def utility_thresholds(self):
+        """numpy.ndarray : Utility thresholds of the strategies. Array of shape ``(n_episodes, 6)``."""
+        return self._data['utility_thresholds'][:self.n_episodes]
+
+    @property
+    def winning_probabilities(self):
+        """numpy.ndarray : Winning probabilities of the candidates. Array of shape ``(n_episodes, 3)``."""
+        return self._data['winning_probabilities'][:self.n_episodes]
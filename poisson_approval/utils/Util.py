@@ -3,8 +3,10 @@ import random
 import itertools
 import numpy as np
 import sympy as sp
+from concurrent.futures import ProcessPoolExecutor
 from fractions import Fraction
 from decimal import Decimal
+from scipy.stats import norm
 from poisson_approval.constants.basic_constants import *
 from poisson_approval.utils.DictPrintingInOrder import DictPrintingInOrder
 from poisson_approval.utils.DictPrintingInOrderIgnoringZeros import DictPrintingInOrderIgnoringZeros
@@ -22,30 +24,115 @@ def initialize_random_seeds(n=0):
     np.random.seed(n)
 
 
-def rand_simplex(d=6):
+def spawn_random_seeds(seed, n, start=0):
+    """Derive independent random seeds from a root seed.
+
+    Parameters
+    ----------
+    seed : int
+        The root seed.
+    n : int
+        The number of seeds.
+    start : int
+        The index of the first seed. This gives the seeds ``start`` to ``start + n - 1`` of the same sequence, e.g.
+        to derive them by batches.
+
+    Returns
+    -------
+    list of int
+        A list of `n` seeds, that can be used with :func:`initialize_random_seeds`. They are derived from `seed` with
+        ``numpy.random.SeedSequence``, so that the corresponding random streams are independent. They only depend on
+        `seed`, `n` and `start`, not on the current state of the random generators.
+
+    Examples
+    --------
+        >>> seeds = spawn_random_seeds(42, 3)
+        >>> seeds == spawn_random_seeds(42, 3)
+        True
+        >>> len(set(seeds))
+        3
+        >>> seeds[1:] == spawn_random_seeds(42, 2, start=1)
+        True
+    """
+    return [int(np.random.SeedSequence(seed, spawn_key=(i, )).generate_state(1)[0]) for i in range(start, start + n)]
+
+
+def parallel_map(f, iterable, n_jobs=1, executor=None, chunksize=1, initializer=None, initargs=()):
+    """Apply a function to each element of an iterable, possibly in worker processes.
+
+    Parameters
+    ----------
+    f : callable
+        The function. If it is run in worker processes, it must be picklable (e.g. defined at the top level of a
+        module), and so must be the elements of `iterable` and the outputs.
+    iterable : iterable
+        The inputs.
+    n_jobs : int or None
+        Number of worker processes. If 1 (default), everything is computed in the current process. If None, the
+        number of processors of the machine is used.
+    executor : concurrent.futures.Executor, optional
+        If given, it is used instead of creating a pool of processes (and `n_jobs` is ignored).
+    chunksize : int
+        Number of inputs sent at once to a worker process. Cf. ``concurrent.futures.Executor.map``.
+    initializer : callable, optional
+        Function called with the arguments `initargs` at the start of each worker process, when a pool of processes
+        is created (i.e. when `executor` is None and `n_jobs` is not 1). With the start method ``'fork'`` (the
+        default on Linux), `initargs` need not be picklable.
+    initargs : tuple
+        Arguments of `initializer`.
+
+    Returns
+    -------
+    list
+        The outputs, in the same order as the inputs.
+
+    Examples
+    --------
+        >>> parallel_map(abs, [-1, 2, -3])
+        [1, 2, 3]
+        >>> parallel_map(abs, [-1, 2, -3], n_jobs=2)
+        [1, 2, 3]
+    """
+    if executor is not None:
+        return list(executor.map(f, iterable, chunksize=chunksize))
+    if n_jobs == 1:
+        return [f(x) for x in iterable]
+    with ProcessPoolExecutor(max_workers=n_jobs, initializer=initializer, initargs=initargs) as executor:
+        return list(executor.map(f, iterable, chunksize=chunksize))
+
+
+def rand_simplex(d=6, n=None):
     """Draw a random point in the simplex.
 
     Parameters
     ----------
     d : int
         Number of coordinates. In other words, we consider the simplex of dimension `d - 1`.
+    n : int, optional
+        If given, draw `n` points at once.
 
     Returns
     -------
     numpy.ndarray
-        A `numpy` array of length `d`, whose sum is 1.
+        A `numpy` array of length `d`, whose sum is 1. If `n` is given, an array of shape ``(n, d)``, whose rows are
+        the points. The rows are the same as with `n` successive calls without `n`.
 
     Examples
     --------
         >>> initialize_random_seeds()
         >>> rand_simplex(d=6)  # doctest: +SKIP
         array([0.4236548 , 0.12122838, 0.00393032, 0.05394987, 0.11242599, 0.28481063])
+        >>> rand_simplex(d=3, n=2).shape
+        (2, 3)
     """
-    x = np.sort(np.random.rand(d - 1))
-    return np.concatenate((x, [1])) - np.concatenate(([0], x))
+    if n is None:
+        x = np.sort(np.random.rand(d - 1))
+        return np.concatenate((x, [1])) - np.concatenate(([0], x))
+    x = np.sort(np.random.rand(n, d - 1), axis=1)
+    return np.diff(x, axis=1, prepend=0, append=1)
 
 
-def rand_integers_fixed_sum(d, fixed_sum):
+def rand_integers_fixed_sum(d, fixed_sum, n=None):
     """Generate integers with a given sum (uniformly).
 
     Parameters
@@ -54,19 +141,43 @@ def rand_integers_fixed_sum(d, fixed_sum):
         The desired number of integers. In other words, we consider a simplex of dimension `d - 1`.
     fixed_sum : int
         The fixed sum.
+    n : int, optional
+        If given, draw `n` arrays at once.
 
     Returns
     -------
     numpy.ndarray
-        A `numpy` array of `d` integers, whose sum is `fixed_sum`, and drawn uniformly.
+        A `numpy` array of `d` integers, whose sum is `fixed_sum`, and drawn uniformly. If `n` is given, an array of
+        shape ``(n, d)``, whose rows are drawn independently and uniformly.
 
     Examples
     --------
         >>> initialize_random_seeds()
         >>> rand_integers_fixed_sum(d=6, fixed_sum=100)
         array([ 2, 23, 34,  0, 22, 19])
+        >>> rand_integers_fixed_sum(d=3, fixed_sum=10, n=2)
+        array([[0, 1, 9],
+               [2, 0, 8]])
     """
     n_separators = d - 1
+    if n is not None:
+        # The positions of the separators are a uniform random subset of size `n_separators` among `n_positions`.
+        n_positions = fixed_sum + n_separators
+        if n_separators ** 2 > n_positions:
+            # Two separators would often coincide: take the positions with the smallest random keys. The array of keys
+            # is small, since `n_positions < n_separators ** 2`.
+            separators = np.sort(np.argpartition(
+                np.random.rand(n, n_positions), n_separators - 1, axis=1)[:, :n_separators], axis=1)
+        else:
+            # Two separators rarely coincide (the acceptance probability is about `exp(-1/2)` or more): we draw them
+            # independently, and draw again the rows where two separators coincide.
+            separators = np.sort(np.random.randint(n_positions, size=(n, n_separators)), axis=1)
+            with_duplicates = np.any(np.diff(separators, axis=1) == 0, axis=1)
+            while np.any(with_duplicates):
+                separators[with_duplicates] = np.sort(np.random.randint(
+                    n_positions, size=(np.sum(with_duplicates), n_separators)), axis=1)
+                with_duplicates = np.any(np.diff(separators, axis=1) == 0, axis=1)
+        return np.diff(separators, axis=1, prepend=-1, append=n_positions) - 1
     separators = np.concatenate((
         [-1],
         np.sort(np.random.choice(fixed_sum + n_separators, n_separators, replace=False)),
@@ -100,7 +211,7 @@ def rand_simplex_grid(d, denominator):
         for n in rand_integers_fixed_sum(d=d, fixed_sum=denominator)])
 
 
-def probability(factory, n_samples, test, conditional_on=None):
+def probability(factory, n_samples, test, conditional_on=None, half_width=None, batch_size=1000, confidence=0.95):
     """Probability that a random `something` meets some given test.
 
     Parameters
@@ -120,16 +231,28 @@ def probability(factory, n_samples, test, conditional_on=None):
     conditional_on : callable
         A function that take as input(s) the output(s) of the factory(ies) and that returns a Boolean.
         Default: always True.
+    half_width : Number, optional
+        If given, the samples are drawn by batches of `batch_size`, and the estimation stops as soon as the half-width
+        of the confidence interval of each probability is at most `half_width`. In that case, `n_samples` is the
+        maximum number of samples.
+    batch_size : int
+        Number of samples between two tests of the stopping rule (only used with `half_width`).
+    confidence : float
+        Confidence level of the intervals (only used with `half_width`). Cf. :func:`wilson_half_width`.
 
     Returns
     -------
-    float or tuple of float
+    float or tuple of float or dict
         This can be:
 
         * Either the probability that the output(s) generated by `factory` meet(s) `test`, conditional on the fact
           that it meets `conditional_on`, based on a Monte-Carlo estimation of `n_samples` trials.
         * Or a tuple giving this probability for each member of `test`, when `test` is a tuple itself.
 
+        If `half_width` is given, the output is a dictionary with the keys ``'probability'`` (as above),
+        ``'half_width'`` (the half-width of the confidence interval of each probability, which is a float or a tuple
+        of float, like the probability) and ``'n_samples'`` (the number of samples actually used).
+
     Examples
     --------
     In this basic example with one factory, we estimate the probability that a random float between 0 and 1 is greater
@@ -170,6 +293,20 @@ def probability(factory, n_samples, test, conditional_on=None):
         (0.661, 0.332)
 
     When using a tuple of tests, the same sample is used to estimate each probability.
+
+    In the following example, we stop as soon as the half-width of the confidence interval is at most 0.02, with a
+    maximum of 100000 samples:
+
+        >>> initialize_random_seeds()
+        >>> def rand_number():
+        ...     return random.random()
+        >>> results = probability(factory=rand_number, n_samples=100000, test=lambda x: x > .9, half_width=0.02)
+        >>> results['n_samples']
+        1000
+        >>> results['probability']
+        0.104
+        >>> print('%.4f' % results['half_width'])
+        0.0189
     """
     if not isinstance(factory, tuple):
         factory = (factory,)
@@ -185,14 +322,25 @@ def probability(factory, n_samples, test, conditional_on=None):
             for i_test, the_test in enumerate(test):
                 if the_test(*somethings):
                     l_test_success[i_test] += 1
-    l_test_rate = [successes / n_samples for successes in l_test_success]
+            if half_width is not None and i_samples % batch_size == 0 and all(
+                    wilson_half_width(successes / i_samples, i_samples, confidence) <= half_width
+                    for successes in l_test_success):
+                break
+    l_test_rate = [successes / i_samples for successes in l_test_success]
+    if half_width is not None:
+        l_half_width = [wilson_half_width(rate, i_samples, confidence) for rate in l_test_rate]
+        if is_test_tuple:
+            return {'probability': tuple(l_test_rate), 'half_width': tuple(l_half_width), 'n_samples': i_samples}
+        else:
+            return {'probability': l_test_rate[0], 'half_width': l_half_width[0], 'n_samples': i_samples}
     if is_test_tuple:
         return tuple(l_test_rate)
     else:
         return l_test_rate[0]
 
 
-def image_distribution(factory, n_samples, f, conditional_on=None):
+def image_distribution(factory, n_samples, f, conditional_on=None, half_width=None, batch_size=1000,
+                       confidence=0.95):
     """Distribution of `f(something)` for a random `something`.
 
     Parameters
@@ -209,14 +357,26 @@ def image_distribution(factory, n_samples, f, conditional_on=None):
     conditional_on : callable
         A function that take as input(s) the output(s) of the factory(ies) and that returns a Boolean.
         Default: always True.
+    half_width : Number, optional
+        If given, the samples are drawn by batches of `batch_size`, and the estimation stops as soon as the half-width
+        of the confidence interval of the probability of each obtained output is at most `half_width`. In that case,
+        `n_samples` is the maximum number of samples.
+    batch_size : int
+        Number of samples between two tests of the stopping rule (only used with `half_width`).
+    confidence : float
+        Confidence level of the intervals (only used with `half_width`). Cf. :func:`wilson_half_width`.
 
     Returns
     -------
-    DictPrintingInOrder
+    DictPrintingInOrder or dict
         Keys: the obtained outputs for `f`. Values: the probability that `f(something)` has this output when `something`
         is generated by `factory`, conditional on the fact that it meets `conditional_on`,
         based on a Monte-Carlo estimation of `n_samples` trials.
 
+        If `half_width` is given, the output is a dictionary with the keys ``'distribution'`` (as above),
+        ``'half_width'`` (the maximal half-width of the confidence intervals of the probabilities) and
+        ``'n_samples'`` (the number of samples actually used).
+
     Examples
     --------
     In this basic example with one factory, we compute the distribution of `n` modulo 10, when `n` is drawn uniformly
@@ -246,6 +406,21 @@ def image_distribution(factory, n_samples, f, conditional_on=None):
         >>> image_distribution(factory=(rand_integer, rand_divider),
         ...                    n_samples=100, f=modulo)
         {0: 0.31, 1: 0.16, 2: 0.18, 3: 0.12, 4: 0.07, 5: 0.04, 6: 0.02, 7: 0.08, 9: 0.02}
+
+    In the following example, we stop as soon as the half-width of each confidence interval is at most 0.05, with a
+    maximum of 10000 samples:
+
+        >>> initialize_random_seeds()
+        >>> def rand_integer():
+        ...     return np.random.randint(0, 100)
+        >>> def modulo_2(n):
+        ...     return n % 2
+        >>> results = image_distribution(factory=rand_integer, n_samples=10000, f=modulo_2, half_width=0.05,
+        ...                              batch_size=100)
+        >>> results['n_samples']
+        400
+        >>> results['distribution']
+        {0: 0.4725, 1: 0.5275}
     """
     if not isinstance(factory, tuple):
         factory = (factory,)
@@ -257,8 +432,50 @@ def image_distribution(factory, n_samples, f, conditional_on=None):
             i_samples += 1
             result = f(*somethings)
             d_result_occurrences[result] = d_result_occurrences.get(result, 0) + 1
-    return DictPrintingInOrder({result: occurrences / n_samples
-                                for result, occurrences in d_result_occurrences.items()})
+            if half_width is not None and i_samples % batch_size == 0 and all(
+                    wilson_half_width(occurrences / i_samples, i_samples, confidence) <= half_width
+                    for occurrences in d_result_occurrences.values()):
+                break
+    distribution = DictPrintingInOrder({result: occurrences / i_samples
+                                        for result, occurrences in d_result_occurrences.items()})
+    if half_width is not None:
+        return {'distribution': distribution,
+                'half_width': max([wilson_half_width(frequency, i_samples, confidence)
+                                   for frequency in distribution.values()], default=0),
+                'n_samples': i_samples}
+    return distribution
+
+
+def wilson_half_width(frequency, n_samples, confidence=0.95):
+    """Half-width of the Wilson score interval of a probability estimated by Monte-Carlo.
+
+    Unlike the usual normal approximation, this interval does not collapse when the observed frequency is 0 or 1,
+    which makes it suitable for the stopping rule of sequential estimations of rare events.
+
+    Parameters
+    ----------
+    frequency : Number
+        The observed frequency.
+    n_samples : int
+        Number of samples.
+    confidence : float
+        Confidence level of the interval.
+
+    Returns
+    -------
+    float
+        The half-width of the interval.
+
+    Examples
+    --------
+        >>> print('%.4f' % wilson_half_width(0.5, 100))
+        0.0962
+        >>> print('%.4f' % wilson_half_width(0, 100))
+        0.0185
+    """
+    z = norm.ppf((1 + confidence) / 2)
+    return float(z * math.sqrt(frequency * (1 - frequency) / n_samples + z ** 2 / (4 * n_samples ** 2))
+                 / (1 + z ** 2 / n_samples))
 
 
 def _false_for_fraction(f):
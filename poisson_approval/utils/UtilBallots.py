@@ -1,5 +1,6 @@
-from poisson_approval.constants.basic_constants import APPROVAL, PLURALITY, ANTI_PLURALITY, \
-    CANDIDATES, PAIRS_WITHOUT_INVERSIONS, BALLOTS_WITHOUT_INVERSIONS_SORTED_ALPHABETICAL
+import numpy as np
+from poisson_approval.constants.basic_constants import APPROVAL, PLURALITY, ANTI_PLURALITY, RANKINGS, \
+    CANDIDATES, PAIRS_WITHOUT_INVERSIONS, BALLOTS_WITHOUT_INVERSIONS, BALLOTS_WITHOUT_INVERSIONS_SORTED_ALPHABETICAL
 
 
 def allowed_ballots(voting_rule=APPROVAL):
@@ -188,6 +189,92 @@ def ballot_high_u(ranking, voting_rule):
         raise NotImplementedError
 
 
+def matrix_ballot_low_u(voting_rule):
+    """Matrix of the ballots chosen by the voters who have a low utility for their middle candidate.
+
+    Parameters
+    ----------
+    voting_rule : str
+        The voting rule. Possible values are ``APPROVAL``, ``PLURALITY`` and ``ANTI_PLURALITY``.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of shape ``(6, 6)``. The coefficient `(r, b)` is 1 if `b`-th ballot of ``BALLOTS_WITHOUT_INVERSIONS``
+        is :func:`ballot_low_u` of the `r`-th ranking of ``RANKINGS``, and 0 otherwise. In other words, if `shares`
+        is an array of shares of voters, the last axis corresponding to ``RANKINGS``, then ``shares @ matrix`` gives
+        the corresponding shares of ballots.
+
+    Examples
+    --------
+        >>> matrix_ballot_low_u(ANTI_PLURALITY)
+        array([[0., 0., 0., 0., 1., 0.],
+               [0., 0., 0., 1., 0., 0.],
+               [0., 0., 0., 0., 0., 1.],
+               [0., 0., 0., 1., 0., 0.],
+               [0., 0., 0., 0., 0., 1.],
+               [0., 0., 0., 0., 1., 0.]])
+    """
+    return _matrix_ranking_ballot(lambda ranking: ballot_low_u(ranking, voting_rule))
+
+
+def matrix_ballot_high_u(voting_rule):
+    """Matrix of the ballots chosen by the voters who have a high utility for their middle candidate.
+
+    Parameters
+    ----------
+    voting_rule : str
+        The voting rule. Possible values are ``APPROVAL``, ``PLURALITY`` and ``ANTI_PLURALITY``.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of shape ``(6, 6)``. The coefficient `(r, b)` is 1 if `b`-th ballot of ``BALLOTS_WITHOUT_INVERSIONS``
+        is :func:`ballot_high_u` of the `r`-th ranking of ``RANKINGS``, and 0 otherwise.
+
+    Examples
+    --------
+        >>> matrix_ballot_high_u(APPROVAL)
+        array([[0., 0., 0., 1., 0., 0.],
+               [0., 0., 0., 0., 1., 0.],
+               [0., 0., 0., 1., 0., 0.],
+               [0., 0., 0., 0., 0., 1.],
+               [0., 0., 0., 0., 1., 0.],
+               [0., 0., 0., 0., 0., 1.]])
+    """
+    return _matrix_ranking_ballot(lambda ranking: ballot_high_u(ranking, voting_rule))
+
+
+def _matrix_ranking_ballot(f):
+    """Matrix of a function that maps a ranking to a ballot.
+
+    Parameters
+    ----------
+    f : callable
+        Input: a ranking. Output: a ballot.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of shape ``(6, 6)``. The coefficient `(r, b)` is 1 if `b`-th ballot of ``BALLOTS_WITHOUT_INVERSIONS``
+        is the image of the `r`-th ranking of ``RANKINGS``, and 0 otherwise.
+
+    Examples
+    --------
+        >>> _matrix_ranking_ballot(ballot_one)
+        array([[1., 0., 0., 0., 0., 0.],
+               [1., 0., 0., 0., 0., 0.],
+               [0., 1., 0., 0., 0., 0.],
+               [0., 1., 0., 0., 0., 0.],
+               [0., 0., 1., 0., 0., 0.],
+               [0., 0., 1., 0., 0., 0.]])
+    """
+    matrix = np.zeros((len(RANKINGS), len(BALLOTS_WITHOUT_INVERSIONS)))
+    for r, ranking in enumerate(RANKINGS):
+        matrix[r, BALLOTS_WITHOUT_INVERSIONS.index(sort_ballot(f(ranking)))] = 1
+    return matrix
+
+
 def sort_ballot(ballot):
     """Put a ballot in alphabetical order.
 
@@ -0,0 +1,44 @@
+import pytest
+from fractions import Fraction
+from poisson_approval import RandProfileHistogramUniform, RandProfileDiscreteUniform, ProfileHistogram, \
+    initialize_random_seeds, one_over_log_t_plus_one, EquilibriumStatus, APPROVAL, PLURALITY, ANTI_PLURALITY
+
+
+@pytest.mark.parametrize('voting_rule', [APPROVAL, PLURALITY, ANTI_PLURALITY])
+def test_converges_when_fictitious_play_converges(voting_rule):
+    initialize_random_seeds(42)
+    factory_histogram = RandProfileHistogramUniform(n_bins=2, voting_rule=voting_rule)
+    factory_discrete = RandProfileDiscreteUniform(types=[('abc', 0.3), ('bac', 0.6), ('cab', 0.5), 'a~b>c', 'c>a~b'],
+                                                  voting_rule=voting_rule)
+    for profile in [factory_histogram() for _ in range(5)] + [factory_discrete() for _ in range(5)]:
+        expected = profile.fictitious_play(init='sincere', n_max_episodes=200,
+                                           perception_update_ratio=one_over_log_t_plus_one)
+        if not expected['converges']:
+            continue
+        results = profile.accelerated_fixed_point(init='sincere', n_max_episodes=200)
+        assert results['converges']
+        assert results['n_episodes'] <= expected['n_episodes']
+        # The limit may be another equilibrium than the one found by fictitious play
+        assert results['is_equilibrium'] == EquilibriumStatus.EQUILIBRIUM
+        assert results['strategy'].tau.isclose(results['tau'])
+
+
+def test_damped_iteration():
+    profile = ProfileHistogram({'abc': 0.4, 'bac': 0.35, 'cab': 0.25}, {'abc': [1], 'bac': [1], 'cab': [1]},
+                               normalization_warning=False)
+    results = profile.accelerated_fixed_point(init='fanatic', n_max_episodes=100, memory=0)
+    assert results['converges']
+    assert results['is_equilibrium'] == EquilibriumStatus.EQUILIBRIUM
+
+
+def test_no_convergence():
+    # With this budget, the process cannot converge: it needs 3 iterations (cf. the doctest of
+    # `accelerated_fixed_point`).
+    profile = ProfileHistogram({'abc': Fraction(1, 10), 'bac': Fraction(6, 10), 'cab': Fraction(3, 10)},
+                               {'abc': [1], 'bac': [1], 'cab': [1]})
+    results = profile.accelerated_fixed_point(init='sincere', n_max_episodes=2)
+    assert not results['converges']
+    assert results['tau'] is None
+    assert results['strategy'] is None
+    assert results['is_equilibrium'] is None
+    assert results['n_episodes'] == 2
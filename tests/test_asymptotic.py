@@ -1,6 +1,8 @@
 import numpy as np
+import pickle
 import pytest
-from poisson_approval import Asymptotic, isnan, isposinf
+from fractions import Fraction
+from poisson_approval import Asymptotic, AsymptoticFloat, isnan, isposinf
 
 
 def test_limit():
@@ -37,3 +39,34 @@ def test_limit_ratio_with_small_magnitudes():
     denominator = Asymptotic(mu=-1E-10, nu=0, xi=0)
     ratio = numerator / denominator
     assert ratio.limit == 0
+
+
+def test_float_same_results_as_asymptotic():
+    coefficients = [(-0.1, -0.5, 0.3), (-0.1, -0.5, 0.2), (-0.2, 0.5, 1.), (0, 0, 0), (0.0, -1, 2.5),
+                    (-np.inf, -np.inf, -np.inf), (-0.1, np.nan, np.nan), (np.nan, np.nan, np.nan),
+                    (-0.1 + 1e-12, -0.5, 0.1), (-Fraction(1, 10), 0, 0)]
+    for mu_1, nu_1, xi_1 in coefficients:
+        for mu_2, nu_2, xi_2 in coefficients:
+            for operation in [lambda x, y: x * y, lambda x, y: x / y, lambda x, y: x + y,
+                              lambda x, y: x * Fraction(1, 3) + y / 2, lambda x, y: 2 / x + y]:
+                try:
+                    expected = operation(Asymptotic(mu_1, nu_1, xi_1), Asymptotic(mu_2, nu_2, xi_2))
+                except ValueError:
+                    with pytest.raises(ValueError):
+                        operation(AsymptoticFloat(mu_1, nu_1, xi_1), Asymptotic(mu_2, nu_2, xi_2))
+                    continue
+                for left, right in [(AsymptoticFloat.from_asymptotic(Asymptotic(mu_1, nu_1, xi_1)),
+                                     AsymptoticFloat.from_asymptotic(Asymptotic(mu_2, nu_2, xi_2))),
+                                    (Asymptotic(mu_1, nu_1, xi_1),
+                                     AsymptoticFloat.from_asymptotic(Asymptotic(mu_2, nu_2, xi_2)))]:
+                    result = operation(left, right)
+                    assert repr(result) == repr(expected)
+                    assert repr(result.limit) == repr(expected.limit)
+
+
+def test_float_pickle():
+    asymptotic = AsymptoticFloat(mu=-0.1, nu=-0.5, xi=0.3)
+    unpickled = pickle.loads(pickle.dumps(asymptotic))
+    assert isinstance(unpickled, AsymptoticFloat)
+    assert repr(unpickled) == repr(asymptotic)
+    assert unpickled.limit == asymptotic.limit
@@ -0,0 +1,37 @@
+import itertools
+import numpy as np
+from poisson_approval import TauVector, best_responses_batch, JUSTIFICATIONS
+from poisson_approval import APPROVAL, PLURALITY, ANTI_PLURALITY, BALLOTS_WITHOUT_INVERSIONS, RANKINGS
+
+
+def _check_same_as_tau_vectors(shares, voting_rule, abs_tol):
+    utility_thresholds, justifications = best_responses_batch(shares, voting_rule=voting_rule)
+    for n, share in enumerate(shares):
+        tau = TauVector(dict(zip(BALLOTS_WITHOUT_INVERSIONS, share)), voting_rule=voting_rule,
+                        normalization_warning=False)
+        for r, ranking in enumerate(RANKINGS):
+            best_response = tau.d_ranking_best_response[ranking]
+            assert JUSTIFICATIONS[justifications[n, r]] == best_response.justification
+            assert np.isclose(utility_thresholds[n, r], float(best_response.utility_threshold),
+                              rtol=0, atol=abs_tol, equal_nan=True)
+
+
+def test_approval_random():
+    generator = np.random.default_rng(42)
+    shares = generator.random((100, 6))
+    shares[generator.random((100, 6)) < 0.3] = 0
+    shares[np.sum(shares, axis=1) == 0, 0] = 1
+    # The trios of the offset method use another optimizer, hence the tolerance.
+    _check_same_as_tau_vectors(shares / np.sum(shares, axis=1)[:, np.newaxis], APPROVAL, abs_tol=1e-4)
+
+
+def test_approval_grid():
+    shares = np.array([share for share in itertools.product([0, 1, 2], repeat=6) if sum(share) > 0][::7])
+    _check_same_as_tau_vectors(shares / np.sum(shares, axis=1)[:, np.newaxis], APPROVAL, abs_tol=1e-4)
+
+
+def test_plurality_and_anti_plurality():
+    for voting_rule, columns in [(PLURALITY, [0, 1, 2]), (ANTI_PLURALITY, [3, 4, 5])]:
+        shares = np.zeros((63, 6))
+        shares[:, columns] = [share for share in itertools.product([0, 1, 2, 3], repeat=3) if sum(share) > 0]
+        _check_same_as_tau_vectors(shares / np.sum(shares, axis=1)[:, np.newaxis], voting_rule, abs_tol=0)
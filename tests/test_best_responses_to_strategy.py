@@ -1,6 +1,8 @@
+import pickle
 from fractions import Fraction
 from poisson_approval import ProfileOrdinal
 from poisson_approval import StrategyOrdinal
+from poisson_approval import TauVectorCache
 
 
 def test():
@@ -12,3 +14,27 @@ def test():
     <abc: a, bac: ab, cab: c> ==> a
     """
     pass
+
+
+def test_only_rankings_in_support():
+    profile = ProfileOrdinal({'abc': Fraction(4, 10), 'bac': Fraction(6, 10)})
+    tau = StrategyOrdinal({'abc': 'a', 'bac': 'b'}, profile=profile).tau
+    profile.best_responses_to_strategy(tau)
+    assert 'pivot_tij_abc' in tau._cached_properties
+    assert 'pivot_tij_cab' not in tau._cached_properties
+
+
+def test_only_rankings_in_support_with_symmetry():
+    profile = ProfileOrdinal({'cba': Fraction(4, 10), 'bca': Fraction(6, 10)})
+    with TauVectorCache(symmetry=True):
+        tau = StrategyOrdinal({'cba': 'c', 'bca': 'bc'}, profile=profile).tau
+        assert not tau.is_standardized
+        profile.best_responses_to_strategy(tau)
+        assert len(tau.standardized_version.d_ranking_best_response._d_key_value) == 2
+
+
+def test_pickle():
+    profile = ProfileOrdinal({'abc': Fraction(4, 10), 'bac': Fraction(6, 10)})
+    tau = StrategyOrdinal({'abc': 'a', 'bac': 'b'}, profile=profile).tau
+    d_ranking_best_response = pickle.loads(pickle.dumps(tau.d_ranking_best_response))
+    assert d_ranking_best_response['abc'].ballot == tau.d_ranking_best_response['abc'].ballot
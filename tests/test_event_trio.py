@@ -1,4 +1,7 @@
-from poisson_approval import TauVector, EventTrio
+import numpy as np
+from scipy.optimize import minimize
+from poisson_approval import TauVector, EventTrio, RandTauVectorUniform, initialize_random_seeds, \
+    RandProfileHistogramUniform, TrioWarmStart, PhaseTimer, one_over_log_t_plus_one
 
 
 def test():
@@ -15,3 +18,57 @@ def test():
     assert tau.trio.psi_c >= 1
     _ = tau.pivot_weak_ac
     _ = tau.d_ranking_best_response['acb']
+
+
+def test_optimize_batch():
+    initialize_random_seeds(42)
+    rand_tau = RandTauVectorUniform()
+    events = [EventTrio(candidate_x=x, candidate_y=y, candidate_z=z, tau=rand_tau())
+              for _ in range(20) for x, y, z in ['abc', 'bca', 'cab']]
+    bounds = np.array([event._get_bounds_and_start(event._tau_x, event._tau_y, event._tau_z,
+                                                   event._tau_xy, event._tau_xz, event._tau_yz)
+                       for event in events])
+    results = EventTrio.optimize_batch(
+        *[[getattr(event, '_tau_' + label) for event in events] for label in ['x', 'y', 'z', 'xy', 'xz', 'yz']],
+        inf=bounds[:, 0], sup=bounds[:, 1], start=bounds[:, 2])
+    assert np.allclose(results['mu'], [event.mu for event in events], rtol=0, atol=1e-7)
+    # The objective is flat near its minimum, so with its default tolerances, the scalar solver used by `EventTrio`
+    # gives the offsets with a relative error of about 1e-4 only. Hence we check the offsets against a reference
+    # computed with tight tolerances.
+    for i, event in enumerate(events):
+        tau_x, tau_y, tau_z = float(event._tau_x), float(event._tau_y), float(event._tau_z)
+        tau_xy, tau_xz, tau_yz = float(event._tau_xy), float(event._tau_xz), float(event._tau_yz)
+
+        def objective(x):
+            return 2 * np.sqrt((tau_x * x + tau_xz) * (tau_yz / x + tau_y)) + tau_xy * x + tau_z / x - 1
+
+        x_2 = minimize(objective, bounds[i, 2], bounds=[(bounds[i, 0], bounds[i, 1])],
+                       options={'ftol': 1e-15, 'gtol': 1e-12}).x[0]
+        x_1 = np.sqrt((tau_yz / x_2 + tau_y) / (tau_x * x_2 + tau_xz))
+        expected = {'x': x_1 * x_2, 'y': 1 / x_1, 'z': 1 / x_2, 'xy': x_2, 'xz': x_1, 'yz': 1 / (x_1 * x_2)}
+        for label in ['x', 'y', 'z', 'xy', 'xz', 'yz']:
+            if getattr(event, '_tau_' + label) > 0:
+                assert np.isclose(results['phi_' + label][i], expected[label], rtol=1e-6, atol=0)
+            else:
+                assert np.isnan(results['phi_' + label][i])
+
+
+def test_fictitious_play_with_trio_warm_start():
+    initialize_random_seeds(42)
+    profile = RandProfileHistogramUniform(n_bins=1)()
+    timer_cold = PhaseTimer()
+    results_cold = profile.fictitious_play(init='sincere', n_max_episodes=100,
+                                           perception_update_ratio=one_over_log_t_plus_one, phase_timer=timer_cold)
+    timer_warm = PhaseTimer()
+    results_warm = profile.fictitious_play(init='sincere', n_max_episodes=100,
+                                           perception_update_ratio=one_over_log_t_plus_one, phase_timer=timer_warm,
+                                           trio_warm_start=TrioWarmStart(compare_with_cold_start=True))
+    assert results_cold['converges']
+    assert results_warm['converges']
+    assert results_warm['tau'].isclose(results_cold['tau'], abs_tol=1e-6)
+    assert results_warm['strategy'].winners == results_cold['strategy'].winners
+    assert timer_warm.n_optimizations == timer_cold.n_optimizations > 0
+    assert timer_warm.n_optimizer_iterations < timer_cold.n_optimizer_iterations
+    warm_start = results_warm['trio_warm_start']
+    assert 0 < warm_start.n_warm_starts <= warm_start.n_optimizations
+    assert warm_start.n_iterations < warm_start.n_iterations_cold_start
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+from poisson_approval import fictitious_play_batch, RandProfileHistogramUniform, RandProfileDiscreteUniform, \
+    ProfileHistogram, initialize_random_seeds, one_over_log_t_plus_one, APPROVAL, PLURALITY, ANTI_PLURALITY, \
+    CANDIDATES
+
+
+@pytest.mark.parametrize('voting_rule', [APPROVAL, PLURALITY, ANTI_PLURALITY])
+def test_same_results_as_fictitious_play(voting_rule):
+    initialize_random_seeds(42)
+    factory_histogram = RandProfileHistogramUniform(n_bins=2, voting_rule=voting_rule)
+    factory_discrete = RandProfileDiscreteUniform(types=[('abc', 0.3), ('bac', 0.6), ('cab', 0.5), 'a~b>c', 'c>a~b'],
+                                                  voting_rule=voting_rule)
+    profiles = [factory_histogram() for _ in range(5)] + [factory_discrete() for _ in range(5)]
+    kwargs = dict(init='sincere', n_max_episodes=100, perception_update_ratio=one_over_log_t_plus_one,
+                  ballot_update_ratio=one_over_log_t_plus_one)
+    results_batch = fictitious_play_batch(profiles, **kwargs)
+    for profile, results in zip(profiles, results_batch):
+        expected = profile.fictitious_play(**kwargs)
+        assert results['converges'] == expected['converges']
+        if expected['converges']:
+            assert results['tau'].isclose(expected['tau'], abs_tol=1E-6)
+            for ranking in profile.support_in_rankings:
+                threshold = expected['strategy'].d_ranking_threshold[ranking]
+                assert np.isclose(float(results['strategy'].d_ranking_threshold[ranking]), float(threshold),
+                                  atol=1E-4)
+        assert np.allclose([float(results['d_candidate_winning_frequency'][c]) for c in CANDIDATES],
+                           [float(expected['d_candidate_winning_frequency'][c]) for c in CANDIDATES], atol=1E-6)
+
+
+def test_different_voting_rules():
+    with pytest.raises(ValueError):
+        fictitious_play_batch([ProfileHistogram({'abc': 1}, {'abc': [1]}),
+                               ProfileHistogram({'abc': 1}, {'abc': [1]}, voting_rule=PLURALITY)],
+                              init='sincere', n_max_episodes=10)
+
+
+def test_empty():
+    assert fictitious_play_batch([], init='sincere', n_max_episodes=10) == []
@@ -1,7 +1,14 @@
-from poisson_approval import monte_carlo_fictitious_play, RandProfileHistogramUniform, \
-    MCS_PROFILE, MCS_TAU_INIT, MCS_N_EPISODES, MCS_CANDIDATE_WINNING_FREQUENCY, MCS_CONVERGES, MCS_FREQUENCY_CW_WINS, \
+from concurrent.futures import ProcessPoolExecutor
+import importlib
+import multiprocessing
+import tracemalloc
+import numpy as np
+import pytest
+from poisson_approval import monte_carlo_fictitious_play, RandProfileHistogramUniform, MonteCarloSetting, \
+    initialize_random_seeds, MCS_PROFILE, MCS_TAU_INIT, MCS_N_EPISODES, MCS_CANDIDATE_WINNING_FREQUENCY, \
+    MCS_CONVERGES, MCS_FREQUENCY_CW_WINS, \
     MCS_WELFARE_LOSSES, MCS_UTILITY_THRESHOLDS, MCS_BALLOT_STATISTICS, MCS_DECREASING_SCORES, VOTING_RULES, \
-    one_over_t
+    one_over_t, CANDIDATES, MCS_FOCUS, MCS_IS_ORDINAL_EQ, OnlineMean, OnlineCounter
 
 
 def test_no_mcs():
@@ -61,3 +68,187 @@ def test_monte_carlo_iterated_voting():
         ... )
     """
     pass
+
+
+def _n_episodes(results, profile):
+    return results['n_episodes']
+
+
+def _tau(results, profile):
+    return results['tau']
+
+
+def test_parallel_same_results_as_serial():
+    kwargs = dict(factory=RandProfileHistogramUniform(n_bins=1), n_samples=6, n_max_episodes=20,
+                  voting_rules=VOTING_RULES, seed=42,
+                  monte_carlo_settings=[MCS_PROFILE, MCS_N_EPISODES, MCS_CANDIDATE_WINNING_FREQUENCY, MCS_CONVERGES,
+                                        MCS_WELFARE_LOSSES, MCS_UTILITY_THRESHOLDS, MCS_DECREASING_SCORES])
+    meta_results_serial = monte_carlo_fictitious_play(**kwargs)
+    meta_results_parallel = monte_carlo_fictitious_play(n_jobs=2, chunksize=2, **kwargs)
+    assert repr(meta_results_parallel) == repr(meta_results_serial)
+    initialize_random_seeds(0)
+    meta_results_other_state = monte_carlo_fictitious_play(**kwargs)
+    assert repr(meta_results_other_state) == repr(meta_results_serial)
+
+
+def test_executor():
+    kwargs = dict(factory=RandProfileHistogramUniform(n_bins=1), n_samples=4, n_max_episodes=20, seed=0,
+                  monte_carlo_settings=[MonteCarloSetting(
+                      statistics_post_processing={'n_episodes': _n_episodes, 'tau': _tau})])
+    meta_results_serial = monte_carlo_fictitious_play(**kwargs)
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        meta_results_executor = monte_carlo_fictitious_play(executor=executor, **kwargs)
+    assert repr(meta_results_executor) == repr(meta_results_serial)
+
+
+def test_predefined_settings_with_spawn():
+    kwargs = dict(factory=RandProfileHistogramUniform(n_bins=1), n_samples=2, n_max_episodes=20,
+                  voting_rules=VOTING_RULES, seed=0,
+                  monte_carlo_settings=[MCS_PROFILE, MCS_TAU_INIT, MCS_N_EPISODES, MCS_CANDIDATE_WINNING_FREQUENCY,
+                                        MCS_CONVERGES, MCS_FOCUS, MCS_IS_ORDINAL_EQ, MCS_FREQUENCY_CW_WINS,
+                                        MCS_WELFARE_LOSSES, MCS_UTILITY_THRESHOLDS, MCS_BALLOT_STATISTICS,
+                                        MCS_DECREASING_SCORES])
+    meta_results_serial = monte_carlo_fictitious_play(**kwargs)
+    with ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context('spawn')) as executor:
+        meta_results_spawn = monte_carlo_fictitious_play(executor=executor, **kwargs)
+    assert repr(meta_results_spawn) == repr(meta_results_serial)
+
+
+def test_columnar():
+    kwargs = dict(factory=RandProfileHistogramUniform(n_bins=1), n_samples=5, n_max_episodes=20,
+                  voting_rules=VOTING_RULES, seed=42,
+                  monte_carlo_settings=[MCS_PROFILE, MCS_N_EPISODES, MCS_CANDIDATE_WINNING_FREQUENCY, MCS_CONVERGES,
+                                        MCS_FREQUENCY_CW_WINS, MCS_WELFARE_LOSSES, MCS_UTILITY_THRESHOLDS,
+                                        MCS_BALLOT_STATISTICS, MCS_DECREASING_SCORES])
+    meta_results_lists = monte_carlo_fictitious_play(**kwargs)
+    meta_results_columns = monte_carlo_fictitious_play(columnar=True, **kwargs)
+    for voting_rule in VOTING_RULES:
+        lists = meta_results_lists[voting_rule]
+        columns = meta_results_columns[voting_rule]
+        assert isinstance(columns['profile'], list)
+        assert columns['converges'].dtype == bool
+        assert columns['n_episodes'].shape == (5, )
+        assert columns['d_candidate_winning_frequency'].shape == (5, 3)
+        assert columns['utility_thresholds'].shape == (5, 6)
+        assert np.allclose(columns['decreasing_scores'], lists['decreasing_scores'])
+        for statistic_name in ['mean_converges', 'mean_frequency_cw_wins', 'mean_utilitarian_welfare_loss',
+                               'p_utility_threshold_0', 'mean_share_single_votes']:
+            assert np.isclose(columns[statistic_name], lists[statistic_name])
+        for candidate in CANDIDATES:
+            assert np.isclose(columns['d_candidate_mean_winning_frequency'][candidate],
+                              lists['d_candidate_mean_winning_frequency'][candidate])
+
+
+def test_online():
+    kwargs = dict(factory=RandProfileHistogramUniform(n_bins=1), n_samples=5, n_max_episodes=20,
+                  voting_rules=VOTING_RULES, seed=42,
+                  monte_carlo_settings=[MCS_N_EPISODES, MCS_CANDIDATE_WINNING_FREQUENCY, MCS_CONVERGES, MCS_FOCUS,
+                                        MCS_IS_ORDINAL_EQ, MCS_FREQUENCY_CW_WINS, MCS_BALLOT_STATISTICS,
+                                        MCS_DECREASING_SCORES, MCS_WELFARE_LOSSES, MCS_UTILITY_THRESHOLDS])
+    meta_results_lists = monte_carlo_fictitious_play(**kwargs)
+    meta_results_online = monte_carlo_fictitious_play(online=True, **kwargs)
+    for voting_rule in VOTING_RULES:
+        lists = meta_results_lists[voting_rule]
+        online = meta_results_online[voting_rule]
+        assert isinstance(online['converges'], OnlineMean)
+        assert isinstance(online['focus'], OnlineCounter)
+        assert isinstance(online['score_winner'], list)
+        assert np.isclose(online['n_episodes'].mean, np.mean(lists['n_episodes']))
+        assert isinstance(online['utility_thresholds'], OnlineMean)
+        assert isinstance(online['utilitarian_welfare_losses'], OnlineMean)
+        for statistic_name in ['mean_converges', 'mean_frequency_cw_wins', 'mean_share_single_votes',
+                               'mean_share_insincere_votes', 'mean_utilitarian_welfare_loss',
+                               'mean_plurality_welfare_loss', 'mean_anti_plurality_welfare_loss',
+                               'p_utility_threshold_0', 'p_utility_threshold_1', 'p_utility_threshold_not_0_or_1']:
+            assert np.isclose(online[statistic_name], lists[statistic_name])
+        for candidate in CANDIDATES:
+            assert np.isclose(online['d_candidate_mean_winning_frequency'][candidate],
+                              lists['d_candidate_mean_winning_frequency'][candidate])
+        assert online['focus_stats'] == lists['focus_stats']
+        assert online['ordinal_eq_stats'] == lists['ordinal_eq_stats']
+
+
+def _big_statistic(results, profile):
+    return np.full(100000, results['n_episodes'], dtype=float)
+
+
+def test_online_memory_does_not_grow_with_n_samples():
+    setting = MonteCarloSetting(statistics_post_processing={'big_statistic': _big_statistic},
+                                statistics_online={'big_statistic': OnlineMean})
+    peaks = []
+    for n_samples in [10, 40]:
+        tracemalloc.start()
+        monte_carlo_fictitious_play(factory=RandProfileHistogramUniform(n_bins=1), n_samples=n_samples,
+                                    n_max_episodes=5, seed=42, online=True, batch_size=5,
+                                    monte_carlo_settings=[MCS_CONVERGES, setting])
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    # Each value of the big statistic takes 0.8 MB: the peak is about `batch_size` of them, whatever `n_samples`.
+    assert peaks[1] < 1.5 * peaks[0]
+
+
+def test_half_widths():
+    kwargs = dict(factory=RandProfileHistogramUniform(n_bins=1), n_samples=40, n_max_episodes=20,
+                  voting_rules=VOTING_RULES, seed=42, batch_size=10,
+                  monte_carlo_settings=[MCS_CANDIDATE_WINNING_FREQUENCY, MCS_N_EPISODES, MCS_DECREASING_SCORES])
+    meta_results = monte_carlo_fictitious_play(half_widths={'d_candidate_winning_frequency': 0.5}, **kwargs)
+    for voting_rule in VOTING_RULES:
+        # The winning frequencies are not all 0 or 1, so the normal approximation needs at least 30 samples
+        assert meta_results[voting_rule]['n_samples'] == 30
+        assert len(meta_results[voting_rule]['d_candidate_winning_frequency']) == 30
+        assert meta_results[voting_rule]['half_widths']['d_candidate_winning_frequency'] <= 0.5
+    meta_results_budget = monte_carlo_fictitious_play(half_widths={'score_winner': 0}, **kwargs)
+    assert meta_results_budget[VOTING_RULES[0]]['n_samples'] == 40
+    meta_results_columnar = monte_carlo_fictitious_play(half_widths={'d_candidate_winning_frequency': 0.5},
+                                                        columnar=True, **kwargs)
+    meta_results_online = monte_carlo_fictitious_play(half_widths={'d_candidate_winning_frequency': 0.5},
+                                                      online=True, **kwargs)
+    for voting_rule in VOTING_RULES:
+        assert meta_results_columnar[voting_rule]['decreasing_scores'].shape == (30, 3)
+        for meta_results_other in [meta_results_columnar, meta_results_online]:
+            assert np.isclose(meta_results_other[voting_rule]['half_widths']['d_candidate_winning_frequency'],
+                              meta_results[voting_rule]['half_widths']['d_candidate_winning_frequency'])
+
+
+def test_half_widths_with_one_pool(monkeypatch):
+    module = importlib.import_module('poisson_approval.meta_analysis.monte_carlo_fictitious_play')
+    pools = []
+
+    class CountingProcessPoolExecutor(ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            pools.append(self)
+
+    monkeypatch.setattr(module, 'ProcessPoolExecutor', CountingProcessPoolExecutor)
+    kwargs = dict(factory=RandProfileHistogramUniform(n_bins=1), n_samples=6, n_max_episodes=20, seed=42,
+                  batch_size=2, half_widths={'score_winner': 0}, monte_carlo_settings=[MCS_DECREASING_SCORES])
+    meta_results_parallel = monte_carlo_fictitious_play(n_jobs=2, **kwargs)
+    assert meta_results_parallel['']['n_samples'] == 6
+    assert len(pools) == 1
+    assert repr(meta_results_parallel) == repr(monte_carlo_fictitious_play(**kwargs))
+
+
+def test_half_widths_binary_statistic():
+    kwargs = dict(factory=RandProfileHistogramUniform(n_bins=1), n_samples=40, n_max_episodes=1, seed=42,
+                  batch_size=5, monte_carlo_settings=[MCS_CONVERGES, MCS_FOCUS])
+    meta_results = monte_carlo_fictitious_play(half_widths={'converges': 0.2}, **kwargs)
+    # No run converges in 1 episode, but the half-width is not 0: this is the Wilson score interval
+    assert meta_results['']['mean_converges'] == 0
+    assert meta_results['']['n_samples'] == 10
+    assert 0 < meta_results['']['half_widths']['converges'] <= 0.2
+    meta_results_online = monte_carlo_fictitious_play(half_widths={'converges': 0.2}, online=True, **kwargs)
+    assert meta_results_online['']['half_widths'] == meta_results['']['half_widths']
+    with pytest.raises(ValueError):
+        monte_carlo_fictitious_play(half_widths={'focus': 0.2}, online=True, **kwargs)
+
+
+def test_half_widths_unknown_statistic(monkeypatch):
+    module = importlib.import_module('poisson_approval.meta_analysis.monte_carlo_fictitious_play')
+
+    def fail(task):
+        raise AssertionError('No sample should be drawn.')
+
+    monkeypatch.setattr(module, '_monte_carlo_sample', fail)
+    with pytest.raises(ValueError):
+        monte_carlo_fictitious_play(factory=RandProfileHistogramUniform(n_bins=1), n_samples=10, n_max_episodes=1,
+                                    seed=42, monte_carlo_settings=[MCS_CONVERGES], half_widths={'convergez': 0.1})
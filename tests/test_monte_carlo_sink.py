@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+from poisson_approval import monte_carlo_fictitious_play, MonteCarloSink, RandProfileHistogramUniform, \
+    MCS_PROFILE, MCS_N_EPISODES, MCS_CANDIDATE_WINNING_FREQUENCY, MCS_CONVERGES, MCS_FOCUS, \
+    MCS_WELFARE_LOSSES, MCS_UTILITY_THRESHOLDS, MCS_DECREASING_SCORES, VOTING_RULES
+
+
+def test_resume_same_results_as_uninterrupted_run(tmp_path):
+    kwargs = dict(factory=RandProfileHistogramUniform(n_bins=1), n_max_episodes=20, voting_rules=VOTING_RULES,
+                  seed=42, monte_carlo_settings=[MCS_PROFILE, MCS_N_EPISODES, MCS_CANDIDATE_WINNING_FREQUENCY,
+                                                 MCS_CONVERGES, MCS_FOCUS, MCS_WELFARE_LOSSES,
+                                                 MCS_UTILITY_THRESHOLDS, MCS_DECREASING_SCORES])
+    meta_results_in_memory = monte_carlo_fictitious_play(n_samples=7, **kwargs)
+    sink = MonteCarloSink(str(tmp_path), chunk_size=3)
+    monte_carlo_fictitious_play(n_samples=4, sink=sink, **kwargs)
+    assert sink.n_chunks == 2
+    assert sink.n_samples == 4
+    meta_results_resumed = monte_carlo_fictitious_play(n_samples=7, sink=sink, **kwargs)
+    assert sink.n_chunks == 3
+    assert repr(meta_results_resumed) == repr(meta_results_in_memory)
+    assert repr(MonteCarloSink(str(tmp_path)).load(kwargs['monte_carlo_settings'])) == repr(meta_results_in_memory)
+
+
+def test_empty_sink(tmp_path):
+    sink = MonteCarloSink(str(tmp_path / 'sub_directory'))
+    assert sink.n_samples == 0
+    assert sink.load() == {}
+
+
+def test_load_columnar(tmp_path):
+    sink = MonteCarloSink(str(tmp_path), chunk_size=2)
+    kwargs = dict(factory=RandProfileHistogramUniform(n_bins=1), n_samples=3, n_max_episodes=20, seed=42,
+                  monte_carlo_settings=[MCS_CANDIDATE_WINNING_FREQUENCY, MCS_CONVERGES, MCS_DECREASING_SCORES])
+    meta_results_sink = monte_carlo_fictitious_play(sink=sink, columnar=True, **kwargs)
+    meta_results_memory = monte_carlo_fictitious_play(columnar=True, **kwargs)
+    assert repr(meta_results_sink) == repr(meta_results_memory)
+
+
+def test_load_online(tmp_path):
+    sink = MonteCarloSink(str(tmp_path), chunk_size=2)
+    kwargs = dict(factory=RandProfileHistogramUniform(n_bins=1), n_samples=3, n_max_episodes=20, seed=42,
+                  monte_carlo_settings=[MCS_CANDIDATE_WINNING_FREQUENCY, MCS_CONVERGES, MCS_FOCUS])
+    meta_results_sink = monte_carlo_fictitious_play(sink=sink, online=True, **kwargs)
+    meta_results_memory = monte_carlo_fictitious_play(online=True, **kwargs)
+    assert repr(meta_results_sink) == repr(meta_results_memory)
+
+
+def test_manifest(tmp_path):
+    sink = MonteCarloSink(str(tmp_path), chunk_size=2)
+    kwargs = dict(factory=RandProfileHistogramUniform(n_bins=1), n_samples=2, n_max_episodes=20,
+                  monte_carlo_settings=[MCS_CONVERGES])
+    monte_carlo_fictitious_play(seed=42, sink=sink, **kwargs)
+    with pytest.raises(ValueError):
+        monte_carlo_fictitious_play(seed=0, sink=sink, **kwargs)
+    with pytest.raises(ValueError):
+        monte_carlo_fictitious_play(seed=42, sink=sink, voting_rules=VOTING_RULES, **kwargs)
+    with pytest.raises(ValueError):
+        monte_carlo_fictitious_play(seed=42, sink=sink, **dict(kwargs, monte_carlo_settings=[MCS_N_EPISODES]))
+    assert sink.n_samples == 2
+
+
+def test_manifest_run_parameters(tmp_path):
+    sink = MonteCarloSink(str(tmp_path), chunk_size=2)
+    kwargs = dict(factory=RandProfileHistogramUniform(n_bins=1), n_samples=2, n_max_episodes=20,
+                  monte_carlo_settings=[MCS_CONVERGES], seed=42)
+    monte_carlo_fictitious_play(sink=sink, **kwargs)
+    # Resuming with equal parameters (but other instances) is accepted
+    monte_carlo_fictitious_play(sink=sink, **dict(kwargs, factory=RandProfileHistogramUniform(n_bins=1), n_samples=4))
+    with pytest.raises(ValueError):
+        monte_carlo_fictitious_play(sink=sink, **dict(kwargs, n_max_episodes=10, n_samples=6))
+    with pytest.raises(ValueError):
+        monte_carlo_fictitious_play(sink=sink, **dict(kwargs, factory=RandProfileHistogramUniform(n_bins=2),
+                                                      n_samples=6))
+    with pytest.raises(ValueError):
+        monte_carlo_fictitious_play(sink=sink, **dict(kwargs, init='random_tau', n_samples=6))
+    assert sink.n_samples == 4
+
+
+def test_fewer_samples_than_sink(tmp_path):
+    sink = MonteCarloSink(str(tmp_path), chunk_size=2)
+    kwargs = dict(factory=RandProfileHistogramUniform(n_bins=1), n_max_episodes=20, seed=42,
+                  monte_carlo_settings=[MCS_N_EPISODES, MCS_CONVERGES])
+    monte_carlo_fictitious_play(n_samples=5, sink=sink, **kwargs)
+    meta_results_sink = monte_carlo_fictitious_play(n_samples=3, sink=sink, **kwargs)
+    meta_results_memory = monte_carlo_fictitious_play(n_samples=3, **kwargs)
+    assert repr(meta_results_sink) == repr(meta_results_memory)
+    assert sink.n_samples == 5
+
+
+def test_n_samples_is_cached(tmp_path, monkeypatch):
+    sink = MonteCarloSink(str(tmp_path), chunk_size=2)
+    monte_carlo_fictitious_play(factory=RandProfileHistogramUniform(n_bins=1), n_samples=5, n_max_episodes=20,
+                                seed=42, monte_carlo_settings=[MCS_CONVERGES], sink=sink)
+
+    def load_forbidden(*args, **kwargs):
+        raise AssertionError('The chunks should not be read again.')
+
+    monkeypatch.setattr(np, 'load', load_forbidden)
+    assert sink.n_samples == 5
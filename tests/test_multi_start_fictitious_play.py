@@ -0,0 +1,60 @@
+import random
+from concurrent.futures import ProcessPoolExecutor
+from fractions import Fraction
+import numpy as np
+from poisson_approval import multi_start_fictitious_play, ProfileNoisyDiscrete, RandProfileHistogramUniform, \
+    initialize_random_seeds, CANDIDATES
+
+
+def _profile():
+    return ProfileNoisyDiscrete({('abc', 0.4, 0.01): Fraction(1, 10), ('bac', 0.2, 0.01): Fraction(6, 10),
+                                 ('cab', 0.7, 0.01): Fraction(3, 10)})
+
+
+def test_same_results_in_parallel():
+    profile = _profile()
+    serial = multi_start_fictitious_play(profile, n_starts=8, n_max_episodes=100, seed=42)
+    parallel = multi_start_fictitious_play(profile, n_starts=8, n_max_episodes=100, seed=42, n_jobs=2)
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        with_executor = multi_start_fictitious_play(profile, n_starts=8, n_max_episodes=100, seed=42,
+                                                    executor=executor)
+    for multi_results in [parallel, with_executor]:
+        assert [results['tau_init'] for results in multi_results['results']] == [
+            results['tau_init'] for results in serial['results']]
+        assert [limit['basin_frequency'] for limit in multi_results['limits']] == [
+            limit['basin_frequency'] for limit in serial['limits']]
+        assert multi_results['d_candidate_winning_frequency'] == serial['d_candidate_winning_frequency']
+
+
+def test_frequencies():
+    initialize_random_seeds(42)
+    profile = RandProfileHistogramUniform(n_bins=1)()
+    multi_results = multi_start_fictitious_play(profile, n_starts=5, n_max_episodes=50,
+                                                init='random_tau_undominated')
+    assert len(set(str(results['tau_init']) for results in multi_results['results'])) == 5
+    total = sum(limit['basin_frequency'] for limit in multi_results['limits'])
+    assert np.isclose(total + multi_results['frequency_no_convergence'], 1)
+    assert np.isclose(sum(multi_results['d_candidate_winning_frequency'][c] for c in CANDIDATES), 1)
+
+
+def test_iterated_voting():
+    multi_results = multi_start_fictitious_play(_profile(), n_starts=4, n_max_episodes=100, seed=0,
+                                                meth='iterated_voting', perception_update_ratio=Fraction(1, 2),
+                                                ballot_update_ratio=1, winning_frequency_update_ratio=Fraction(1, 2))
+    for limit in multi_results['limits']:
+        assert limit['strategy'].tau.isclose(limit['tau'])
+
+
+def test_default_ratios():
+    for meth in ['fictitious_play', 'iterated_voting']:
+        multi_results = multi_start_fictitious_play(_profile(), n_starts=2, n_max_episodes=20, seed=0, meth=meth)
+        assert len(multi_results['results']) == 2
+        assert np.isclose(sum(multi_results['d_candidate_winning_frequency'][c] for c in CANDIDATES), 1)
+
+
+def test_random_state_is_restored():
+    initialize_random_seeds(42)
+    expected = (random.random(), np.random.rand())
+    initialize_random_seeds(42)
+    multi_start_fictitious_play(_profile(), n_starts=2, n_max_episodes=20, seed=0)
+    assert (random.random(), np.random.rand()) == expected
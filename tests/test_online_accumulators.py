@@ -0,0 +1,48 @@
+import numpy as np
+from poisson_approval import OnlineMean, OnlineCounter, OnlineHistogram
+
+
+def test_online_mean_same_as_numpy():
+    values = np.random.RandomState(0).random_sample((100, 3))
+    accumulator = OnlineMean()
+    for value in values:
+        accumulator.add(value)
+    assert accumulator.n == 100
+    assert np.allclose(accumulator.mean, values.mean(axis=0))
+    assert np.allclose(accumulator.variance, values.var(axis=0, ddof=1))
+
+
+def test_online_mean_empty():
+    accumulator = OnlineMean()
+    assert np.isnan(accumulator.mean)
+    accumulator.add(1)
+    assert np.isnan(accumulator.variance)
+
+
+def test_online_mean_is_binary():
+    accumulator = OnlineMean()
+    for value in [True, False, True]:
+        accumulator.add(value)
+    assert accumulator.is_binary
+    accumulator.add(0.5)
+    assert not accumulator.is_binary
+    accumulator = OnlineMean()
+    accumulator.add([0, 0.5, 1])
+    assert list(accumulator.is_binary) == [True, False, True]
+
+
+def test_online_counter():
+    accumulator = OnlineCounter()
+    for value in ['a', 'b', 'a', 'a']:
+        accumulator.add(value)
+    assert accumulator.counts['a'] == 3
+    assert accumulator.frequencies == {'a': 0.75, 'b': 0.25}
+
+
+def test_online_histogram_same_as_numpy():
+    values = np.random.RandomState(0).random_sample((50, 3))
+    accumulator = OnlineHistogram(bins=np.linspace(0, 1, 11))
+    for value in values:
+        accumulator.add(value)
+    assert accumulator.n == 50
+    assert np.array_equal(accumulator.counts, np.histogram(values, bins=np.linspace(0, 1, 11))[0])
@@ -0,0 +1,45 @@
+from poisson_approval import PhaseTimer, RandProfileHistogramUniform, ProfileTwelve, StrategyTwelve, \
+    initialize_random_seeds, one_over_log_t_plus_one, ANTI_PLURALITY
+
+
+def test_fictitious_play():
+    initialize_random_seeds(42)
+    profile = RandProfileHistogramUniform(n_bins=1)()
+    kwargs = dict(init='sincere', n_max_episodes=50, perception_update_ratio=one_over_log_t_plus_one)
+    expected = profile.fictitious_play(**kwargs)
+    sunk = []
+    timer = PhaseTimer(sink=sunk.append)
+    results = profile.fictitious_play(phase_timer=timer, **kwargs)
+    assert results['phase_timer'] is timer
+    assert 'phase_timer' not in expected
+    assert sunk == [timer]
+    assert results['converges'] == expected['converges']
+    assert results['n_episodes'] == expected['n_episodes']
+    n_episodes = results['n_episodes']
+    assert timer.d_phase_n_calls['tau_vectors'] == 2 * n_episodes
+    assert timer.d_phase_n_calls['best_responses'] == n_episodes
+    assert timer.d_phase_n_calls['statistics'] == n_episodes
+    assert timer.d_phase_n_calls['convergence'] == n_episodes
+    assert timer.d_phase_n_calls['events'] > 0
+    assert timer.n_optimizer_iterations >= timer.n_optimizations > 0
+    assert all(time >= 0 for time in timer.d_phase_time.values())
+
+
+def test_cumulative():
+    initialize_random_seeds(42)
+    profile = RandProfileHistogramUniform(n_bins=1)()
+    timer = PhaseTimer()
+    results_1 = profile.fictitious_play(init='sincere', n_max_episodes=10, phase_timer=timer)
+    results_2 = profile.fictitious_play(init='fanatic', n_max_episodes=10, phase_timer=timer)
+    assert timer.d_phase_n_calls['best_responses'] == results_1['n_episodes'] + results_2['n_episodes']
+
+
+def test_iterated_voting():
+    profile = ProfileTwelve(d_type_share={'a_bc': 1, 'ab_c': 1}, voting_rule=ANTI_PLURALITY)
+    strategy = StrategyTwelve(d_ranking_ballot={'abc': 'ab'})
+    expected = profile.iterated_voting(init=strategy, n_max_episodes=10)
+    results = profile.iterated_voting(init=strategy, n_max_episodes=10, phase_timer=True)
+    timer = results['phase_timer']
+    assert results['n_episodes'] == expected['n_episodes']
+    assert results['cycle_taus_actual'] == expected['cycle_taus_actual']
+    assert timer.d_phase_n_calls['convergence'] == results['n_episodes']
@@ -1,5 +1,7 @@
 from fractions import Fraction
-from poisson_approval import ProfileDiscrete, StrategyOrdinal, PLURALITY, ANTI_PLURALITY, StrategyThreshold
+import numpy as np
+from poisson_approval import ProfileDiscrete, StrategyOrdinal, PLURALITY, ANTI_PLURALITY, StrategyThreshold, \
+    RANKINGS, initialize_random_seeds
 
 
 def test_normalization():
@@ -244,3 +246,23 @@ def test_share_sincere():
         Fraction(1, 5)
     """
     pass
+
+
+def test_have_rankings_with_utility_u_same_as_scalar():
+    initialize_random_seeds(42)
+    utilities = np.round(np.random.rand(50), 2)
+    profile = ProfileDiscrete({
+        'abc': {utility: share for utility, share in zip(utilities[:30], np.random.rand(30))},
+        'bca': {utility: share for utility, share in zip(utilities[30:], np.random.rand(20))},
+        'cab': {0.5: 1}
+    }, normalization_warning=False)
+    u = np.concatenate((np.round(np.random.rand(20, 6), 2), np.full((1, 6), utilities[0]), np.full((1, 6), 0.5)))
+    below = profile.have_rankings_with_utility_below_u(u)
+    equal = profile.have_rankings_with_utility_u(u)
+    above = profile.have_rankings_with_utility_above_u(u)
+    for n, r in np.ndindex(u.shape):
+        ranking = RANKINGS[r]
+        assert np.isclose(below[n, r], profile.have_ranking_with_utility_below_u(ranking, u[n, r]))
+        assert np.isclose(equal[n, r], profile.have_ranking_with_utility_u(ranking, u[n, r]))
+        assert np.isclose(above[n, r], profile.have_ranking_with_utility_above_u(ranking, u[n, r]))
+        assert np.isclose(below[n, r] + equal[n, r] + above[n, r], profile.d_ranking_share[ranking])
@@ -1,7 +1,7 @@
 from fractions import Fraction
 import numpy as np
 from poisson_approval import ProfileHistogram, StrategyThreshold, StrategyOrdinal, EquilibriumStatus, PLURALITY, \
-    ANTI_PLURALITY, initialize_random_seeds
+    ANTI_PLURALITY, RANKINGS, initialize_random_seeds
 
 
 def test_normalization():
@@ -78,3 +78,18 @@ def test_welfare():
         {'a': Fraction(1, 1), 'b': Fraction(1, 3), 'c': 0}
     """
     pass
+
+
+def test_have_rankings_with_utility_below_u_same_as_scalar():
+    initialize_random_seeds(42)
+    profile = ProfileHistogram(d_ranking_share={'abc': 0.2, 'acb': 0.1, 'bac': 0.3, 'cab': 0.4},
+                               d_ranking_histogram={'abc': np.random.rand(7), 'acb': [1],
+                                                    'bac': [0.5, 0, 0, 0.5], 'cab': np.random.rand(10)},
+                               normalization_warning=False)
+    u = np.concatenate((np.random.rand(20, 6), np.zeros((1, 6)), np.ones((1, 6)), np.full((1, 6), 0.25)))
+    below = profile.have_rankings_with_utility_below_u(u)
+    above = profile.have_rankings_with_utility_above_u(u)
+    for n, r in np.ndindex(u.shape):
+        ranking = RANKINGS[r]
+        assert np.isclose(below[n, r], profile.have_ranking_with_utility_below_u(ranking, u[n, r]))
+        assert np.isclose(above[n, r], profile.have_ranking_with_utility_above_u(ranking, u[n, r]))
@@ -1,6 +1,7 @@
 import pytest
 from fractions import Fraction
-from poisson_approval import ProfileNoisyDiscrete, StrategyOrdinal, PLURALITY, ANTI_PLURALITY
+import numpy as np
+from poisson_approval import ProfileNoisyDiscrete, StrategyOrdinal, PLURALITY, ANTI_PLURALITY, RANKINGS
 
 
 def test_normalization():
@@ -66,3 +67,16 @@ def test_welfare():
         {'a': Fraction(1, 1), 'b': Fraction(1, 3), 'c': 0}
     """
     pass
+
+
+def test_have_rankings_with_utility_vectorized():
+    profile = ProfileNoisyDiscrete({('abc', 0.3, 0.1): 0.2, ('abc', 0.35, 0.2): 0.3, ('abc', 0.98, 0.05): 0.1,
+                                    ('bac', 0.5, 0.5): 0.25, ('cab', 0.01, 0.01): 0.15})
+    u = np.linspace(-0.5, 1.5, 41)[:, np.newaxis] * np.ones(6)
+    above = profile.have_rankings_with_utility_above_u(u)
+    below = profile.have_rankings_with_utility_below_u(u)
+    for i in range(u.shape[0]):
+        for r, ranking in enumerate(RANKINGS):
+            assert np.isclose(above[i, r], profile.have_ranking_with_utility_above_u(ranking, u[i, r]))
+            assert np.isclose(below[i, r], profile.have_ranking_with_utility_below_u(ranking, u[i, r]))
+    assert np.allclose(profile.have_rankings_with_utility_u(u), 0)
@@ -334,3 +334,13 @@ def test_best_responses_to_strategy():
         StrategyThreshold({}, d_weak_order_ballot={'a>b~c': 'ab', 'b>a~c': 'Split', 'c>a~b': 'bc'}, voting_rule='Anti-plurality')
     """
     pass
+
+
+def test_iterated_voting_detects_cycle_in_long_run():
+    my_profile = ProfileTwelve(d_type_share={'a_bc': 1, 'ab_c': 1}, voting_rule=ANTI_PLURALITY)
+    my_strategy = StrategyTwelve(d_ranking_ballot={'abc': 'ab'})
+    result = my_profile.iterated_voting(init=my_strategy, n_max_episodes=100000, ballot_update_ratio=1)
+    assert result['n_episodes'] < 10
+    assert len(result['cycle_taus_actual']) == 2
+    assert len(result['cycle_strategies']) == 2
+    assert result['cycle_strategies'][0].tau == result['cycle_taus_actual'][0]
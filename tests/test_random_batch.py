@@ -0,0 +1,34 @@
+from numbers import Rational
+from poisson_approval import RandTauVectorUniform, RandProfileOrdinalUniform, RandProfileOrdinalGridUniform, \
+    RandProfileHistogramUniform, RandProfileHistogramGridUniform, initialize_random_seeds
+
+
+def test_sample_same_as_successive_calls():
+    for factory in [RandTauVectorUniform(), RandProfileOrdinalUniform(d_order_fixed_share={'abc': 0.5})]:
+        initialize_random_seeds()
+        batch = factory.sample(5)
+        initialize_random_seeds()
+        objects = [factory() for _ in range(5)]
+        assert [repr(o) for o in batch] == [repr(o) for o in objects]
+
+
+def test_sample_grid():
+    initialize_random_seeds()
+    batch = RandProfileOrdinalGridUniform(denominator=7).sample(20)
+    assert batch.arrays[0].shape == (20, 6)
+    for profile in batch[10:]:
+        assert sum(profile.d_ranking_share.values()) == 1
+        # The shares are exact (at a vertex of the simplex, they are `numpy` integers, as with `__call__`)
+        assert all(isinstance(share, Rational) for share in profile.d_ranking_share.values())
+
+
+def test_sample_histogram():
+    for factory in [RandProfileHistogramUniform(n_bins=3),
+                    RandProfileHistogramGridUniform(denominator=17, denominator_bins=7, n_bins=3)]:
+        batch = factory.sample(10)
+        assert len(batch) == 10
+        for profile in batch:
+            for ranking in profile.support_in_rankings:
+                histogram = profile.d_ranking_histogram[ranking]
+                assert len(histogram) == 3
+                assert abs(sum(histogram) - 1) < 1E-9
@@ -0,0 +1,52 @@
+import numpy as np
+from fractions import Fraction
+from poisson_approval import ProfileDiscrete, ProfileHistogram, ProfileNoisyDiscrete, StrategyThreshold, \
+    initialize_random_seeds, APPROVAL, PLURALITY, ANTI_PLURALITY, RANKINGS, \
+    BALLOTS_WITHOUT_INVERSIONS, SPLIT, WEAK_ORDERS_HATE_WITHOUT_INVERSIONS, WEAK_ORDERS_LOVE_WITHOUT_INVERSIONS
+
+
+def _profiles(voting_rule):
+    return [
+        ProfileDiscrete({('abc', 0.4): Fraction(1, 10), ('abc', 0.7): Fraction(1, 10), ('bac', 0.2): Fraction(2, 10),
+                         ('cab', 0.5): Fraction(2, 10), 'a~b>c': Fraction(2, 10), 'c>a~b': Fraction(2, 10)},
+                        ratio_sincere=Fraction(1, 10), ratio_fanatic=Fraction(2, 10), voting_rule=voting_rule),
+        ProfileHistogram({'abc': Fraction(1, 10), 'bac': Fraction(6, 10), 'cab': Fraction(3, 10)},
+                         {'abc': [1], 'bac': [1, 0], 'cab': [Fraction(2, 3), 0, 0, 0, 0, 0, 0, 0, 0, Fraction(1, 3)]},
+                         ratio_sincere=Fraction(1, 10), voting_rule=voting_rule),
+        ProfileNoisyDiscrete({('abc', 0.4, 0.1): Fraction(1, 10), ('bca', 0.2, 0.05): Fraction(5, 10),
+                              ('cab', 0.7, 0.3): Fraction(4, 10)}, ratio_fanatic=Fraction(1, 10),
+                             voting_rule=voting_rule),
+    ]
+
+
+def test_tau_array_matches_tau():
+    initialize_random_seeds(42)
+    for voting_rule in [APPROVAL, PLURALITY, ANTI_PLURALITY]:
+        for profile in _profiles(voting_rule):
+            relevant_weak_orders = {APPROVAL: [], PLURALITY: WEAK_ORDERS_HATE_WITHOUT_INVERSIONS,
+                                    ANTI_PLURALITY: WEAK_ORDERS_LOVE_WITHOUT_INVERSIONS}[voting_rule]
+            d_weak_order_ballot = {weak_order: SPLIT for weak_order in profile.support_in_weak_orders
+                                   if weak_order in relevant_weak_orders}
+            thresholds = np.random.rand(10, 6)
+            thresholds[0, :] = 0.5
+            thresholds[1, :] = 0.4
+            strategies = [StrategyThreshold({ranking: threshold for ranking, threshold in zip(RANKINGS, row)
+                                             if ranking in profile.support_in_rankings},
+                                            d_weak_order_ballot=d_weak_order_ballot, ratio_optimistic=Fraction(1, 3),
+                                            profile=profile)
+                          for row in thresholds]
+            taus_array = profile.tau_array(thresholds, ratio_optimistic=1 / 3)
+            for strategy, tau_array in zip(strategies, taus_array):
+                tau = profile.tau(strategy)
+                assert np.allclose(tau_array, [float(tau.d_ballot_share[ballot])
+                                               for ballot in BALLOTS_WITHOUT_INVERSIONS])
+
+
+def test_tau_strategic_array_weak_orders():
+    profile = ProfileDiscrete({('abc', 0.4): Fraction(1, 2), 'a~b>c': Fraction(1, 4), 'c>a~b': Fraction(1, 4)},
+                              voting_rule=PLURALITY)
+    for ballot in ['a', 'b', SPLIT]:
+        strategy = StrategyThreshold({'abc': 1}, d_weak_order_ballot={'a~b>c': ballot}, profile=profile)
+        tau_array = profile.tau_strategic_array([1, 0, 0, 0, 0, 0], d_weak_order_ballot={'a~b>c': ballot})
+        tau = profile.tau_strategic(strategy)
+        assert np.allclose(tau_array, [float(tau.d_ballot_share[ballot]) for ballot in BALLOTS_WITHOUT_INVERSIONS])
@@ -0,0 +1,47 @@
+import numpy as np
+from poisson_approval import TauVector, TauVectorBatch, RandTauVectorUniform, BALLOTS_WITHOUT_INVERSIONS, \
+    CANDIDATES, RANKINGS, initialize_random_seeds
+
+
+def test_consistency_with_tau_vector():
+    initialize_random_seeds(42)
+    rand_tau = RandTauVectorUniform()
+    taus = [rand_tau() for _ in range(50)] + [
+        TauVector({'a': 0.1, 'ab': 0.6, 'c': 0.3}),
+        TauVector({'a': 1/3, 'ac': 1/3, 'b': 1/6, 'bc': 1/6}),
+        TauVector({'ab': 1}),
+    ]
+    batch = TauVectorBatch.from_tau_vectors(taus)
+    for i, tau in enumerate(taus):
+        assert np.allclose(batch.scores[i, :], [tau.scores[c] for c in CANDIDATES])
+        assert list(batch.winners[i, :]) == [c in tau.winners for c in CANDIDATES]
+        assert batch.has_two_consecutive_zeros[i] == tau.has_two_consecutive_zeros
+        for x, y, z in RANKINGS:
+            assert np.isclose(getattr(batch, 'score_%s%s_in_duo_%s%s' % (x, y, x, y))[i],
+                              getattr(tau, 'score_%s%s_in_duo_%s%s' % (x, y, x, y)))
+            assert np.isclose(getattr(batch, 'score_%s_in_duo_%s%s' % (z, x, y))[i],
+                              getattr(tau, 'score_%s_in_duo_%s%s' % (z, x, y)))
+            assert (getattr(batch, 'pivot_%s%s_easy_or_tight' % (x, y))[i]
+                    == getattr(tau, 'pivot_%s%s_easy_or_tight' % (x, y)))
+
+
+def test_getitem():
+    """
+        >>> taus = TauVectorBatch([[2, 1, 0, 0, 2, 1]], normalization_warning=False)
+        >>> taus[0]
+        TauVector({'a': 0.3333333333333333, 'ac': 0.3333333333333333, 'b': 0.16666666666666666, \
+'bc': 0.16666666666666666})
+        >>> taus.pivot_ab_tight
+        array([ True])
+        >>> taus.pivot_ab_easy
+        array([False])
+        >>> taus.pivot_ab_easy_or_tight
+        array([ True])
+    """
+    pass
+
+
+def test_shape():
+    batch = TauVectorBatch(np.ones(len(BALLOTS_WITHOUT_INVERSIONS)))
+    assert batch.shares.shape == (1, 6)
+    assert np.allclose(batch.shares, 1 / 6)
@@ -0,0 +1,79 @@
+from math import isclose
+from poisson_approval import TauVector, TauVectorCache, RandProfileHistogramUniform, RandTauVectorUniform, \
+    initialize_random_seeds, one_over_log_t_plus_one, PLURALITY, RANKINGS
+
+
+def test_eviction():
+    with TauVectorCache(max_size=2) as cache:
+        TauVector({'a': 1})
+        TauVector({'b': 1})
+        TauVector({'a': 1})
+        TauVector({'c': 1})
+        TauVector({'b': 1})
+    assert len(cache) == 2
+    assert cache.n_hits == 1
+    assert cache.n_misses == 4
+    assert cache.n_evictions == 2
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_key_depends_on_voting_rule_and_type():
+    cache = TauVectorCache()
+    assert cache.key(TauVector({'a': 1})) != cache.key(TauVector({'a': 1}, voting_rule=PLURALITY))
+    assert cache.key(TauVector({'a': 0.5, 'b': 0.5})) != cache.key(TauVector({'a': 1, 'b': 1}))
+
+
+def test_nested_caches():
+    with TauVectorCache() as cache_1:
+        with TauVectorCache() as cache_2:
+            assert TauVectorCache.active is cache_2
+        assert TauVectorCache.active is cache_1
+    assert TauVectorCache.active is None
+
+
+def test_fictitious_play_with_cache():
+    initialize_random_seeds(42)
+    profile = RandProfileHistogramUniform(n_bins=1)()
+    results = profile.fictitious_play(init='sincere', n_max_episodes=100,
+                                      perception_update_ratio=one_over_log_t_plus_one)
+    with TauVectorCache() as cache:
+        results_with_cache = profile.fictitious_play(init='sincere', n_max_episodes=100,
+                                                     perception_update_ratio=one_over_log_t_plus_one)
+    assert results_with_cache['converges'] == results['converges']
+    assert results_with_cache['n_episodes'] == results['n_episodes']
+    assert results_with_cache['d_candidate_winning_frequency'] == results['d_candidate_winning_frequency']
+    assert cache.n_hits > 0
+
+
+def test_symmetry_gives_same_best_responses():
+    initialize_random_seeds(42)
+    rand_tau = RandTauVectorUniform()
+    for _ in range(30):
+        tau = rand_tau()
+        d_ranking_best_response = TauVector(tau.d_ballot_share).d_ranking_best_response
+        with TauVectorCache(symmetry=True):
+            d_ranking_best_response_by_symmetry = TauVector(tau.d_ballot_share).d_ranking_best_response
+        for ranking in RANKINGS:
+            best_response = d_ranking_best_response[ranking]
+            best_response_by_symmetry = d_ranking_best_response_by_symmetry[ranking]
+            assert best_response_by_symmetry.ranking == ranking
+            assert best_response_by_symmetry.ballot == best_response.ballot
+            assert best_response_by_symmetry.justification == best_response.justification
+            # The offset method is sensitive to the precision of the optimizer used for the trios, which depends on
+            # the order of the candidates.
+            assert isclose(best_response_by_symmetry.utility_threshold, best_response.utility_threshold,
+                           abs_tol=1e-4)
+
+
+def test_symmetry_computes_events_once():
+    with TauVectorCache(symmetry=True) as cache:
+        for x, y, z in RANKINGS:
+            tau = TauVector({x: 0.1, y: 0.2, z: 0.3, x + y: 0.15, x + z: 0.1, y + z: 0.15})
+            for best_response in tau.d_ranking_best_response.values():
+                _ = best_response.utility_threshold
+    assert len(cache) == 6
+    n_entries_with_events = sum(
+        any(name.startswith(('duo_', 'pivot_', 'trio')) for name in cached_properties)
+        for cached_properties in cache._d_key_cached_properties.values())
+    assert n_entries_with_events == 1
@@ -0,0 +1,46 @@
+import numpy as np
+from poisson_approval import TrajectoryRecorder, RandProfileHistogramUniform, ProfileTwelve, StrategyTwelve, \
+    initialize_random_seeds, one_over_log_t_plus_one, BALLOTS_WITHOUT_INVERSIONS, ANTI_PLURALITY
+
+
+def test_fictitious_play_in_memory():
+    initialize_random_seeds(42)
+    profile = RandProfileHistogramUniform(n_bins=1)()
+    results = profile.fictitious_play(init='sincere', n_max_episodes=50, recorder=True,
+                                      perception_update_ratio=one_over_log_t_plus_one)
+    recorder = results['recorder']
+    assert recorder.n_episodes == results['n_episodes']
+    assert recorder.taus_actual.shape == (results['n_episodes'], 6)
+    assert np.allclose(np.sum(recorder.taus_perceived, axis=1), 1)
+    assert np.allclose(np.sum(recorder.winning_probabilities, axis=1), 1)
+    if results['converges']:
+        assert np.allclose(recorder.taus_actual[-1, :],
+                           [results['tau'].d_ballot_share[ballot] for ballot in BALLOTS_WITHOUT_INVERSIONS])
+
+
+def test_fictitious_play_memory_mapped(tmp_path):
+    initialize_random_seeds(42)
+    profile = RandProfileHistogramUniform(n_bins=1)()
+    file_name = str(tmp_path / 'trajectory.npy')
+    recorder = TrajectoryRecorder(file_name=file_name)
+    results = profile.fictitious_play(init='sincere', n_max_episodes=1000, recorder=recorder,
+                                      perception_update_ratio=one_over_log_t_plus_one)
+    assert results['converges']
+    # The file alone gives the recorded episodes, without the padding up to `n_max_episodes`
+    data = np.load(file_name, mmap_mode='r')
+    assert data.shape == (results['n_episodes'], )
+    assert np.allclose(np.sum(data['tau_perceived'], axis=1), 1)
+    assert np.allclose(data['tau_actual'][-1, :],
+                       [results['tau'].d_ballot_share[ballot] for ballot in BALLOTS_WITHOUT_INVERSIONS])
+    assert np.array_equal(data['utility_thresholds'], recorder.utility_thresholds)
+
+
+def test_iterated_voting():
+    profile = ProfileTwelve(d_type_share={'a_bc': 1, 'ab_c': 1}, voting_rule=ANTI_PLURALITY)
+    strategy = StrategyTwelve(d_ranking_ballot={'abc': 'ab'})
+    results = profile.iterated_voting(init=strategy, n_max_episodes=10, recorder=True)
+    recorder = results['recorder']
+    assert recorder.n_episodes == results['n_episodes']
+    assert np.all(np.isnan(recorder.utility_thresholds[:, 1:]))
+    assert np.all(np.isin(recorder.utility_thresholds[:, 0], [0, 1]))
+    assert np.array_equal(recorder.taus_actual[-1, :], recorder.taus_actual[-3, :])
@@ -0,0 +1,53 @@
+import random
+import numpy as np
+from poisson_approval import probability, image_distribution, initialize_random_seeds, rand_integers_fixed_sum
+
+
+def test_probability_half_width_tuple_of_tests():
+    initialize_random_seeds()
+    results = probability(factory=random.random, n_samples=100000, test=(lambda x: x > .5, lambda x: x > .99),
+                          half_width=0.03, batch_size=100)
+    assert results['n_samples'] < 100000
+    assert isinstance(results['probability'], tuple)
+    assert all(half_width <= 0.03 for half_width in results['half_width'])
+
+
+def test_probability_half_width_budget():
+    initialize_random_seeds()
+    results = probability(factory=random.random, n_samples=500, test=lambda x: x > .5, half_width=0.001)
+    assert results['n_samples'] == 500
+    assert results['half_width'] > 0.001
+
+
+def test_image_distribution_half_width_with_condition():
+    initialize_random_seeds()
+    results = image_distribution(factory=random.random, n_samples=100000, f=lambda x: x > .75,
+                                 conditional_on=lambda x: x > .5, half_width=0.05, batch_size=100)
+    assert results['half_width'] <= 0.05
+    assert sum(results['distribution'].values()) == 1
+
+
+def test_rand_integers_fixed_sum_batch_is_uniform():
+    initialize_random_seeds()
+    draws = rand_integers_fixed_sum(d=3, fixed_sum=2, n=6000)
+    assert draws.shape == (6000, 3)
+    assert np.all(draws.sum(axis=1) == 2)
+    assert np.all(draws >= 0)
+    _, counts = np.unique(draws, axis=0, return_counts=True)
+    # The 6 possible outcomes are equally likely
+    assert len(counts) == 6
+    assert np.all(np.abs(counts - 1000) < 150)
+
+
+def test_rand_integers_fixed_sum_batch_small_sum():
+    initialize_random_seeds()
+    draws = rand_integers_fixed_sum(d=20, fixed_sum=1, n=100)
+    assert draws.shape == (100, 20)
+    assert np.all(draws.sum(axis=1) == 1)
+    assert np.all(draws >= 0)
+    draws = rand_integers_fixed_sum(d=4, fixed_sum=3, n=20000)
+    assert np.all(draws.sum(axis=1) == 3)
+    _, counts = np.unique(draws, axis=0, return_counts=True)
+    # The 20 possible outcomes are equally likely
+    assert len(counts) == 20
+    assert np.all(np.abs(counts - 1000) < 150)